@@ -0,0 +1,189 @@
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+from athina_client.api_base_url import AthinaApiBaseUrl
+from athina_client.constants import load_env
+from athina_client.errors import CustomException
+from athina_client.keys import AthinaApiKey
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the `athina-client` command.
+    """
+    load_env()
+    from athina_client.instrumentation import enable_from_env
+
+    enable_from_env()
+    parser = argparse.ArgumentParser(prog="athina-client")
+    parser.add_argument(
+        "--api-key",
+        default=os.getenv("ATHINA_API_KEY"),
+        help="Athina API key. Defaults to the ATHINA_API_KEY environment variable.",
+    )
+    parser.add_argument("--base-url", help="Athina API base URL.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    datasets = commands.add_parser("datasets", help="Manage datasets.")
+    datasets_commands = datasets.add_subparsers(dest="datasets_command", required=True)
+
+    upload = datasets_commands.add_parser(
+        "upload", help="Upload rows from a JSONL or CSV file."
+    )
+    upload.add_argument("path", help="Path of the JSONL or CSV file.")
+    upload.add_argument("--format", choices=["jsonl", "csv"], dest="file_format")
+    target = upload.add_mutually_exclusive_group(required=True)
+    target.add_argument("--name", help="Name of the dataset to create.")
+    target.add_argument("--dataset-id", help="ID of an existing dataset to append to.")
+    upload.add_argument("--description", help="Description of the dataset to create.")
+    upload.add_argument("--project-name", help="Project of the dataset to create.")
+    upload.add_argument("--batch-size", type=_positive_int, default=100)
+    upload.add_argument("--workers", type=_positive_int, default=4)
+    upload.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Size batches by bytes and tune batch size and concurrency while uploading; "
+        "--workers is the maximum concurrency.",
+    )
+    upload.add_argument(
+        "--validate",
+        action="store_true",
+        help="Check every row before uploading anything.",
+    )
+    upload.set_defaults(handler=_upload)
+
+    validate = datasets_commands.add_parser(
+        "validate", help="Check the rows of a JSONL or CSV file without uploading."
+    )
+    validate.add_argument("path", help="Path of the JSONL or CSV file.")
+    validate.add_argument("--format", choices=["jsonl", "csv"], dest="file_format")
+    validate.add_argument(
+        "--sample-size",
+        type=int,
+        default=100,
+        help="Number of rows the schema is inferred from.",
+    )
+    validate.set_defaults(handler=_validate)
+
+    export = datasets_commands.add_parser(
+        "export", help="Export a dataset to a JSONL or Parquet file."
+    )
+    export.add_argument("dataset_id", help="ID of the dataset to export.")
+    export.add_argument("path", help="Path of the output file.")
+    export.add_argument("--format", choices=["jsonl", "parquet"], dest="file_format")
+    export.add_argument(
+        "--response-format", choices=["flat", "detailed"], default="flat"
+    )
+    export.add_argument("--page-size", type=_positive_int, default=1000)
+    export.add_argument(
+        "--offset", type=int, default=0, help="Page number to start from."
+    )
+    export.add_argument(
+        "--resume", action="store_true", help="Continue an interrupted JSONL export."
+    )
+    export.set_defaults(handler=_export)
+
+    args = parser.parse_args(argv)
+    if args.api_key:
+        AthinaApiKey.set_key(args.api_key)
+    if args.base_url:
+        AthinaApiBaseUrl.set_url(args.base_url)
+    try:
+        return args.handler(args)
+    except (CustomException, ImportError, OSError, ValueError) as e:
+        sys.stderr.write(f"\nError: {e}\n")
+        return 1
+
+
+def _upload(args: argparse.Namespace) -> int:
+    from athina_client.datasets.ingest import read_rows, upload_rows
+
+    if args.validate:
+        from athina_client.datasets.validation import validate_rows
+
+        report = validate_rows(read_rows(args.path, args.file_format))
+        if not report.ok:
+            sys.stderr.write(f"{report}\n")
+            return 1
+
+    batcher = None
+    if args.adaptive:
+        from athina_client.datasets.batching import AdaptiveBatcher
+
+        batcher = AdaptiveBatcher(max_workers=args.workers)
+
+    progress = _Progress("Uploaded")
+    dataset_id = upload_rows(
+        read_rows(args.path, args.file_format),
+        name=args.name,
+        dataset_id=args.dataset_id,
+        description=args.description,
+        project_name=args.project_name,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+        on_progress=progress.update,
+        batcher=batcher,
+    )
+    progress.finish()
+    print(dataset_id)
+    return 0
+
+
+def _validate(args: argparse.Namespace) -> int:
+    from athina_client.datasets.ingest import read_rows
+    from athina_client.datasets.validation import validate_rows
+
+    report = validate_rows(
+        read_rows(args.path, args.file_format), sample_size=args.sample_size
+    )
+    print(report)
+    return 0 if report.ok else 1
+
+
+def _export(args: argparse.Namespace) -> int:
+    from athina_client.datasets.export import export_rows
+
+    progress = _Progress("Exported")
+    export_rows(
+        args.dataset_id,
+        args.path,
+        file_format=args.file_format,
+        response_format=args.response_format,
+        page_size=args.page_size,
+        start_offset=args.offset,
+        resume=args.resume,
+        on_progress=progress.update,
+    )
+    progress.finish()
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+class _Progress:
+    def __init__(self, verb: str):
+        self.verb = verb
+        self.rows = 0
+        self.started_at = time.monotonic()
+
+    def update(self, rows: int):
+        self.rows = rows
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        sys.stderr.write(f"\r{self.verb} {rows} rows ({rows / elapsed:,.0f} rows/s)")
+        sys.stderr.flush()
+
+    def finish(self):
+        self.update(self.rows)
+        sys.stderr.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
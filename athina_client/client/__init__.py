@@ -0,0 +1,3 @@
+from .athina_client import AthinaClient
+
+__all__ = ["AthinaClient"]
@@ -0,0 +1,117 @@
+import functools
+import threading
+from typing import Any, Optional
+
+from athina_client import constants
+from athina_client.errors import NoAthinaApiKeyException
+from athina_client.services.client_scope import client_scope
+from athina_client.transport import Transport
+
+
+class AthinaClient:
+    """
+    Athina API client with its own configuration and connection pool.
+
+    Unlike `AthinaApiKey.set_key` / `AthinaApiBaseUrl.set_url`, which configure
+    the whole process, every client carries its own API key, base URL and
+    transport. Clients for different workspaces can therefore be used
+    concurrently from many threads without swapping global state.
+
+    Example:
+        ```python
+        client = AthinaClient(api_key="...")
+        dataset = client.datasets.get_dataset_by_id("dataset-123")
+        execution = client.prompts.run("my-prompt", {"query": "..."})
+
+        # Any other SDK helper can run under the client with `scope()`
+        with client.scope():
+            upload_rows(read_rows("rows.jsonl"), dataset_id=dataset["dataset"]["id"])
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        max_connections: int = 10,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            api_key (str): The Athina API key of the workspace.
+            base_url (Optional[str]): The Athina API base URL. Defaults to ATHINA_API_BASE_URL.
+            transport (Optional[Transport]): Transport to send requests with. Defaults to a new
+                transport of the ATHINA_TRANSPORT backend with its own connection pool.
+            max_connections (int): Size of the connection pool of the default transport. Defaults to 10.
+            max_concurrency (Optional[int]): Maximum number of requests in flight for this client.
+                Defaults to None (unlimited).
+            timeout (Optional[float]): Request timeout in seconds for the default transport.
+        """
+        if not api_key:
+            raise NoAthinaApiKeyException("An Athina API key is required.")
+        self.base_url = base_url or constants.ATHINA_API_BASE_URL
+        if transport is None:
+            from athina_client.transport import AthinaTransport
+
+            transport = AthinaTransport.create(
+                max_connections=max_connections, timeout=timeout
+            )
+        self.transport = transport
+        self.headers = {"athina-api-key": api_key}
+        self.limiter = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+
+        from athina_client.datasets import Dataset
+        from athina_client.prompt import Prompt, Slug
+
+        self.datasets = _ClientNamespace(self, Dataset)
+        self.prompts = _ClientNamespace(self, Prompt)
+        self.slugs = _ClientNamespace(self, Slug)
+
+    def scope(self):
+        """
+        Context manager routing every SDK call made inside it through this client.
+        """
+        return client_scope(self)
+
+    def close(self):
+        """
+        Closes the connection pool of the client's transport.
+        """
+        self.transport.close()
+
+    def __enter__(self) -> "AthinaClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _ClientNamespace:
+    """
+    Exposes the static methods of an SDK class, bound to a client.
+    """
+
+    def __init__(self, client: AthinaClient, target: Any):
+        self._client = client
+        self._target = target
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._target, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        @functools.wraps(attribute)
+        def bound(*args, **kwargs):
+            with client_scope(self._client):
+                return attribute(*args, **kwargs)
+
+        # Cache the bound function so later lookups skip __getattr__.
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        return [name for name in dir(self._target) if not name.startswith("_")]
@@ -1,4 +1,19 @@
-from .athina import ATHINA_API_BASE_URL, MAX_DATASET_ROWS
+from . import athina
+from .athina import MAX_DATASET_ROWS, load_env
 from .messages import AthinaMessages
 
-__all__ = ["ATHINA_API_BASE_URL", "AthinaMessages", "MAX_DATASET_ROWS"]
\ No newline at end of file
+__all__ = [
+    "ATHINA_API_BASE_URL",
+    "ATHINA_CACHE_DIR",
+    "ATHINA_CASSETTE",
+    "ATHINA_CASSETTE_MODE",
+    "AthinaMessages",
+    "ATHINA_TRANSPORT",
+    "MAX_DATASET_ROWS",
+    "load_env",
+]
+
+
+def __getattr__(name):
+    # Environment-derived settings are resolved lazily by the `athina` module.
+    return getattr(athina, name)
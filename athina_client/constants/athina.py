@@ -1,7 +1,40 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-ATHINA_API_BASE_URL = os.getenv("ATHINA_API_BASE_URL", "https://log.athina.ai")
 MAX_DATASET_ROWS = 50000
+
+# Settings read from the environment (and a `.env` file) on first access rather
+# than at import time, so importing the SDK does not search the filesystem.
+_ENV_DEFAULTS = {
+    "ATHINA_API_BASE_URL": lambda: "https://log.athina.ai",
+    "ATHINA_CACHE_DIR": lambda: os.path.join(
+        os.path.expanduser("~"), ".cache", "athina"
+    ),
+    "ATHINA_CASSETTE": lambda: None,
+    "ATHINA_CASSETTE_MODE": lambda: "auto",
+    "ATHINA_TRANSPORT": lambda: "requests",
+}
+
+_env_loaded = False
+
+
+def load_env():
+    """
+    Loads the `.env` file into the environment, once.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+def __getattr__(name):
+    if name not in _ENV_DEFAULTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    load_env()
+    value = os.getenv(name)
+    if value is None:
+        value = _ENV_DEFAULTS[name]()
+    globals()[name] = value
+    return value
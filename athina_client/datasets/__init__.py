@@ -1,3 +1,41 @@
 from .dataset import Dataset
 
-__all__ = ["Dataset"]
+__all__ = [
+    "AdaptiveBatcher",
+    "BatchLedger",
+    "Dataset",
+    "DatasetCache",
+    "DatasetSchema",
+    "DatasetSnapshot",
+    "ParallelCleaner",
+    "RowDeduplicator",
+    "export_rows",
+    "iter_pages",
+    "read_rows",
+    "upload_rows",
+    "validate_rows",
+]
+
+# Helpers beyond `Dataset` are loaded on first use to keep `import` cheap.
+_LAZY_ATTRIBUTES = {
+    "AdaptiveBatcher": ".batching",
+    "BatchLedger": ".ledger",
+    "DatasetCache": ".cache",
+    "DatasetSchema": ".validation",
+    "DatasetSnapshot": ".snapshot",
+    "ParallelCleaner": ".parallel",
+    "RowDeduplicator": ".dedup",
+    "export_rows": ".export",
+    "iter_pages": ".export",
+    "read_rows": ".ingest",
+    "upload_rows": ".ingest",
+    "validate_rows": ".validation",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
@@ -0,0 +1,183 @@
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from athina_client.errors import PayloadTooLargeException
+from .dataset import Dataset
+
+
+class AdaptiveBatcher:
+    """
+    Sizes row batches by their serialized size and tunes the batch size and the
+    number of batches in flight from the observed latency and errors (AIMD).
+
+    Every batch answered within `target_latency` grows the batch size by
+    `increase_bytes` and the concurrency by one per round of batches. A batch
+    answered later than `target_latency` halves the batch size, and once the
+    batch size is at `min_bytes` also the concurrency, since the server rather
+    than the payload is then the bottleneck. A failed batch halves both. Short
+    rows therefore end up in large batches and long rows in small ones, and the
+    upload backs off while the server is struggling.
+
+    A batch the API rejects as too large is split in two and both halves are
+    sent, and later batches are kept below the rejected size. Other errors are
+    raised after the backoff, since the batch may have been committed.
+
+    Batch boundaries depend on the observed latencies, so an adaptive upload
+    cannot be resumed with a `BatchLedger`; use a fixed `batch_size` for that.
+
+    Example:
+        ```python
+        batcher = AdaptiveBatcher(max_workers=8)
+        upload_rows(read_rows("rows.jsonl"), dataset_id="dataset-123", batcher=batcher)
+        print(batcher.stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_bytes: int = 256_000,
+        min_bytes: int = 16_000,
+        max_bytes: int = 4_000_000,
+        increase_bytes: int = 64_000,
+        max_rows: int = 1000,
+        target_latency: float = 2.0,
+        initial_workers: int = 2,
+        max_workers: int = 8,
+    ):
+        """
+        Args:
+            initial_bytes (int): Serialized size of the first batches. Defaults to 256 kB.
+            min_bytes (int): Smallest batch size in bytes. Defaults to 16 kB.
+            max_bytes (int): Largest batch size in bytes. Defaults to 4 MB.
+            increase_bytes (int): Growth of the batch size after a fast batch. Defaults to 64 kB.
+            max_rows (int): Maximum number of rows per batch. Defaults to 1000.
+            target_latency (float): Slowest acceptable batch latency in seconds. Defaults to 2.
+            initial_workers (int): Number of batches in flight at the start. Defaults to 2.
+            max_workers (int): Maximum number of batches in flight. Defaults to 8.
+        """
+        self.min_bytes = min_bytes
+        self.max_bytes = max_bytes
+        self.increase_bytes = increase_bytes
+        self.max_rows = max_rows
+        self.target_latency = target_latency
+        self.max_workers = max_workers
+        self._batch_bytes = float(min(max(initial_bytes, min_bytes), max_bytes))
+        self._concurrency = float(min(max(initial_workers, 1), max_workers))
+        self._lock = threading.Lock()
+        self._stats = {"batches": 0, "rows": 0, "slow": 0, "errors": 0, "splits": 0}
+
+    @property
+    def batch_bytes(self) -> int:
+        """
+        Current target size of a batch in bytes.
+        """
+        return int(self._batch_bytes)
+
+    @property
+    def concurrency(self) -> int:
+        """
+        Current number of batches to keep in flight.
+        """
+        return int(self._concurrency)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of batches and rows sent, of slow, failed and split
+        batches, and the current batch size and concurrency.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "batch_bytes": self.batch_bytes,
+                "concurrency": self.concurrency,
+            }
+
+    def batches(self, rows: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Groups rows into batches of about `batch_bytes` serialized bytes.
+
+        Each batch is sized when it is started, so the batch size follows the
+        feedback of the batches sent in the meantime.
+        """
+        batch: List[Dict[str, Any]] = []
+        size = 0
+        limit = self.batch_bytes
+        for row in rows:
+            # The size of the row in the request body, including the separator.
+            row_bytes = len(json.dumps(row, default=str)) + 2
+            if batch and (size + row_bytes > limit or len(batch) >= self.max_rows):
+                Dataset._check_forbidden_keys(batch)
+                yield batch
+                batch = []
+                size = 0
+                limit = self.batch_bytes
+            batch.append(row)
+            size += row_bytes
+        if batch:
+            Dataset._check_forbidden_keys(batch)
+            yield batch
+
+    def send(
+        self,
+        append: Callable[[str, List[Dict[str, Any]]], Any],
+        dataset_id: str,
+        batch: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Sends a batch with `append(dataset_id, batch)` and feeds its latency back.
+
+        Returns:
+            int: The number of rows sent.
+
+        Raises:
+            PayloadTooLargeException: If a single row is too large for the API.
+            CustomException: If the API call fails or returns an error.
+        """
+        start = time.perf_counter()
+        try:
+            append(dataset_id, batch)
+        except PayloadTooLargeException:
+            self._record(batch, time.perf_counter() - start, failed=True)
+            if len(batch) == 1:
+                raise
+            middle = len(batch) // 2
+            rejected_bytes = len(json.dumps(batch, default=str))
+            with self._lock:
+                self._stats["splits"] += 1
+                # The body limit does not change, so later batches stay below it.
+                self.max_bytes = max(
+                    min(self.max_bytes, rejected_bytes - 1), self.min_bytes
+                )
+                self._batch_bytes = min(self._batch_bytes, self.max_bytes)
+            return self.send(append, dataset_id, batch[:middle]) + self.send(
+                append, dataset_id, batch[middle:]
+            )
+        except Exception:
+            self._record(batch, time.perf_counter() - start, failed=True)
+            raise
+        self._record(batch, time.perf_counter() - start, failed=False)
+        return len(batch)
+
+    def _record(self, batch: List[Dict[str, Any]], latency: float, failed: bool):
+        with self._lock:
+            if failed:
+                self._stats["errors"] += 1
+                self._batch_bytes = max(self._batch_bytes / 2, self.min_bytes)
+                self._concurrency = max(self._concurrency / 2, 1.0)
+                return
+            self._stats["batches"] += 1
+            self._stats["rows"] += len(batch)
+            if latency > self.target_latency:
+                self._stats["slow"] += 1
+                if self._batch_bytes <= self.min_bytes:
+                    self._concurrency = max(self._concurrency / 2, 1.0)
+                self._batch_bytes = max(self._batch_bytes / 2, self.min_bytes)
+            else:
+                self._batch_bytes = min(
+                    self._batch_bytes + self.increase_bytes, self.max_bytes
+                )
+                self._concurrency = min(
+                    self._concurrency + 1 / self._concurrency, float(self.max_workers)
+                )
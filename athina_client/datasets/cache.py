@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import quote
+
+from athina_client import constants
+from athina_client.constants import MAX_DATASET_ROWS
+from athina_client.services import AthinaApiService
+from athina_client.utils import atomic_write
+from .dataset import Dataset
+
+_OBJECT_MAGIC = b"ATHC\x01"
+
+# One lock per dataset directory, shared by all caches of the process, around
+# the read-modify-write of its manifest and the removal of unreferenced objects.
+_dataset_locks: Dict[str, threading.Lock] = {}
+_dataset_locks_lock = threading.Lock()
+
+
+class DatasetCache:
+    """
+    Local on-disk cache for dataset pages fetched with `get_dataset_by_id`.
+
+    Every dataset gets its own directory containing a manifest and a set of
+    content-addressed page objects (zlib-compressed JSON, named by their
+    SHA-256). The manifest records the dataset's `updated_at`; a page is served
+    from disk as long as the server still reports the same `updated_at`, and
+    only re-fetched once the dataset has changed. Pages whose content did not
+    change after a re-fetch are not rewritten. Datasets for which the server
+    reports no `updated_at` are never served from the cache.
+
+    Example:
+        ```python
+        cache = DatasetCache()
+        dataset = Dataset.get_dataset_by_id("dataset-123", cache=cache)
+        ```
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, max_age: Optional[float] = None
+    ):
+        """
+        Args:
+            directory (Optional[str]): Root directory of the cache. Defaults to `ATHINA_CACHE_DIR/datasets`.
+            max_age (Optional[float]): Seconds for which a freshness check is trusted. Within this window
+                cached pages are returned without contacting the API at all. Defaults to None (always check).
+        """
+        self.directory = directory or os.path.join(
+            constants.ATHINA_CACHE_DIR, "datasets"
+        )
+        self.max_age = max_age
+
+    def get_dataset_by_id(
+        self,
+        dataset_id: str,
+        limit: Optional[int] = MAX_DATASET_ROWS,
+        offset: Optional[int] = 0,
+        response_format: Optional[str] = "flat",
+        include_dataset_annotations: Optional[bool] = False,
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a dataset page, serving it from the local cache when the dataset is unchanged.
+
+        Args:
+            dataset_id (str): The ID of the dataset to retrieve.
+            limit (Optional[int]): Maximum number of dataset rows to return per page. Defaults to MAX_DATASET_ROWS.
+            offset (Optional[int]): Page number (zero-indexed) for pagination of dataset rows. Defaults to 0.
+            response_format (Optional[str]): The format of the response, either 'flat' or 'detailed'. Defaults to 'flat'.
+            include_dataset_annotations (Optional[bool]): Whether to include dataset annotations. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: The cleaned and formatted dataset information.
+        """
+        page_key = f"{response_format}:{limit}:{offset}:{int(bool(include_dataset_annotations))}"
+        manifest = self._read_manifest(dataset_id)
+
+        if not self._is_recently_checked(manifest):
+            updated_at = self._fetch_updated_at(dataset_id)
+
+            def check(current: Dict[str, Any]) -> Dict[str, Any]:
+                if updated_at is None or current.get("updated_at") != updated_at:
+                    current = self._stale_manifest(current, updated_at)
+                current["checked_at"] = time.time()
+                return current
+
+            manifest = self._update_manifest(dataset_id, check)
+
+        # Without an updated_at a change of the dataset cannot be detected.
+        digest = None
+        if manifest.get("updated_at") is not None:
+            digest = manifest["pages"].get(page_key)
+        if digest is not None:
+            page = self._read_object(dataset_id, digest)
+            if page is not None:
+                return page
+
+        response = AthinaApiService.get_dataset_by_id(
+            dataset_id,
+            limit=limit,
+            offset=offset,
+            include_dataset_annotations=include_dataset_annotations,
+        )
+        page = Dataset._clean_response(response, response_format)
+
+        # Trust the page's own updated_at, it may be newer than the freshness check.
+        updated_at = page["dataset"].get("updated_at")
+        if updated_at is None:
+            return page
+
+        def add(current: Dict[str, Any]) -> Dict[str, Any]:
+            if current.get("updated_at") != updated_at:
+                current = self._stale_manifest(current, updated_at)
+                current["checked_at"] = time.time()
+            current["pages"][page_key] = self._write_object(dataset_id, page)
+            return current
+
+        self._update_manifest(dataset_id, add, collect_garbage=True)
+        return page
+
+    def invalidate(self, dataset_id: Optional[str] = None):
+        """
+        Removes cached pages.
+
+        Args:
+            dataset_id (Optional[str]): The dataset to drop from the cache. If None, the whole cache is cleared.
+        """
+        path = self._dataset_dir(dataset_id) if dataset_id else self.directory
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _is_recently_checked(self, manifest: Dict[str, Any]) -> bool:
+        if self.max_age is None or "checked_at" not in manifest:
+            return False
+        return time.time() - manifest["checked_at"] < self.max_age
+
+    @staticmethod
+    def _stale_manifest(manifest: Dict[str, Any], updated_at: Optional[str]):
+        # The dataset changed, so every cached page is stale. The old objects are
+        # kept until the next change so that re-fetched pages with identical
+        # content resolve to the existing object instead of being rewritten.
+        return {
+            "updated_at": updated_at,
+            "pages": {},
+            "previous_pages": manifest.get("pages", {}),
+        }
+
+    @staticmethod
+    def _fetch_updated_at(dataset_id: str) -> Optional[str]:
+        response = AthinaApiService.get_dataset_by_id(
+            dataset_id, limit=0, include_dataset_rows=False
+        )
+        return response.get("dataset", {}).get("updated_at")
+
+    def _dataset_dir(self, dataset_id: str) -> str:
+        return os.path.join(self.directory, quote(dataset_id, safe=""))
+
+    def _read_manifest(self, dataset_id: str) -> Dict[str, Any]:
+        try:
+            with open(
+                os.path.join(self._dataset_dir(dataset_id), "manifest.json")
+            ) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {"updated_at": None, "pages": {}}
+        manifest.setdefault("pages", {})
+        return manifest
+
+    def _update_manifest(
+        self,
+        dataset_id: str,
+        update: Callable[[Dict[str, Any]], Dict[str, Any]],
+        collect_garbage: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Applies `update` to the current manifest and writes the result, so concurrent
+        loaders of the dataset do not overwrite each other's entries.
+        """
+        with self._dataset_lock(dataset_id):
+            manifest = update(self._read_manifest(dataset_id))
+            self._write_manifest(dataset_id, manifest)
+            if collect_garbage:
+                self._collect_garbage(dataset_id, manifest)
+        return manifest
+
+    def _dataset_lock(self, dataset_id: str) -> threading.Lock:
+        key = os.path.abspath(self._dataset_dir(dataset_id))
+        with _dataset_locks_lock:
+            lock = _dataset_locks.get(key)
+            if lock is None:
+                lock = _dataset_locks[key] = threading.Lock()
+            return lock
+
+    def _write_manifest(self, dataset_id: str, manifest: Dict[str, Any]):
+        path = os.path.join(self._dataset_dir(dataset_id), "manifest.json")
+        with atomic_write(path) as f:
+            f.write(json.dumps(manifest).encode("utf-8"))
+
+    def _read_object(self, dataset_id: str, digest: str) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self._dataset_dir(dataset_id), "objects", digest)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if not data.startswith(_OBJECT_MAGIC):
+            return None
+        try:
+            return json.loads(zlib.decompress(data[len(_OBJECT_MAGIC) :]))
+        except (zlib.error, ValueError):
+            return None
+
+    def _write_object(self, dataset_id: str, page: Dict[str, Any]) -> str:
+        payload = json.dumps(page, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = os.path.join(self._dataset_dir(dataset_id), "objects", digest)
+        if not os.path.exists(path):
+            with atomic_write(path) as f:
+                f.write(_OBJECT_MAGIC + zlib.compress(payload))
+        return digest
+
+    def _collect_garbage(self, dataset_id: str, manifest: Dict[str, Any]):
+        objects_dir = os.path.join(self._dataset_dir(dataset_id), "objects")
+        referenced = set(manifest["pages"].values())
+        referenced.update(manifest.get("previous_pages", {}).values())
+        for name in os.listdir(objects_dir):
+            if name not in referenced and not name.endswith(".tmp"):
+                try:
+                    os.remove(os.path.join(objects_dir, name))
+                except OSError:
+                    pass
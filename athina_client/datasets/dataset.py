@@ -1,7 +1,17 @@
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from dataclasses import dataclass, field
 from athina_client.services import AthinaApiService
 from athina_client.constants import MAX_DATASET_ROWS
+from athina_client.errors import CustomException
+from athina_client.instrumentation import Profiling, Tracing, traced
+
+if TYPE_CHECKING:
+    from .batching import AdaptiveBatcher
+    from .cache import DatasetCache
+    from .dedup import RowDeduplicator
+    from .ledger import BatchLedger
+    from .parallel import ParallelCleaner
+
 
 @dataclass
 class Dataset:
@@ -30,6 +40,13 @@ class Dataset:
                 raise ValueError("Dataset rows cannot contain the '__id' key.")
 
     @staticmethod
+    def _validate(rows: List[Dict[str, Any]]):
+        from .validation import validate_rows
+
+        validate_rows(rows).raise_for_issues()
+
+    @staticmethod
+    @traced("Dataset.create")
     def create(
         name: str,
         description: Optional[str] = None,
@@ -38,6 +55,7 @@ class Dataset:
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
         project_name: Optional[str] = None,
+        validate: bool = False,
     ) -> "Dataset":
         """
         Creates a new dataset with the provided details and rows.
@@ -50,12 +68,18 @@ class Dataset:
             rows (List[Dict[str, Any]]): A list of rows to include in the dataset.
             eval_columns (List[str, Any]): A list of column names that should be treated as evals.
             project_name (Optional[str]): The name of the project in which this dataset belongs to.
+            validate (bool): Check all rows with `validate_rows` before sending them. Defaults to False.
 
         Returns:
             Dataset: An instance of the Dataset class representing the newly created dataset.
+
+        Raises:
+            DatasetValidationException: If `validate` is set and any row is invalid.
         """
         rows = rows or []
         eval_columns = eval_columns or []
+        if validate:
+            Dataset._validate(rows)
         Dataset._check_forbidden_keys(rows)
 
         dataset_data = {
@@ -76,18 +100,20 @@ class Dataset:
         except Exception as e:
             raise
 
-        dataset = Dataset(
-            id=created_dataset_data["id"],
-            source=created_dataset_data["source"],
-            name=created_dataset_data["name"],
-            description=created_dataset_data["description"],
-            language_model_id=created_dataset_data["language_model_id"],
-            prompt_template=created_dataset_data["prompt_template"],
-            project_name=created_dataset_data.get("project_name"),
-        )
+        with Profiling.phase("construct"):
+            dataset = Dataset(
+                id=created_dataset_data["id"],
+                source=created_dataset_data["source"],
+                name=created_dataset_data["name"],
+                description=created_dataset_data["description"],
+                language_model_id=created_dataset_data["language_model_id"],
+                prompt_template=created_dataset_data["prompt_template"],
+                project_name=created_dataset_data.get("project_name"),
+            )
         return dataset
 
     @staticmethod
+    @traced("Dataset.change_project")
     def change_project(dataset_id: str, project_name: str) -> Dict[str, Any]:
         """
         Changes the project of a dataset.
@@ -109,27 +135,73 @@ class Dataset:
             raise CustomException("Error changing project for dataset", str(e))
 
     @staticmethod
-    def add_rows(dataset_id: str, rows: List[Dict[str, Any]]):
+    @traced("Dataset.add_rows")
+    def add_rows(
+        dataset_id: str,
+        rows: List[Dict[str, Any]],
+        ledger: Optional["BatchLedger"] = None,
+        dedup: Optional["RowDeduplicator"] = None,
+        validate: bool = False,
+        batcher: Optional["AdaptiveBatcher"] = None,
+    ):
         """
         Adds rows to an existing dataset in batches.
 
         Args:
             - dataset_id (str): The ID of the dataset to which rows will be added.
             - rows (List[Dict[str, Any]]): A list of rows to be added to the dataset.
+            - ledger (Optional[BatchLedger]): Ledger of acknowledged batches. Batches it already
+              records are skipped, so a failed call can be repeated without duplicating rows.
+            - dedup (Optional[RowDeduplicator]): Drops rows with the same content as a row seen before.
+              Rows are committed to it batch by batch, as they are acknowledged.
+            - validate (bool): Check all rows with `validate_rows` before the first batch is sent.
+            - batcher (Optional[AdaptiveBatcher]): Sizes the batches by bytes instead of sending 100
+              rows per batch. Batches are still sent one at a time, in order.
         Raises:
             - Exception: If the API returns an error or the limit of 5000 rows is exceeded.
+            - DatasetValidationException: If `validate` is set and any row is invalid.
+            - ValueError: If both `ledger` and `batcher` are given.
         """
+        if validate:
+            Dataset._validate(rows)
         Dataset._check_forbidden_keys(rows)
+        if dedup is not None:
+            rows = list(dedup.filter(rows))
+        if batcher is not None:
+            if ledger is not None:
+                raise ValueError("Adaptive batches cannot be recorded in a ledger.")
+            for index, batch in enumerate(batcher.batches(rows)):
+                with Tracing.span(
+                    "Dataset.add_rows.batch",
+                    {"athina.batch.index": index, "athina.batch.rows": len(batch)},
+                ):
+                    batcher.send(AthinaApiService.add_dataset_rows, dataset_id, batch)
+                if dedup is not None:
+                    dedup.commit(batch)
+            return
 
         batch_size = 100
         for i in range(0, len(rows), batch_size):
             batch = rows[i : i + batch_size]
             try:
-                AthinaApiService.add_dataset_rows(dataset_id, batch)
+                with Tracing.span(
+                    "Dataset.add_rows.batch",
+                    {
+                        "athina.batch.index": i // batch_size,
+                        "athina.batch.rows": len(batch),
+                    },
+                ):
+                    if ledger is not None:
+                        ledger.append(dataset_id, batch, i)
+                    else:
+                        AthinaApiService.add_dataset_rows(dataset_id, batch)
+                if dedup is not None:
+                    dedup.commit(batch)
             except Exception as e:
                 raise
 
     @staticmethod
+    @traced("Dataset.list_datasets")
     def list_datasets() -> List["Dataset"]:
         """
         Retrieves a list of all datasets available.
@@ -141,19 +213,21 @@ class Dataset:
             datasets = AthinaApiService.list_datasets()
         except Exception as e:
             raise
-        return [
-            Dataset(
-                id=dataset["id"],
-                source=dataset["source"],
-                name=dataset["name"],
-                description=dataset["description"],
-                language_model_id=dataset["language_model_id"],
-                prompt_template=dataset["prompt_template"],
-            )
-            for dataset in datasets
-        ]
+        with Profiling.phase("construct"):
+            return [
+                Dataset(
+                    id=dataset["id"],
+                    source=dataset["source"],
+                    name=dataset["name"],
+                    description=dataset["description"],
+                    language_model_id=dataset["language_model_id"],
+                    prompt_template=dataset["prompt_template"],
+                )
+                for dataset in datasets
+            ]
 
     @staticmethod
+    @traced("Dataset.delete_dataset_by_id")
     def delete_dataset_by_id(dataset_id: str) -> Dict[str, Any]:
         """
         Deletes a dataset by its ID.
@@ -171,12 +245,15 @@ class Dataset:
             raise
 
     @staticmethod
+    @traced("Dataset.get_dataset_by_id")
     def get_dataset_by_id(
         dataset_id: str,
         limit: Optional[int] = MAX_DATASET_ROWS,
         offset: Optional[int] = 0,
         response_format: Optional[str] = "flat",
-        include_dataset_annotations: Optional[bool] = False
+        include_dataset_annotations: Optional[bool] = False,
+        cache: Optional["DatasetCache"] = None,
+        cleaner: Optional["ParallelCleaner"] = None,
     ) -> Dict[str, Any]:
         """
         Retrieves a dataset by its ID and formats the response based on the provided format.
@@ -187,10 +264,28 @@ class Dataset:
             offset (Optional[int]): Page number (zero-indexed) for pagination of dataset rows. Defaults to 0 (first page).
             response_format (Optional[str]): The format of the response, either 'flat' or 'detailed'. Defaults to 'flat'.
             include_dataset_annotations (Optional[bool]): Whether to include dataset annotations in the response. If True, annotations will be included; if False, they will be excluded. Defaults to False.
+            cache (Optional[DatasetCache]): Local cache to serve the page from while the dataset is unchanged. Defaults to None (no caching).
+            cleaner (Optional[ParallelCleaner]): Decodes and cleans large pages in worker processes. Defaults to None (in this process).
 
         Returns:
             Dict[str, Any]: The cleaned and formatted dataset information.
         """
+        if cache is not None:
+            return cache.get_dataset_by_id(
+                dataset_id,
+                limit=limit,
+                offset=offset,
+                response_format=response_format,
+                include_dataset_annotations=include_dataset_annotations,
+            )
+        if cleaner is not None:
+            return cleaner.get_dataset_by_id(
+                dataset_id,
+                limit=limit,
+                offset=offset,
+                response_format=response_format,
+                include_dataset_annotations=include_dataset_annotations,
+            )
         try:
             response = AthinaApiService.get_dataset_by_id(dataset_id, limit=limit, offset=offset, include_dataset_annotations=include_dataset_annotations)
             return Dataset._clean_response(response, response_format)
@@ -198,6 +293,7 @@ class Dataset:
             raise
 
     @staticmethod
+    @traced("Dataset.get_dataset_by_name")
     def get_dataset_by_name(
         name: str,
         limit: Optional[int] = MAX_DATASET_ROWS,
@@ -254,62 +350,8 @@ class Dataset:
         dataset_rows = response.get("dataset_rows", [])
         development_eval_configs = response.get("development_eval_configs", [])
 
-        # Create a lookup for development_eval_configs by id
-        eval_config_lookup = {
-            config["id"]: {
-                "display_name": config["display_name"],
-                "eval_type_id": config["eval_type_id"],
-            }
-            for config in development_eval_configs
-        }
-
-        # Clean dataset rows
-        for row in dataset_rows:
-            for config_id, config_data in eval_config_lookup.items():
-                eval_result = next(
-                    (
-                        er
-                        for er in row.get("dataset_eval_results", [])
-                        if er.get("development_eval_config_id") == config_id
-                    ),
-                    None,
-                )
-
-                if eval_result:
-                    metric_value = eval_result.get("metric_value")
-
-                    # Attempt to convert to an int if possible, otherwise float, otherwise keep as-is
-                    try:
-                        metric_value = int(metric_value)
-                    except (ValueError, TypeError):
-                        try:
-                            metric_value = float(metric_value)
-                        except (ValueError, TypeError):
-                            pass  # Keep it as-is if it's not a number
-
-                    if response_format == "detailed":
-                        metric_id = eval_result.get("metric_id")
-                        explanation = eval_result.get("explanation")
-
-                        # Set "Ragas Faithfulness Test" to None if metric_id is None
-                        if metric_id is None:
-                            row[f"{config_data['display_name']}"] = None
-                        else:
-                            row[f"{config_data['display_name']}"] = {
-                                "metric_id": metric_id,
-                                "metric_value": metric_value,
-                                "explanation": explanation,
-                            }
-                    elif response_format == "flat":
-                        row[f"{config_data['display_name']}"] = metric_value
-                else:
-                    if response_format == "detailed":
-                        row[f"{config_data['display_name']}"] = None
-                    elif response_format == "flat":
-                        row[f"{config_data['display_name']}"] = None
-
-            # Remove the original dataset_eval_results array
-            row.pop("dataset_eval_results", None)
+        with Profiling.phase("clean"):
+            _clean_rows(dataset_rows, development_eval_configs, response_format)
 
         cleaned_response = {
             "dataset": {
@@ -341,6 +383,7 @@ class Dataset:
         return cleaned_response
 
     @staticmethod
+    @traced("Dataset.update_cells")
     def update_cells(dataset_id: str, cells: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Updates specific cells in a dataset.
@@ -372,3 +415,66 @@ class Dataset:
             return response
         except Exception as e:
             raise CustomException("Error updating cells in dataset", str(e))
+
+
+def _clean_rows(
+    dataset_rows: List[Dict[str, Any]],
+    development_eval_configs: List[Dict[str, Any]],
+    response_format: str,
+) -> List[Dict[str, Any]]:
+    """
+    Replaces the `dataset_eval_results` of every row, in place, with one column per eval config.
+
+    Args:
+        dataset_rows (List[Dict[str, Any]]): The rows as returned by the API.
+        development_eval_configs (List[Dict[str, Any]]): The eval configs of the dataset.
+        response_format (str): The format of the eval columns, either 'flat' or 'detailed'.
+
+    Returns:
+        List[Dict[str, Any]]: The cleaned rows.
+    """
+    eval_columns = {
+        config["id"]: config["display_name"] for config in development_eval_configs
+    }
+    detailed = response_format == "detailed"
+    if not detailed and response_format != "flat":
+        # Unknown formats only drop the eval results.
+        eval_columns = {}
+
+    for row in dataset_rows:
+        eval_results = row.pop("dataset_eval_results", None) or []
+        # Index the results of the row once instead of scanning them per config; the
+        # first result of a config wins.
+        results_by_config = {}
+        for eval_result in eval_results:
+            results_by_config.setdefault(
+                eval_result.get("development_eval_config_id"), eval_result
+            )
+
+        for config_id, display_name in eval_columns.items():
+            eval_result = results_by_config.get(config_id)
+            if not eval_result:
+                row[display_name] = None
+                continue
+
+            metric_value = eval_result.get("metric_value")
+            # Attempt to convert to an int if possible, otherwise float, otherwise keep as-is
+            try:
+                metric_value = int(metric_value)
+            except (ValueError, TypeError):
+                try:
+                    metric_value = float(metric_value)
+                except (ValueError, TypeError):
+                    pass  # Keep it as-is if it's not a number
+
+            if not detailed:
+                row[display_name] = metric_value
+            elif eval_result.get("metric_id") is None:
+                row[display_name] = None
+            else:
+                row[display_name] = {
+                    "metric_id": eval_result.get("metric_id"),
+                    "metric_value": metric_value,
+                    "explanation": eval_result.get("explanation"),
+                }
+    return dataset_rows
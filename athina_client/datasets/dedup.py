@@ -0,0 +1,248 @@
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from athina_client.errors import CustomException
+from athina_client.services import AthinaApiService
+from athina_client.utils import atomic_write
+
+_BLOOM_MAGIC = b"ATHBLM01"
+_BLOOM_HEADER = struct.Struct("<8sQQQ")
+
+# Keys the API adds to stored rows; they are never part of a row's content.
+SERVER_ROW_KEYS = ("__id", "row_no", "dataset_eval_results")
+
+
+class RowDeduplicator:
+    """
+    Drops rows whose content was already seen, before they are uploaded.
+
+    Rows are identified by a 128-bit BLAKE2b hash of their canonical JSON (keys
+    sorted), optionally restricted to `fields`. By default the hashes are kept
+    in memory (16 bytes per unique row). With a `path`, a Bloom filter in a
+    memory-mapped file is used instead: memory use is fixed and the index
+    survives restarts, at the cost of dropping a small fraction
+    (`error_rate`) of unique rows as false positives.
+
+    Rows passed by `filter` are only added to the index by `commit`, once the
+    API acknowledged their batch, so the rows of a failed upload are sent again
+    when it is repeated. Use one deduplicator per dataset and upload.
+
+    Example:
+        ```python
+        dedup = RowDeduplicator(fields=["query", "context", "response"])
+        dedup.seed("dataset-123")
+        upload_rows(rows, dataset_id="dataset-123", dedup=dedup)
+        print(dedup.dropped)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+    ):
+        """
+        Args:
+            path (Optional[str]): File of an on-disk Bloom filter index. Defaults to None (exact, in-memory index).
+            fields (Optional[Sequence[str]]): Columns that make up a row's identity. Defaults to all columns
+                except the ones the API adds.
+            capacity (int): Expected number of unique rows, used to size a new Bloom filter. Defaults to 1,000,000.
+            error_rate (float): Target false positive rate of a new Bloom filter. Defaults to 0.001.
+        """
+        self.path = path
+        self.fields = tuple(fields) if fields is not None else None
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._seen = set() if path is None else None
+        # Hashes of rows passed by `filter` that are not committed yet.
+        self._pending = set()
+        self._bloom = _BloomFilter.open(path, capacity, error_rate) if path else None
+
+    def row_hash(self, row: Dict[str, Any]) -> bytes:
+        """
+        Returns the 16-byte content hash of a row.
+        """
+        if self.fields is not None:
+            content = {key: row.get(key) for key in self.fields}
+        else:
+            content = {k: v for k, v in row.items() if k not in SERVER_ROW_KEYS}
+        canonical = json.dumps(
+            content,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """
+        Adds a row to the index.
+
+        Returns:
+            bool: True if the row was not seen before.
+        """
+        digest = self.row_hash(row)
+        with self._lock:
+            if self._bloom is not None:
+                return self._bloom.add(digest)
+            if digest in self._seen:
+                return False
+            self._seen.add(digest)
+            return True
+
+    def filter(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the rows that were not seen before, dropping repeats within `rows` as well.
+
+        The yielded rows are not added to the index; pass them to `commit` once they were uploaded.
+        """
+        with self._lock:
+            self._pending = set()
+        for row in rows:
+            digest = self.row_hash(row)
+            with self._lock:
+                if digest in self._pending or self._contains(digest):
+                    seen = True
+                else:
+                    seen = False
+                    self._pending.add(digest)
+            if seen:
+                self.dropped += 1
+            else:
+                yield row
+
+    def commit(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Adds rows the API acknowledged to the index.
+        """
+        for row in rows:
+            digest = self.row_hash(row)
+            with self._lock:
+                self._pending.discard(digest)
+                if self._bloom is not None:
+                    self._bloom.add(digest)
+                else:
+                    self._seen.add(digest)
+
+    def seed(self, dataset_id: str, page_size: int = 1000) -> int:
+        """
+        Adds the rows already stored in a dataset to the index.
+
+        Args:
+            dataset_id (str): The ID of the dataset.
+            page_size (int): Number of rows fetched per request. Defaults to 1000.
+
+        Returns:
+            int: The number of rows read.
+
+        Raises:
+            CustomException: If the API call fails or returns an error.
+        """
+        offset = 0
+        seeded = 0
+        while True:
+            try:
+                response = AthinaApiService.get_dataset_by_id(
+                    dataset_id, limit=page_size, offset=offset
+                )
+            except Exception as e:
+                raise CustomException("Error fetching dataset rows", str(e))
+            rows = response.get("dataset_rows", [])
+            for row in rows:
+                self.add(row)
+            seeded += len(rows)
+            if len(rows) < page_size:
+                return seeded
+            offset += 1
+
+    def __contains__(self, row: Dict[str, Any]) -> bool:
+        digest = self.row_hash(row)
+        with self._lock:
+            return self._contains(digest)
+
+    def _contains(self, digest: bytes) -> bool:
+        if self._bloom is not None:
+            return digest in self._bloom
+        return digest in self._seen
+
+    def close(self):
+        """
+        Flushes and closes the on-disk index.
+        """
+        if self._bloom is not None:
+            self._bloom.close()
+            self._bloom = None
+
+    def __enter__(self) -> "RowDeduplicator":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _BloomFilter:
+    def __init__(self, path: str, mapping: mmap.mmap, bits: int, hashes: int):
+        self.path = path
+        self.bits = bits
+        self.hashes = hashes
+        self._mmap = mapping
+        self._offset = _BLOOM_HEADER.size
+
+    @staticmethod
+    def open(path: str, capacity: int, error_rate: float) -> "_BloomFilter":
+        if not os.path.exists(path):
+            bits = max(
+                8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+            )
+            hashes = max(1, round(bits / capacity * math.log(2)))
+            with atomic_write(path) as f:
+                f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, bits, hashes, 0))
+                f.truncate(_BLOOM_HEADER.size + (bits + 7) // 8)
+
+        with open(path, "r+b") as f:
+            mapping = mmap.mmap(f.fileno(), 0)
+        magic, bits, hashes, _ = _BLOOM_HEADER.unpack_from(mapping, 0)
+        if magic != _BLOOM_MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a row index")
+        return _BloomFilter(path, mapping, bits, hashes)
+
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        # Double hashing: the two halves of the digest generate all k positions.
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def __contains__(self, digest: bytes) -> bool:
+        data = self._mmap
+        offset = self._offset
+        return all(
+            data[offset + position // 8] & (1 << position % 8)
+            for position in self._positions(digest)
+        )
+
+    def add(self, digest: bytes) -> bool:
+        data = self._mmap
+        offset = self._offset
+        added = False
+        for position in self._positions(digest):
+            index = offset + position // 8
+            mask = 1 << position % 8
+            if not data[index] & mask:
+                data[index] |= mask
+                added = True
+        return added
+
+    def close(self):
+        self._mmap.flush()
+        self._mmap.close()
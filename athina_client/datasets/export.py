@@ -0,0 +1,284 @@
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Tuple
+
+from athina_client.instrumentation import traced
+from athina_client.services import AthinaApiService
+from athina_client.utils import atomic_write
+from .dataset import Dataset
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# Pages a Parquet export holds back at most while inferring the column types.
+_MAX_BUFFERED_PAGES = 10
+
+
+def iter_pages(
+    dataset_id: str,
+    page_size: int = 1000,
+    start_offset: int = 0,
+    response_format: Optional[str] = "flat",
+    include_dataset_annotations: Optional[bool] = False,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Pages through a dataset, cleaning one page at a time.
+
+    Args:
+        dataset_id (str): The ID of the dataset.
+        page_size (int): Number of rows per page. Defaults to 1000.
+        start_offset (int): Page number (zero-indexed) to start from. Defaults to 0.
+        response_format (Optional[str]): The format of the rows, either 'flat' or 'detailed'. Defaults to 'flat'.
+        include_dataset_annotations (Optional[bool]): Whether to include dataset annotations. Defaults to False.
+
+    Returns:
+        Iterator[Tuple[int, Dict[str, Any]]]: Pairs of page number and cleaned page.
+    """
+    offset = start_offset
+    while True:
+        response = AthinaApiService.get_dataset_by_id(
+            dataset_id,
+            limit=page_size,
+            offset=offset,
+            include_dataset_annotations=include_dataset_annotations,
+        )
+        page = Dataset._clean_response(response, response_format)
+        yield offset, page
+        if len(page["dataset_rows"]) < page_size:
+            return
+        offset += 1
+
+
+@traced("export_rows")
+def export_rows(
+    dataset_id: str,
+    path: str,
+    file_format: Optional[str] = None,
+    response_format: Optional[str] = "flat",
+    page_size: int = 1000,
+    start_offset: int = 0,
+    resume: bool = False,
+    on_progress: Optional[Callable[[int], None]] = None,
+    schema: Optional["pyarrow.Schema"] = None,
+) -> int:
+    """
+    Streams a dataset to a JSONL or Parquet file with bounded memory.
+
+    JSONL exports hold one page of rows in memory at a time. Their progress is
+    recorded in a `<path>.progress` file after every page, so an interrupted
+    export can be continued with `resume=True`. Parquet exports write one row
+    group per page and require `pyarrow`. Their column types are inferred from
+    the first pages, widening integers to floats where the pages disagree; a
+    column that is empty at first holds back writing until a page fills it, so
+    up to 10 pages may be held in memory, unless `schema` is given. An empty
+    dataset still produces a file.
+
+    Args:
+        dataset_id (str): The ID of the dataset to export.
+        path (str): Path of the output file.
+        file_format (Optional[str]): Either 'jsonl' or 'parquet'. Inferred from the file extension if not given.
+        response_format (Optional[str]): The format of the rows, either 'flat' or 'detailed'. Defaults to 'flat'.
+        page_size (int): Number of rows fetched per request. Defaults to 1000.
+        start_offset (int): Page number (zero-indexed) to start from. Defaults to 0.
+        resume (bool): Continue a previously interrupted JSONL export of the same dataset. Defaults to False.
+        on_progress (Optional[Callable[[int], None]]): Called with the total number of exported rows after every page.
+        schema (Optional[pyarrow.Schema]): Column types of a Parquet export. Inferred from the rows if not given.
+
+    Returns:
+        int: The number of rows written by this call.
+
+    Raises:
+        ValueError: If the format is unsupported, resuming is not possible, or a page of a
+            Parquet export does not fit the column types of the earlier pages without losing data.
+        ImportError: If a Parquet export is requested and `pyarrow` is not installed.
+    """
+    file_format = file_format or _infer_format(path)
+
+    def pages(offset: int):
+        return iter_pages(
+            dataset_id,
+            page_size=page_size,
+            start_offset=offset,
+            response_format=response_format,
+        )
+
+    if file_format == "jsonl":
+        return _export_jsonl(
+            path,
+            pages,
+            _progress_state(dataset_id, response_format, page_size, start_offset),
+            resume,
+            on_progress,
+        )
+    if file_format == "parquet":
+        if resume:
+            raise ValueError("Parquet exports cannot be resumed, use start_offset.")
+        return _export_parquet(path, pages(start_offset), on_progress, schema)
+    raise ValueError(f"Unsupported file format: {file_format}")
+
+
+def _progress_state(dataset_id, response_format, page_size, start_offset):
+    return {
+        "dataset_id": dataset_id,
+        "response_format": response_format,
+        "page_size": page_size,
+        "next_offset": start_offset,
+        "rows": 0,
+        "bytes": 0,
+    }
+
+
+def _export_jsonl(path, pages, state, resume, on_progress) -> int:
+    state_path = f"{path}.progress"
+    mode = "wb"
+    if resume and os.path.exists(state_path):
+        with open(state_path) as f:
+            saved_state = json.load(f)
+        for key in ("dataset_id", "response_format", "page_size"):
+            if saved_state[key] != state[key]:
+                raise ValueError(
+                    f"Cannot resume: {state_path} was written with a different {key}."
+                )
+        if not os.path.exists(path):
+            raise ValueError(f"Cannot resume: {path} does not exist.")
+        state = saved_state
+        mode = "r+b"
+
+    written = 0
+    with open(path, mode) as f:
+        # Drop anything written after the last completed page.
+        f.seek(state["bytes"])
+        f.truncate()
+        for offset, page in pages(state["next_offset"]):
+            rows = page["dataset_rows"]
+            f.write(b"".join(json.dumps(row).encode("utf-8") + b"\n" for row in rows))
+            f.flush()
+            written += len(rows)
+            state.update(
+                next_offset=offset + 1, rows=state["rows"] + len(rows), bytes=f.tell()
+            )
+            _write_state(state_path, state)
+            if on_progress:
+                on_progress(state["rows"])
+
+    os.remove(state_path)
+    return written
+
+
+def _export_parquet(path, pages, on_progress, schema=None) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Parquet exports require pyarrow. Install it with `pip install pyarrow`."
+        )
+
+    written = 0
+    writer = None
+    # Without an explicit schema, pages are held back while a column has only
+    # been seen empty, since its type is not known until a page fills it.
+    buffered = []
+
+    def write(tables):
+        nonlocal written
+        for table in tables:
+            writer.write_table(table)
+            written += table.num_rows
+            if on_progress:
+                on_progress(written)
+
+    def unify(tables):
+        try:
+            return pa.unify_schemas(
+                [table.schema for table in tables], promote_options="permissive"
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f"The first pages have incompatible column types ({e}); pass a schema."
+            ) from e
+
+    try:
+        if schema is not None:
+            writer = pq.ParquetWriter(path, schema)
+        for _, page in pages:
+            rows = page["dataset_rows"]
+            if not rows:
+                continue
+            table = _page_table(pa, rows)
+            if writer is None:
+                buffered.append(table)
+                inferred = unify(buffered)
+                if (
+                    any(pa.types.is_null(field.type) for field in inferred)
+                    and len(buffered) < _MAX_BUFFERED_PAGES
+                ):
+                    continue
+                writer = pq.ParquetWriter(path, inferred)
+                write(_conform(pa, table, inferred) for table in buffered)
+                buffered = []
+                continue
+            new_columns = set(table.column_names) - set(writer.schema.names)
+            if new_columns:
+                raise ValueError(
+                    f"Columns {sorted(new_columns)} first appear after the first page; "
+                    "export to JSONL, use a larger page_size or pass a schema."
+                )
+            write([_conform(pa, table, writer.schema)])
+        if writer is None:
+            # Fewer pages than the buffer holds, or no rows at all; an empty
+            # dataset still gets a file, without columns.
+            writer = pq.ParquetWriter(
+                path, unify(buffered) if buffered else pa.schema([])
+            )
+        write(_conform(pa, table, writer.schema) for table in buffered)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def _page_table(pa, rows):
+    try:
+        return pa.Table.from_pylist(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise ValueError(
+            f"A page has values of different types in one column ({e}); "
+            "export to JSONL."
+        ) from e
+
+
+def _conform(pa, table, schema):
+    # Adds the columns a page lacks and casts the others to the unified types.
+    # Casts are safe, so a value that would be truncated raises instead.
+    try:
+        columns = [
+            (
+                table.column(field.name).cast(field.type, safe=True)
+                if field.name in table.column_names
+                else pa.nulls(table.num_rows, field.type)
+            )
+            for field in schema
+        ]
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        raise ValueError(
+            f"A page does not match the column types of the earlier pages ({e}); "
+            "pass a schema."
+        ) from e
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _write_state(path: str, state: Dict[str, Any]):
+    with atomic_write(path, "w") as f:
+        json.dump(state, f)
+
+
+def _infer_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(
+        f"Cannot infer the file format of {path}, pass file_format explicitly."
+    )
@@ -0,0 +1,215 @@
+import contextvars
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from athina_client.instrumentation import traced
+from athina_client.services import AthinaApiService
+from .dataset import Dataset
+
+if TYPE_CHECKING:
+    from .batching import AdaptiveBatcher
+    from .dedup import RowDeduplicator
+    from .ledger import BatchLedger
+
+
+def read_rows(path: str, file_format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Streams rows from a JSONL or CSV file without loading the whole file.
+
+    Args:
+        path (str): Path of the file to read.
+        file_format (Optional[str]): Either 'jsonl' or 'csv'. Inferred from the file extension if not given.
+
+    Returns:
+        Iterator[Dict[str, Any]]: The rows of the file.
+
+    Raises:
+        ValueError: If the format is unsupported or a JSONL line is not an object.
+    """
+    file_format = file_format or _infer_format(path)
+    if file_format == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    elif file_format == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError(f"Line {line_no} of {path} is not a JSON object.")
+                yield row
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+
+@traced("upload_rows")
+def upload_rows(
+    rows: Iterable[Dict[str, Any]],
+    name: Optional[str] = None,
+    dataset_id: Optional[str] = None,
+    description: Optional[str] = None,
+    project_name: Optional[str] = None,
+    batch_size: int = 100,
+    max_workers: int = 4,
+    on_progress: Optional[Callable[[int], None]] = None,
+    ledger: Optional["BatchLedger"] = None,
+    dedup: Optional["RowDeduplicator"] = None,
+    batcher: Optional["AdaptiveBatcher"] = None,
+) -> str:
+    """
+    Streams rows into a new or existing dataset.
+
+    When `dataset_id` is not given, the dataset is created with the first batch (or
+    empty, with a `batcher`) and the remaining batches are appended in parallel. At most `2 * max_workers`
+    batches are held in memory at any time.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): The rows to upload, e.g. from `read_rows`.
+        name (Optional[str]): Name of the dataset to create. Required if `dataset_id` is not given.
+        dataset_id (Optional[str]): ID of an existing dataset to append to.
+        description (Optional[str]): Description of the dataset to create.
+        project_name (Optional[str]): Project of the dataset to create.
+        batch_size (int): Number of rows per request. Defaults to 100.
+        max_workers (int): Number of batches appended concurrently. Defaults to 4.
+        on_progress (Optional[Callable[[int], None]]): Called with the total number of uploaded rows after every batch.
+        ledger (Optional[BatchLedger]): Ledger of acknowledged batches. Batches it already records are
+            skipped, so an interrupted upload into an existing dataset can be run again without duplicates.
+        dedup (Optional[RowDeduplicator]): Drops rows with the same content as a row seen before, before
+            they are batched. Rows are committed to it once their batch is acknowledged.
+        batcher (Optional[AdaptiveBatcher]): Sizes batches by bytes and tunes the batch size and the
+            number of batches in flight from latency and errors. Replaces `batch_size` and `max_workers`.
+
+    Returns:
+        str: The ID of the dataset the rows were uploaded to.
+
+    Raises:
+        ValueError: If neither `name` nor `dataset_id` is given, `batch_size` or `max_workers` is
+            less than 1, a row contains the '__id' key, or both `ledger` and `batcher` are given.
+    """
+    if dataset_id is None and name is None:
+        raise ValueError("Either a dataset name or a dataset_id is required.")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+    if ledger is not None and batcher is not None:
+        raise ValueError("Adaptive batches cannot be recorded in a ledger.")
+
+    if dedup is not None:
+        rows = dedup.filter(rows)
+    if batcher is not None:
+        batches = batcher.batches(rows)
+        max_workers = batcher.max_workers
+    else:
+        batches = _batches(rows, batch_size)
+    uploaded = 0
+    # Position of the next batch's first row, which is part of its ledger key.
+    offset = 0
+
+    if dataset_id is None:
+        # Adaptive batches are all appended, so that a batch too large for the API can be split.
+        first_batch = next(batches, []) if batcher is None else []
+        dataset = Dataset.create(
+            name=name,
+            description=description,
+            rows=first_batch,
+            project_name=project_name,
+        )
+        dataset_id = dataset.id
+        if dedup is not None:
+            dedup.commit(first_batch)
+        uploaded += len(first_batch)
+        offset += len(first_batch)
+        if on_progress:
+            on_progress(uploaded)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        for batch in batches:
+            # Run every batch in the caller's context so an active AthinaClient applies.
+            if batcher is not None:
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    batcher.send,
+                    AthinaApiService.add_dataset_rows,
+                    dataset_id,
+                    batch,
+                )
+            elif ledger is not None:
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    ledger.append,
+                    dataset_id,
+                    batch,
+                    offset,
+                )
+            else:
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    AthinaApiService.add_dataset_rows,
+                    dataset_id,
+                    batch,
+                )
+            offset += len(batch)
+            pending[future] = batch
+            # Adaptive batches are only started while the batcher allows more in flight.
+            limit = batcher.concurrency if batcher is not None else 2 * max_workers
+            while len(pending) >= limit:
+                uploaded += _collect(pending, dedup, on_progress, uploaded)
+        while pending:
+            uploaded += _collect(pending, dedup, on_progress, uploaded)
+
+    return dataset_id
+
+
+def _batches(
+    rows: Iterable[Dict[str, Any]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        Dataset._check_forbidden_keys(batch)
+        yield batch
+
+
+def _collect(
+    pending: Dict[Any, List[Dict[str, Any]]], dedup, on_progress, uploaded: int
+) -> int:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    completed = 0
+    for future in done:
+        future.result()
+        batch = pending.pop(future)
+        if dedup is not None:
+            dedup.commit(batch)
+        completed += len(batch)
+        if on_progress:
+            on_progress(uploaded + completed)
+    return completed
+
+
+def _infer_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(
+        f"Cannot infer the file format of {path}, pass file_format explicitly."
+    )
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Set, Tuple
+
+from athina_client.services import AthinaApiService
+
+
+class BatchLedger:
+    """
+    Local, append-only record of row batches the API acknowledged.
+
+    Batches are identified by a deterministic idempotency key derived from the
+    dataset, the offset of the batch in the upload and its rows. Uploads given
+    a ledger skip batches that were already acknowledged, so an interrupted
+    upload of the same rows can simply be run again: committed batches are
+    skipped locally, and a batch whose acknowledgement was lost is deduplicated
+    by the server through its `Idempotency-Key`.
+
+    Example:
+        ```python
+        ledger = BatchLedger("upload.ledger")
+        upload_rows(read_rows("rows.jsonl"), dataset_id="dataset-123", ledger=ledger)
+        ```
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of the ledger file. It is created on the first acknowledged batch.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._keys: Set[Tuple[str, str]] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A torn last line from an interrupted write.
+                        continue
+                    self._keys.add((entry["dataset_id"], entry["key"]))
+
+    @staticmethod
+    def key(dataset_id: str, rows: List[Dict[str, Any]], offset: int) -> str:
+        """
+        Returns the idempotency key of a batch whose first row is row `offset` of the upload.
+        """
+        return AthinaApiService.batch_idempotency_key(dataset_id, rows, offset)
+
+    def is_acknowledged(self, dataset_id: str, key: str) -> bool:
+        return (dataset_id, key) in self._keys
+
+    def record(self, dataset_id: str, key: str, rows: int):
+        """
+        Records an acknowledged batch.
+        """
+        entry = json.dumps({"dataset_id": dataset_id, "key": key, "rows": rows})
+        with self._lock:
+            if (dataset_id, key) in self._keys:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(entry + "\n")
+            self._keys.add((dataset_id, key))
+
+    def append(self, dataset_id: str, rows: List[Dict[str, Any]], offset: int) -> bool:
+        """
+        Adds a batch of rows to a dataset unless the ledger shows it was already added.
+
+        Args:
+            dataset_id (str): The ID of the dataset.
+            rows (List[Dict[str, Any]]): The rows of the batch.
+            offset (int): Position of the batch's first row in the upload.
+
+        Returns:
+            bool: False if the batch was skipped because it was already acknowledged.
+
+        Raises:
+            CustomException: If the API call fails or returns an error.
+        """
+        key = self.key(dataset_id, rows, offset)
+        if self.is_acknowledged(dataset_id, key):
+            return False
+        AthinaApiService.add_dataset_rows(dataset_id, rows, idempotency_key=key)
+        self.record(dataset_id, key, len(rows))
+        return True
+
+    def __len__(self) -> int:
+        return len(self._keys)
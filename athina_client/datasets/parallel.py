@@ -0,0 +1,359 @@
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from athina_client.constants import MAX_DATASET_ROWS
+from athina_client.instrumentation import Profiling
+from athina_client.services import AthinaApiService
+from .dataset import Dataset, _clean_rows
+
+_ROWS_KEY = re.compile(rb'"dataset_rows"\s*:\s*\[')
+_EVAL_CONFIGS_KEY = re.compile(rb'"development_eval_configs"\s*:\s*')
+# Candidate boundary between two rows. It may also match inside a string or a
+# nested object; such a split makes one of the slices invalid JSON, which is detected.
+_ROW_BOUNDARY_TEXT = re.compile(r"\}\s*,\s*\{")
+_ROW_CONTINUES = re.compile(r"\s*\}\s*,\s*\{")
+_WHITESPACE = re.compile(r"\s*")
+
+
+class ParallelCleaner:
+    """
+    Decodes and cleans large dataset pages on several cores.
+
+    The undecoded page is placed in shared memory once. Its `dataset_rows`
+    array is split at row boundaries into one slice per worker process, and
+    every worker decodes and cleans its slice straight from shared memory, so
+    no rows are pickled on the way in. The cleaned rows are reassembled in
+    order and the result is identical to `Dataset.get_dataset_by_id`. Pages
+    smaller than `min_bytes`, and pages that cannot be split safely, are
+    cleaned in the calling process: copying the page and returning the rows
+    cost more than cleaning them serially (about 7 ms against 5 ms per MB), so
+    only large pages on several cores are cleaned faster in parallel.
+
+    The worker processes are started on first use and reused until `close`.
+
+    Example:
+        ```python
+        with ParallelCleaner(max_workers=8) as cleaner:
+            page = Dataset.get_dataset_by_id(
+                "dataset-123", response_format="detailed", cleaner=cleaner
+            )
+        ```
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_bytes: int = 16_000_000):
+        """
+        Args:
+            max_workers (Optional[int]): Number of worker processes. Defaults to the number of CPUs.
+            min_bytes (int): Pages smaller than this are cleaned in the calling process. Defaults to 16 MB.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_bytes = min_bytes
+        self._executor = None
+
+    def get_dataset_by_id(
+        self,
+        dataset_id: str,
+        limit: Optional[int] = MAX_DATASET_ROWS,
+        offset: Optional[int] = 0,
+        response_format: Optional[str] = "flat",
+        include_dataset_annotations: Optional[bool] = False,
+    ) -> Dict[str, Any]:
+        """
+        Fetches a dataset page and cleans it like `Dataset.get_dataset_by_id`.
+        """
+        raw = AthinaApiService.get_dataset_by_id_raw(
+            dataset_id,
+            limit=limit,
+            offset=offset,
+            include_dataset_annotations=include_dataset_annotations,
+        )
+        return self.clean(raw, response_format)
+
+    def clean(self, raw: bytes, response_format: str = "flat") -> Dict[str, Any]:
+        """
+        Decodes and cleans the undecoded body of a `fetch-by-id` response.
+
+        Returns:
+            Dict[str, Any]: The same result as `Dataset._clean_response` of the decoded page.
+        """
+        if self.max_workers > 1 and len(raw) >= self.min_bytes:
+            # Workers decode and clean together, so both count as cleaning.
+            with Profiling.phase("clean"):
+                cleaned = self._clean_parallel(raw, response_format)
+            if cleaned is not None:
+                return cleaned
+        with Profiling.phase("decode"):
+            response = json.loads(raw)["data"]
+        return Dataset._clean_response(response, response_format)
+
+    def close(self):
+        """
+        Stops the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelCleaner":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _pool(self):
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Workers only decode and clean, so they are spawned rather than forked
+            # from a process that may hold locks in other threads.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _clean_parallel(
+        self, raw: bytes, response_format: str
+    ) -> Optional[Dict[str, Any]]:
+        rows_key = _ROWS_KEY.search(raw)
+        if rows_key is None:
+            return None
+        rows_start = rows_key.end()
+        eval_configs = _eval_configs(raw)
+        slices = _split(raw, rows_start, self.max_workers)
+
+        from multiprocessing import shared_memory
+
+        memory = shared_memory.SharedMemory(create=True, size=len(raw))
+        try:
+            memory.buf[: len(raw)] = raw
+            futures = [
+                self._pool().submit(
+                    _clean_slice,
+                    memory.name,
+                    start,
+                    stop,
+                    len(raw),
+                    start == rows_start,
+                    eval_configs,
+                    response_format,
+                )
+                for start, stop in slices
+            ]
+            results = [future.result() for future in futures]
+        finally:
+            memory.close()
+            memory.unlink()
+
+        # Chain the ranges: every range must start exactly where the rows decoded by
+        # the previous one stopped, which proves that it started at a row boundary.
+        row_chunks = []
+        cursor = rows_start
+        rows_end = None
+        for (_, stop), result in zip(slices, results):
+            if cursor >= stop:
+                continue
+            if result is None or result[0] != cursor:
+                return None
+            first_row, rows, cursor, rows_end = result
+            row_chunks.append(rows)
+            if rows_end is not None:
+                break
+        if rows_end is None:
+            return None
+
+        try:
+            envelope = json.loads(raw[:rows_start] + b"]" + raw[rows_end:])["data"]
+        except (ValueError, KeyError, TypeError):
+            return None
+        # The split is only valid if it covered the top-level rows array and the
+        # workers cleaned with the dataset's eval configs.
+        if (
+            envelope.get("dataset_rows") != []
+            or envelope.get("development_eval_configs", []) != eval_configs
+        ):
+            return None
+
+        dataset_rows = []
+        for rows in row_chunks:
+            dataset_rows.extend(rows)
+        # The rows are already clean; only the envelope is left to format.
+        envelope["development_eval_configs"] = []
+        cleaned = Dataset._clean_response(envelope, response_format)
+        cleaned["dataset_rows"] = dataset_rows
+        return cleaned
+
+
+def _eval_configs(raw: bytes) -> List[Dict[str, Any]]:
+    match = _EVAL_CONFIGS_KEY.search(raw)
+    if match is None:
+        return []
+    decoder = json.JSONDecoder()
+    window = 1 << 16
+    while True:
+        text = raw[match.end() : match.end() + window].decode("utf-8", "replace")
+        try:
+            configs, _ = decoder.raw_decode(text)
+            return configs if isinstance(configs, list) else []
+        except ValueError:
+            if match.end() + window >= len(raw):
+                return []
+            window *= 4
+
+
+def _split(raw: bytes, rows_start: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits the page after the start of the rows array into `parts` nominal byte ranges.
+    """
+    step = max((len(raw) - rows_start) // parts, 1)
+    bounds = [rows_start + index * step for index in range(parts)] + [len(raw)]
+    return [
+        (start, stop) for start, stop in zip(bounds, bounds[1:]) if start < len(raw)
+    ]
+
+
+def _clean_slice(
+    memory_name: str,
+    start: int,
+    stop: int,
+    size: int,
+    first: bool,
+    eval_configs: List[Dict[str, Any]],
+    response_format: str,
+) -> Optional[Tuple[int, List[Dict[str, Any]], Optional[int], Optional[int]]]:
+    """
+    Decodes and cleans the rows that start in a byte range of a page in shared memory.
+
+    The `first` range starts right after the opening bracket of the rows array. Other
+    ranges start at the first candidate row boundary from which whole rows decode.
+    Rows are decoded until a row starts at or after `stop`, or the array ends. Only the
+    range and the end of the row that crosses `stop` are decoded from UTF-8: the text
+    past `stop` is extended (doubling) until that row decodes.
+
+    Returns:
+        `(first_row_offset, rows, next_row_offset, rows_end_offset)`, where exactly one
+        of the last two is set, or None if no rows could be decoded from the range.
+    """
+    from multiprocessing import shared_memory
+
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        start = _char_boundary(memory.buf, start, size)
+        if not first:
+            start = _boundary_start(memory.buf, start)
+        stop = _char_boundary(memory.buf, stop, size)
+        stop_char = len(bytes(memory.buf[start:stop]).decode("utf-8"))
+        extension = max((stop - start) // 8, 1 << 16)
+        while True:
+            end = _char_boundary(memory.buf, min(stop + extension, size), size)
+            text = bytes(memory.buf[start:end]).decode("utf-8")
+            run, begin = _find_run(text, first, stop_char)
+            # A failed run may only have been cut off by the end of the text.
+            if run is not None or end >= size:
+                break
+            extension *= 2
+    finally:
+        memory.close()
+
+    if run is None:
+        return None
+
+    rows, next_char, end_char = run
+
+    def offset(position: Optional[int]) -> Optional[int]:
+        if position is None:
+            return None
+        return start + len(text[:position].encode("utf-8"))
+
+    return (
+        offset(begin),
+        _clean_rows(rows, eval_configs, response_format),
+        offset(next_char),
+        offset(end_char),
+    )
+
+
+def _find_run(
+    text: str, first: bool, stop: int
+) -> Tuple[Optional[Tuple[List[Dict[str, Any]], Optional[int], Optional[int]]], int]:
+    """
+    Finds the position the rows of a range start at and decodes them.
+
+    Returns:
+        `(run, position)`, where `run` is the result of `_decode_run`, or None.
+    """
+    if first:
+        return _decode_run(text, 0, stop), 0
+    for candidate in _ROW_BOUNDARY_TEXT.finditer(text):
+        begin = candidate.end() - 1
+        if begin >= stop:
+            break
+        run = _decode_run(text, begin, stop)
+        if run is not None:
+            return run, begin
+    return None, 0
+
+
+def _decode_run(
+    text: str, position: int, stop: int
+) -> Optional[Tuple[List[Dict[str, Any]], Optional[int], Optional[int]]]:
+    """
+    Decodes consecutive rows from `position` until a row starts at or after `stop`
+    or the array ends.
+
+    Returns:
+        `(rows, next_row_position, rows_end_position)`, or None if the text at
+        `position` is not a sequence of rows.
+    """
+    decoder = json.JSONDecoder()
+    rows = []
+    position = _WHITESPACE.match(text, position).end()
+    try:
+        while not text.startswith("]", position):
+            row, position = decoder.raw_decode(text, position)
+            if not isinstance(row, dict):
+                return None
+            rows.append(row)
+            position = _WHITESPACE.match(text, position).end()
+            if text.startswith(",", position):
+                position = _WHITESPACE.match(text, position + 1).end()
+                if position >= stop:
+                    return rows, position, None
+            elif not text.startswith("]", position):
+                return None
+    except ValueError:
+        return None
+    # A list nested in the last column of a row looks like the end of the array
+    # when the run started inside that row.
+    if _ROW_CONTINUES.match(text, position + 1):
+        return None
+    return rows, None, position + 1
+
+
+def _boundary_start(buffer, position: int) -> int:
+    # A range that starts inside the boundary between two rows is moved back to the
+    # closing brace of the first row, so the boundary and the row after it are found.
+    back = position
+    comma = False
+    while back > 0:
+        byte = buffer[back - 1]
+        if byte in b" \t\r\n":
+            back -= 1
+        elif byte == ord(",") and not comma:
+            comma = True
+            back -= 1
+        else:
+            break
+    if back > 0 and buffer[back - 1] == ord("}"):
+        return back - 1
+    return position
+
+
+def _char_boundary(buffer, position: int, size: int) -> int:
+    # Move past UTF-8 continuation bytes so that the range decodes on its own.
+    while position < size and 0x80 <= buffer[position] < 0xC0:
+        position += 1
+    return position
@@ -0,0 +1,276 @@
+import bisect
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from athina_client.constants import MAX_DATASET_ROWS
+from athina_client.utils import atomic_write
+from .dataset import Dataset
+
+if TYPE_CHECKING:
+    from .cache import DatasetCache
+
+_MAGIC = b"ATHSNAP1"
+_FOOTER_LENGTH = struct.Struct("<Q")
+
+
+class DatasetSnapshot:
+    """
+    Read-only, memory-mapped snapshot of a fetched dataset.
+
+    The file is laid out column by column: a row number index followed, for
+    every column, by an offsets table and the JSON-encoded cells it points
+    into. A JSON footer describes the layout. Opening a snapshot only maps the
+    file, so any number of worker processes can open the same snapshot and
+    share its pages through the OS page cache; cells are decoded on access.
+
+    Snapshots pickle by path, which makes them cheap to hand to a process pool.
+
+    Example:
+        ```python
+        DatasetSnapshot.export("dataset-123", "/tmp/dataset-123.snap")
+
+        # in every worker process
+        with DatasetSnapshot.open("/tmp/dataset-123.snap") as snapshot:
+            row = snapshot.get_row(42)
+        ```
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._casts: List[memoryview] = []
+        self._row_nos = None
+        self._columns = {}
+        try:
+            self._read_footer()
+        except BaseException:
+            # Unmaps the file before the error propagates.
+            self.close()
+            raise
+
+    def _read_footer(self):
+        path = self.path
+        if bytes(self._view[:8]) != _MAGIC or bytes(self._view[-8:]) != _MAGIC:
+            raise ValueError(f"{path} is not a dataset snapshot")
+        footer_length = _FOOTER_LENGTH.unpack_from(self._view, len(self._view) - 16)[0]
+        footer_start = len(self._view) - 16 - footer_length
+        try:
+            footer = json.loads(
+                bytes(self._view[footer_start : footer_start + footer_length])
+            )
+        except ValueError:
+            raise ValueError(f"{path} has a corrupt dataset snapshot footer")
+        if footer["byteorder"] != sys.byteorder:
+            raise ValueError(
+                f"{path} was written on a machine with a different byte order"
+            )
+
+        self.dataset: Dict[str, Any] = footer["dataset"]
+        self.extra: Dict[str, Any] = footer["extra"]
+        self.columns: List[str] = [column["name"] for column in footer["columns"]]
+        self._num_rows: int = footer["num_rows"]
+        self._row_nos = self._cast(footer["row_nos"], self._num_rows, "q")
+        self._columns = {
+            column["name"]: (
+                self._cast(column["offsets"], self._num_rows + 1, "Q"),
+                column["data"],
+            )
+            for column in footer["columns"]
+        }
+
+    @staticmethod
+    def open(path: str) -> "DatasetSnapshot":
+        """
+        Opens a snapshot file read-only.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            DatasetSnapshot: The memory-mapped snapshot.
+        """
+        return DatasetSnapshot(path)
+
+    @staticmethod
+    def export(
+        dataset_id: str,
+        path: str,
+        response_format: Optional[str] = "flat",
+        include_dataset_annotations: Optional[bool] = False,
+        cache: Optional["DatasetCache"] = None,
+    ) -> "DatasetSnapshot":
+        """
+        Fetches a dataset and writes it to a snapshot file.
+
+        Args:
+            dataset_id (str): The ID of the dataset to export.
+            path (str): Path of the snapshot file to write.
+            response_format (Optional[str]): The format of the rows, either 'flat' or 'detailed'. Defaults to 'flat'.
+            include_dataset_annotations (Optional[bool]): Whether to include dataset annotations. Defaults to False.
+            cache (Optional[DatasetCache]): Local cache to fetch the dataset through. Defaults to None.
+
+        Returns:
+            DatasetSnapshot: The opened snapshot.
+        """
+        dataset = Dataset.get_dataset_by_id(
+            dataset_id,
+            limit=MAX_DATASET_ROWS,
+            response_format=response_format,
+            include_dataset_annotations=include_dataset_annotations,
+            cache=cache,
+        )
+        DatasetSnapshot.write(path, dataset)
+        return DatasetSnapshot.open(path)
+
+    @staticmethod
+    def write(path: str, dataset: Dict[str, Any]):
+        """
+        Writes an already fetched dataset (as returned by `Dataset.get_dataset_by_id`) to a snapshot file.
+
+        Args:
+            path (str): Path of the snapshot file to write.
+            dataset (Dict[str, Any]): The cleaned dataset response.
+        """
+        rows = dataset.get("dataset_rows", [])
+        columns: Dict[str, None] = {}
+        for row in rows:
+            for key in row:
+                columns.setdefault(key, None)
+
+        with atomic_write(path) as f:
+            f.write(_MAGIC)
+            row_nos = array(
+                "q",
+                (row.get("row_no", index + 1) for index, row in enumerate(rows)),
+            )
+            footer = {
+                "byteorder": sys.byteorder,
+                "num_rows": len(rows),
+                "dataset": dataset.get("dataset", {}),
+                "extra": {
+                    key: value
+                    for key, value in dataset.items()
+                    if key not in ("dataset", "dataset_rows")
+                },
+                "row_nos": _write_array(f, row_nos),
+                "columns": [],
+            }
+            for name in columns:
+                # Missing cells are stored as empty slices, which no JSON value encodes to.
+                cells = [
+                    json.dumps(row[name]).encode("utf-8") if name in row else b""
+                    for row in rows
+                ]
+                offsets = array("Q", [0])
+                for cell in cells:
+                    offsets.append(offsets[-1] + len(cell))
+                column = {"name": name, "offsets": _write_array(f, offsets)}
+                column["data"] = f.tell()
+                f.write(b"".join(cells))
+                footer["columns"].append(column)
+
+            encoded_footer = json.dumps(footer).encode("utf-8")
+            f.write(encoded_footer)
+            f.write(_FOOTER_LENGTH.pack(len(encoded_footer)))
+            f.write(_MAGIC)
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """
+        Returns the row at a zero-based position.
+        """
+        if index < 0:
+            index += self._num_rows
+        if not 0 <= index < self._num_rows:
+            raise IndexError("snapshot row index out of range")
+        row = {}
+        for name, (offsets, data) in self._columns.items():
+            start, end = offsets[index], offsets[index + 1]
+            if start != end:
+                row[name] = json.loads(bytes(self._view[data + start : data + end]))
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._num_rows):
+            yield self[index]
+
+    def get_row(self, row_no: int) -> Dict[str, Any]:
+        """
+        Returns the row with the given `row_no`.
+
+        Args:
+            row_no (int): The row number (1-based, as used by `Dataset.update_cells`).
+
+        Raises:
+            KeyError: If the snapshot has no row with that number.
+        """
+        index = bisect.bisect_left(self._row_nos, row_no)
+        if index < self._num_rows and self._row_nos[index] == row_no:
+            return self[index]
+        # Row numbers are normally ascending; fall back to a scan when they are not.
+        for index, candidate in enumerate(self._row_nos):
+            if candidate == row_no:
+                return self[index]
+        raise KeyError(row_no)
+
+    def column(self, name: str) -> Iterator[Any]:
+        """
+        Iterates over the values of a single column without decoding any other column.
+
+        Args:
+            name (str): The column name.
+        """
+        offsets, data = self._columns[name]
+        for index in range(self._num_rows):
+            start, end = offsets[index], offsets[index + 1]
+            yield (
+                json.loads(bytes(self._view[data + start : data + end]))
+                if start != end
+                else None
+            )
+
+    def close(self):
+        """
+        Unmaps the snapshot file.
+        """
+        self._row_nos = None
+        self._columns = {}
+        for view in self._casts:
+            view.release()
+        self._casts = []
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        self._mmap.close()
+
+    def __enter__(self) -> "DatasetSnapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        return (DatasetSnapshot.open, (self.path,))
+
+    def _cast(self, position: int, count: int, typecode: str) -> memoryview:
+        size = array(typecode).itemsize
+        view = self._view[position : position + count * size].cast(typecode)
+        self._casts.append(view)
+        return view
+
+
+def _write_array(f, values: array) -> int:
+    # Align arrays so that the memory-mapped views can be cast in place.
+    padding = -f.tell() % values.itemsize
+    f.write(b"\0" * padding)
+    position = f.tell()
+    values.tofile(f)
+    return position
@@ -0,0 +1,233 @@
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+from athina_client.errors import DatasetValidationException
+
+DEFAULT_MAX_CELL_BYTES = 1_000_000
+DEFAULT_MAX_ROW_BYTES = 4_000_000
+
+_encode = json.JSONEncoder(
+    ensure_ascii=False, allow_nan=False, separators=(",", ":")
+).encode
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    name: str
+    types: FrozenSet[str]
+    required: bool
+
+
+@dataclass
+class DatasetSchema:
+    """
+    Columns of a dataset and the JSON types of their values.
+
+    A column is required if it is present and not null in every sampled row.
+    """
+
+    columns: Dict[str, ColumnSchema]
+
+    @staticmethod
+    def infer(rows: Iterable[Dict[str, Any]]) -> "DatasetSchema":
+        """
+        Infers the schema of the given rows.
+        """
+        types: Dict[str, set] = {}
+        present: Dict[str, int] = {}
+        sampled = 0
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            sampled += 1
+            for name, value in row.items():
+                if value is None:
+                    types.setdefault(name, set())
+                    continue
+                types.setdefault(name, set()).add(_json_type(value))
+                present[name] = present.get(name, 0) + 1
+        return DatasetSchema(
+            columns={
+                name: ColumnSchema(
+                    name=name,
+                    types=frozenset(column_types),
+                    required=present.get(name, 0) == sampled,
+                )
+                for name, column_types in types.items()
+            }
+        )
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    row: int
+    code: str
+    message: str
+    column: Optional[str] = None
+
+
+@dataclass
+class ValidationReport:
+    """
+    Outcome of validating rows against a schema.
+
+    Every problem is counted in `counts` (by issue code); only the first
+    `max_issues` are kept in `issues`.
+    """
+
+    schema: DatasetSchema
+    rows_checked: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def issue_count(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def ok(self) -> bool:
+        return not self.counts
+
+    def raise_for_issues(self):
+        """
+        Raises:
+            DatasetValidationException: If any problem was found.
+        """
+        if not self.ok:
+            raise DatasetValidationException(self)
+
+    def __str__(self) -> str:
+        if self.ok:
+            return f"{self.rows_checked} rows checked, no problems found"
+        lines = [f"{self.issue_count} problems found in {self.rows_checked} rows:"]
+        for issue in self.issues:
+            lines.append(f"  row {issue.row}: {issue.message}")
+        if len(self.issues) < self.issue_count:
+            lines.append(f"  ... and {self.issue_count - len(self.issues)} more")
+        return "\n".join(lines)
+
+
+def validate_rows(
+    rows: Iterable[Dict[str, Any]],
+    schema: Optional[DatasetSchema] = None,
+    sample_size: int = 100,
+    max_cell_bytes: Optional[int] = DEFAULT_MAX_CELL_BYTES,
+    max_row_bytes: Optional[int] = DEFAULT_MAX_ROW_BYTES,
+    max_issues: int = 1000,
+) -> ValidationReport:
+    """
+    Checks rows before they are uploaded, in a single streaming pass.
+
+    Unless a schema is given, it is inferred from the first `sample_size` rows.
+    Every row is then checked for being a JSON object without the '__id' key,
+    for missing required and unexpected columns, for values whose JSON type
+    differs from the schema, for values that cannot be serialized to JSON
+    (including NaN and infinity) and for the serialized size of every cell and row.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): The rows to check, e.g. from `read_rows`.
+        schema (Optional[DatasetSchema]): The expected schema. Inferred if not given.
+        sample_size (int): Number of rows the schema is inferred from. Defaults to 100.
+        max_cell_bytes (Optional[int]): Maximum size of a serialized cell. None disables the check.
+        max_row_bytes (Optional[int]): Maximum size of a serialized row. None disables the check.
+        max_issues (int): Maximum number of issues kept in the report. Defaults to 1000.
+
+    Returns:
+        ValidationReport: The problems found, with the (0-based) index of their row.
+    """
+    rows = iter(rows)
+    sample: List[Dict[str, Any]] = []
+    if schema is None:
+        sample = list(itertools.islice(rows, sample_size))
+        schema = DatasetSchema.infer(sample)
+
+    report = ValidationReport(schema=schema)
+    columns = schema.columns
+    required = [column.name for column in columns.values() if column.required]
+    issues = report.issues
+    counts = report.counts
+    key_bytes: Dict[str, int] = {}
+
+    def add(row_index: int, code: str, message: str, column: Optional[str] = None):
+        counts[code] = counts.get(code, 0) + 1
+        if len(issues) < max_issues:
+            issues.append(ValidationIssue(row_index, code, message, column))
+
+    for index, row in enumerate(itertools.chain(sample, rows)):
+        report.rows_checked += 1
+        if not isinstance(row, dict):
+            add(index, "not_an_object", f"expected an object, got {_json_type(row)}")
+            continue
+        if "__id" in row:
+            add(index, "forbidden_key", "the '__id' key is reserved", "__id")
+        for name in required:
+            if row.get(name) is None:
+                add(index, "missing_column", f"missing column '{name}'", name)
+
+        row_bytes = 2 + max(len(row) - 1, 0)
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                if name != "__id":
+                    add(
+                        index,
+                        "unexpected_column",
+                        f"unexpected column '{name}'",
+                        name,
+                    )
+            elif value is not None and column.types:
+                value_type = _json_type(value)
+                if value_type not in column.types:
+                    expected = " or ".join(sorted(column.types))
+                    add(
+                        index,
+                        "type_mismatch",
+                        f"column '{name}' is {value_type}, expected {expected}",
+                        name,
+                    )
+            try:
+                cell_bytes = len(_encode(value).encode("utf-8"))
+            except (TypeError, ValueError) as e:
+                add(
+                    index,
+                    "not_serializable",
+                    f"column '{name}' is not JSON serializable: {e}",
+                    name,
+                )
+                continue
+            if max_cell_bytes is not None and cell_bytes > max_cell_bytes:
+                add(
+                    index,
+                    "cell_too_large",
+                    f"column '{name}' is {cell_bytes} bytes, limit is {max_cell_bytes}",
+                    name,
+                )
+            name_bytes = key_bytes.get(name)
+            if name_bytes is None:
+                name_bytes = key_bytes[name] = len(_encode(name).encode("utf-8"))
+            row_bytes += name_bytes + 1 + cell_bytes
+        if max_row_bytes is not None and row_bytes > max_row_bytes:
+            add(
+                index,
+                "row_too_large",
+                f"row is {row_bytes} bytes, limit is {max_row_bytes}",
+            )
+    return report
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return type(value).__name__
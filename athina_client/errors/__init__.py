@@ -1,3 +1,13 @@
-from .exceptions import CustomException, NoAthinaApiKeyException
+from .exceptions import (
+    CustomException,
+    DatasetValidationException,
+    NoAthinaApiKeyException,
+    PayloadTooLargeException,
+)
 
-__all__ = ["CustomException", "NoAthinaApiKeyException"]
+__all__ = [
+    "CustomException",
+    "DatasetValidationException",
+    "NoAthinaApiKeyException",
+    "PayloadTooLargeException",
+]
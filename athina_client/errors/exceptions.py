@@ -19,3 +19,17 @@ class CustomException(Exception):
 class NoAthinaApiKeyException(CustomException):
     def __init__(self, message: str = AthinaMessages.SIGN_UP_FOR_BEST_EXPERIENCE):
         super().__init__(message)
+
+
+class DatasetValidationException(CustomException):
+    def __init__(self, report):
+        self.report = report
+        super().__init__(
+            f"{report.issue_count} problems found in {report.rows_checked} rows",
+            report.counts,
+        )
+
+
+class PayloadTooLargeException(CustomException):
+    def __init__(self, message: str = "The request body is too large."):
+        super().__init__(message)
@@ -0,0 +1,36 @@
+from .events import ApiCallEvent
+from .instrumentation import Instrumentation
+from .profiling import Profiler, Profiling, enable_from_env
+from .tracing import Tracing, traced
+
+__all__ = [
+    "ApiCallEvent",
+    "HistogramCollector",
+    "Instrumentation",
+    "LoggingCollector",
+    "OpenTelemetryTracer",
+    "Profiler",
+    "Profiling",
+    "Tracing",
+    "disable_opentelemetry",
+    "enable_from_env",
+    "enable_opentelemetry",
+    "traced",
+]
+
+# Collectors and the OpenTelemetry integration are loaded on first use.
+_LAZY_ATTRIBUTES = {
+    "HistogramCollector": ".collectors",
+    "LoggingCollector": ".collectors",
+    "OpenTelemetryTracer": ".otel",
+    "disable_opentelemetry": ".otel",
+    "enable_opentelemetry": ".otel",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
@@ -0,0 +1,141 @@
+import bisect
+import logging
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .events import ApiCallEvent
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class LoggingCollector:
+    """
+    Logs one line per API call through the standard `logging` module.
+    """
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG
+    ):
+        self.logger = logger or logging.getLogger("athina_client.api")
+        self.level = level
+
+    def __call__(self, event: ApiCallEvent):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        self.logger.log(
+            self.level,
+            "%s %s %s status=%s total=%.1fms ttfb=%s sent=%dB received=%dB retries=%d%s",
+            event.operation,
+            event.method,
+            event.endpoint,
+            event.status_code,
+            event.total_time * 1000,
+            (
+                f"{event.time_to_first_byte * 1000:.1f}ms"
+                if event.time_to_first_byte is not None
+                else "n/a"
+            ),
+            event.request_bytes,
+            event.response_bytes,
+            event.retries,
+            f" error={event.error}" if event.error else "",
+        )
+
+
+class HistogramCollector:
+    """
+    Aggregates API calls in memory, per operation.
+
+    Latencies go into fixed buckets (upper bounds in seconds), so memory use does
+    not grow with the number of calls.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, event: ApiCallEvent):
+        bucket = bisect.bisect_left(self.buckets, event.total_time)
+        with self._lock:
+            stats = self._stats.get(event.operation)
+            if stats is None:
+                stats = self._stats[event.operation] = {
+                    "count": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                    "retries": 0,
+                    "errors": 0,
+                    "status_codes": {},
+                    "buckets": [0] * (len(self.buckets) + 1),
+                }
+            stats["count"] += 1
+            stats["total_time"] += event.total_time
+            stats["max_time"] = max(stats["max_time"], event.total_time)
+            stats["request_bytes"] += event.request_bytes
+            stats["response_bytes"] += event.response_bytes
+            stats["retries"] += 1 if event.retries else 0
+            if event.error:
+                stats["errors"] += 1
+            status_codes = stats["status_codes"]
+            status_codes[event.status_code] = status_codes.get(event.status_code, 0) + 1
+            stats["buckets"][bucket] += 1
+
+    def percentile(self, operation: str, q: float) -> Optional[float]:
+        """
+        Returns the upper bound of the bucket containing the q-th percentile (0-100) of an operation's latency.
+        """
+        with self._lock:
+            stats = self._stats.get(operation)
+            if not stats:
+                return None
+            counts = list(stats["buckets"])
+            max_time = stats["max_time"]
+        rank = q / 100 * sum(counts)
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets[index] if index < len(self.buckets) else max_time
+        return max_time
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a copy of the aggregated statistics, keyed by operation.
+        """
+        with self._lock:
+            snapshot = {
+                operation: {
+                    **stats,
+                    "status_codes": dict(stats["status_codes"]),
+                    "buckets": list(zip(self._bucket_labels(), stats["buckets"])),
+                }
+                for operation, stats in self._stats.items()
+            }
+        for operation, stats in snapshot.items():
+            stats["mean_time"] = stats["total_time"] / stats["count"]
+            stats["p50"] = self.percentile(operation, 50)
+            stats["p99"] = self.percentile(operation, 99)
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def _bucket_labels(self) -> Tuple[float, ...]:
+        return self.buckets + (float("inf"),)
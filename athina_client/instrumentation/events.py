@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ApiCallEvent:
+    """
+    A single HTTP exchange with the Athina API.
+
+    Every attempt emits its own event, so a call that is retried once produces
+    two events, the second with `retries=1`. Timings are in seconds; phases the
+    HTTP backend does not expose (DNS lookup, connect) are None.
+    """
+
+    operation: str
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    total_time: float
+    time_to_first_byte: Optional[float] = None
+    dns_time: Optional[float] = None
+    connect_time: Optional[float] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    error: Optional[str] = None
@@ -0,0 +1,44 @@
+from abc import ABC
+from typing import Callable, List
+
+from .events import ApiCallEvent
+
+
+class Instrumentation(ABC):
+    """
+    Registry of collectors notified after every Athina API call.
+
+    A collector is any callable taking an `ApiCallEvent`. Collectors run on the
+    calling thread, so they should be cheap; exceptions raised by a collector are
+    logged and never affect the API call itself.
+    """
+
+    _collectors: List[Callable[[ApiCallEvent], None]] = []
+
+    @classmethod
+    def add_collector(cls, collector: Callable[[ApiCallEvent], None]):
+        cls._collectors = cls._collectors + [collector]
+
+    @classmethod
+    def remove_collector(cls, collector: Callable[[ApiCallEvent], None]):
+        cls._collectors = [c for c in cls._collectors if c is not collector]
+
+    @classmethod
+    def clear(cls):
+        cls._collectors = []
+
+    @classmethod
+    def is_enabled(cls):
+        return bool(cls._collectors)
+
+    @classmethod
+    def emit(cls, event: ApiCallEvent):
+        for collector in cls._collectors:
+            try:
+                collector(event)
+            except Exception:
+                import logging
+
+                logging.getLogger(__name__).exception(
+                    "Instrumentation collector %r failed", collector
+                )
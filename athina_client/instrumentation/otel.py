@@ -0,0 +1,133 @@
+from contextlib import contextmanager
+from typing import Any, Dict
+
+from .events import ApiCallEvent
+from .instrumentation import Instrumentation
+from .tracing import Tracing
+
+
+class OpenTelemetryTracer:
+    """
+    Reports SDK calls to OpenTelemetry.
+
+    Creates a span per SDK entry point (`Dataset.*`, `Prompt.*`, `Slug.*`) with a
+    client span per HTTP call underneath, injects trace-context headers into
+    outgoing requests, and records request duration, in-flight requests and
+    payload sizes as metrics. Use `enable_opentelemetry` to install it.
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        try:
+            from opentelemetry import metrics, propagate, trace
+            from opentelemetry.trace import SpanKind, Status, StatusCode
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetry support requires opentelemetry-api. "
+                "Install it with `pip install opentelemetry-api`."
+            )
+        self._trace = trace
+        self._propagate = propagate
+        self._span_kind = SpanKind
+        self._status = Status
+        self._status_code = StatusCode
+        self._tracer = trace.get_tracer(
+            "athina_client", tracer_provider=tracer_provider
+        )
+        meter = metrics.get_meter("athina_client", meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "athina.client.request.duration",
+            unit="s",
+            description="Duration of Athina API requests.",
+        )
+        self._in_flight = meter.create_up_down_counter(
+            "athina.client.requests.in_flight",
+            description="Number of Athina API requests in flight.",
+        )
+        self._request_size = meter.create_histogram(
+            "athina.client.request.body.size",
+            unit="By",
+            description="Size of Athina API request bodies.",
+        )
+        self._response_size = meter.create_histogram(
+            "athina.client.response.body.size",
+            unit="By",
+            description="Size of Athina API response bodies.",
+        )
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]):
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    @contextmanager
+    def http_span(
+        self, operation: str, method: str, endpoint: str, headers: Dict[str, str]
+    ):
+        attributes = {"athina.operation": operation, "http.request.method": method}
+        with self._tracer.start_as_current_span(
+            f"{method} {operation}",
+            kind=self._span_kind.CLIENT,
+            attributes={**attributes, "url.full": endpoint},
+        ) as span:
+            self._propagate.inject(headers)
+            self._in_flight.add(1, attributes)
+            try:
+                yield span
+            finally:
+                self._in_flight.add(-1, attributes)
+
+    def __call__(self, event: ApiCallEvent):
+        attributes = {
+            "athina.operation": event.operation,
+            "http.request.method": event.method,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error:
+            attributes["error.type"] = event.error
+        self._duration.record(event.total_time, attributes)
+        self._request_size.record(event.request_bytes, attributes)
+        self._response_size.record(event.response_bytes, attributes)
+
+        # Collectors run inside the HTTP span of the call.
+        span = self._trace.get_current_span()
+        span.set_attributes(
+            {
+                **attributes,
+                "athina.retries": event.retries,
+                "http.request.body.size": event.request_bytes,
+                "http.response.body.size": event.response_bytes,
+            }
+        )
+        if event.error or (event.status_code or 0) >= 400:
+            span.set_status(self._status(self._status_code.ERROR, event.error))
+
+
+def enable_opentelemetry(
+    tracer_provider=None, meter_provider=None
+) -> OpenTelemetryTracer:
+    """
+    Starts reporting SDK calls to OpenTelemetry.
+
+    Args:
+        tracer_provider: Tracer provider to use. Defaults to the global provider.
+        meter_provider: Meter provider to use. Defaults to the global provider.
+
+    Returns:
+        OpenTelemetryTracer: The installed tracer.
+    """
+    disable_opentelemetry()
+    tracer = OpenTelemetryTracer(tracer_provider, meter_provider)
+    Tracing.set_tracer(tracer)
+    Instrumentation.add_collector(tracer)
+    return tracer
+
+
+def disable_opentelemetry():
+    """
+    Stops reporting SDK calls to OpenTelemetry.
+    """
+    tracer = Tracing.get_tracer()
+    if isinstance(tracer, OpenTelemetryTracer):
+        Tracing.set_tracer(None)
+        Instrumentation.remove_collector(tracer)
@@ -0,0 +1,343 @@
+import contextvars
+import io
+import os
+import re
+import sys
+import threading
+import time
+from abc import ABC
+from contextlib import nullcontext
+from typing import Dict, List, Optional, TextIO, Tuple
+
+PHASES = ("serialize", "wait", "send", "decode", "clean", "construct")
+
+_SDK_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_NULL_CONTEXT = nullcontext()
+
+# SDK entry point (`traced` name) the current code runs under.
+_operation: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "athina_profiled_operation", default="untraced"
+)
+# Whether the current thread is inside a phase; nested phases count towards the outer one.
+_phase_state = threading.local()
+
+
+class Profiler:
+    """
+    Records where the wall time of SDK calls goes.
+
+    Every call of an SDK entry point such as `Prompt.run` or
+    `Dataset.get_dataset_by_id` is timed, together with the time it spends
+    in each phase:
+
+    - `serialize`: encoding request bodies and batch idempotency keys as JSON
+    - `wait`: sending the request until the response headers arrived, as
+      reported by the transport (time to first byte)
+    - `send`: the rest of the HTTP exchange, mostly reading the response body
+    - `decode`: decoding JSON responses
+    - `clean`: cleaning dataset pages (`_clean_response`, `ParallelCleaner`)
+    - `construct`: building `Prompt`, `PromptExecution`, `Slug` and `Dataset` objects
+
+    Time not spent in any of them is reported as `other`. Phases running on
+    worker threads (e.g. parallel uploads) are attributed to the SDK call that
+    started them, so their sum can exceed the wall time of the call.
+
+    With `cprofile`, the thread that starts the profiler is also profiled with
+    cProfile; with `tracemalloc`, allocations are traced. Both reports are
+    restricted to SDK code.
+
+    Profiling can also be enabled for a whole process with the `ATHINA_PROFILE`
+    environment variable, e.g. `ATHINA_PROFILE=1` or
+    `ATHINA_PROFILE=cprofile,tracemalloc`, which is honoured when the
+    application calls `athina_client.instrumentation.enable_from_env()` (the
+    `athina-client` command does); the report is then printed at exit.
+
+    Example:
+        ```python
+        with Profiler(tracemalloc=True):
+            Dataset.get_dataset_by_id("dataset-123")
+            Prompt.run("support-answer", {"query": "..."})
+        # The report is printed to stderr when the block exits.
+        ```
+    """
+
+    def __init__(
+        self,
+        cprofile: bool = False,
+        tracemalloc: bool = False,
+        top: int = 20,
+        stream: Optional[TextIO] = None,
+        print_report: bool = True,
+    ):
+        """
+        Args:
+            cprofile (bool): Also profile the calling thread with cProfile. Defaults to False.
+            tracemalloc (bool): Also trace memory allocations. Defaults to False.
+            top (int): Number of functions and allocation sites in the report. Defaults to 20.
+            stream (Optional[TextIO]): Where the report is printed. Defaults to stderr.
+            print_report (bool): Print the report when the profiler stops. Defaults to True.
+        """
+        self.cprofile = cprofile
+        self.tracemalloc = tracemalloc
+        self.top = top
+        self.stream = stream
+        self.print_report = print_report
+        self._lock = threading.Lock()
+        self._calls: Dict[str, List[float]] = {}
+        self._phases: Dict[Tuple[str, str], float] = {}
+        self._profile = None
+        self._started_tracemalloc = False
+        self._snapshot = None
+        self._peak_memory = 0
+        self._running = False
+
+    def start(self) -> "Profiler":
+        if self._running:
+            return self
+        self._running = True
+        if self.tracemalloc:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+        if self.cprofile:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        Profiling._push(self)
+        return self
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        Profiling._remove(self)
+        if self._profile is not None:
+            self._profile.disable()
+        if self.tracemalloc:
+            import tracemalloc
+
+            self._snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(True, os.path.join(_SDK_DIRECTORY, "*"))]
+            )
+            self._peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        if self.print_report:
+            stream = self.stream or sys.stderr
+            stream.write(self.report())
+            stream.flush()
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def record_call(self, operation: str, seconds: float):
+        with self._lock:
+            totals = self._calls.setdefault(operation, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+
+    def record_phase(self, operation: str, phase: str, seconds: float):
+        with self._lock:
+            key = (operation, phase)
+            self._phases[key] = self._phases.get(key, 0.0) + seconds
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns, per SDK operation, the number of calls, their total wall time
+        and the total time of every phase, in seconds.
+        """
+        with self._lock:
+            operations = sorted(
+                set(self._calls) | {operation for operation, _ in self._phases}
+            )
+            stats = {}
+            for operation in operations:
+                calls, total = self._calls.get(operation, (0, 0.0))
+                entry = {"calls": calls, "total": total}
+                for phase in PHASES:
+                    entry[phase] = self._phases.get((operation, phase), 0.0)
+                entry["other"] = max(total - sum(entry[p] for p in PHASES), 0.0)
+                stats[operation] = entry
+            return stats
+
+    def report(self) -> str:
+        """
+        Returns the report as text: time per SDK operation and phase in milliseconds,
+        followed by the cProfile and tracemalloc reports if enabled.
+        """
+        out = io.StringIO()
+        columns = PHASES + ("other",)
+        out.write("\nAthina SDK profile (wall time in ms)\n")
+        out.write(
+            f"{'operation':<32} {'calls':>6} {'total':>10}"
+            + "".join(f" {column:>10}" for column in columns)
+            + "\n"
+        )
+        for operation, entry in self.stats().items():
+            out.write(
+                f"{operation:<32} {entry['calls']:>6} {entry['total'] * 1000:>10.1f}"
+                + "".join(f" {entry[column] * 1000:>10.1f}" for column in columns)
+                + "\n"
+            )
+        if self._profile is not None:
+            import pstats
+
+            out.write("\ncProfile of SDK functions (by cumulative time)\n")
+            stats = pstats.Stats(self._profile, stream=out)
+            # `print_stats` restrictions are regular expressions.
+            stats.sort_stats("cumulative").print_stats(
+                re.escape(_SDK_DIRECTORY), self.top
+            )
+        if self._snapshot is not None:
+            out.write(
+                f"\nLargest allocations by SDK code still alive "
+                f"(peak traced memory {self._peak_memory / 1e6:.1f} MB)\n"
+            )
+            for statistic in self._snapshot.statistics("lineno")[: self.top]:
+                frame = statistic.traceback[0]
+                out.write(
+                    f"{statistic.size / 1024:>10.1f} KiB {statistic.count:>8} blocks"
+                    f"  {os.path.relpath(frame.filename, _SDK_DIRECTORY)}:{frame.lineno}\n"
+                )
+        return out.getvalue()
+
+
+class Profiling(ABC):
+    """
+    Holder of the active `Profiler`, used by the SDK to report calls and phases.
+
+    The active profiler is the most recently started one still running, so
+    profilers may be stopped in any order. Without an active profiler, `call`
+    and `phase` return a shared no-op context manager.
+    """
+
+    _profiler: Optional[Profiler] = None
+    _running: List[Profiler] = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def _push(cls, profiler: Profiler):
+        with cls._lock:
+            cls._running.append(profiler)
+            cls._profiler = profiler
+
+    @classmethod
+    def _remove(cls, profiler: Profiler):
+        with cls._lock:
+            if profiler in cls._running:
+                cls._running.remove(profiler)
+            cls._profiler = cls._running[-1] if cls._running else None
+
+    @classmethod
+    def reset(cls):
+        """
+        Forgets all running profilers without stopping them.
+        """
+        with cls._lock:
+            cls._running = []
+            cls._profiler = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._profiler is not None
+
+    @classmethod
+    def call(cls, operation: str):
+        """
+        Context manager timing a call of the SDK entry point `operation`.
+        """
+        profiler = cls._profiler
+        if profiler is None:
+            return _NULL_CONTEXT
+        return _Call(profiler, operation)
+
+    @classmethod
+    def phase(cls, phase: str):
+        """
+        Context manager timing a phase of the current SDK call.
+        """
+        profiler = cls._profiler
+        if profiler is None:
+            return _NULL_CONTEXT
+        return _Phase(profiler, phase)
+
+    @classmethod
+    def record(cls, phase: str, seconds: float):
+        """
+        Adds time measured elsewhere to a phase of the current SDK call.
+        """
+        profiler = cls._profiler
+        if profiler is not None:
+            profiler.record_phase(_operation.get(), phase, seconds)
+
+
+class _Call:
+    __slots__ = ("profiler", "operation", "token", "start")
+
+    def __init__(self, profiler: Profiler, operation: str):
+        self.profiler = profiler
+        self.operation = operation
+
+    def __enter__(self):
+        self.token = _operation.set(self.operation)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.profiler.record_call(self.operation, time.perf_counter() - self.start)
+        _operation.reset(self.token)
+
+
+class _Phase:
+    __slots__ = ("profiler", "phase", "start", "outermost")
+
+    def __init__(self, profiler: Profiler, phase: str):
+        self.profiler = profiler
+        self.phase = phase
+
+    def __enter__(self):
+        self.outermost = not getattr(_phase_state, "active", False)
+        if self.outermost:
+            _phase_state.active = True
+            self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        if self.outermost:
+            _phase_state.active = False
+            self.profiler.record_phase(
+                _operation.get(), self.phase, time.perf_counter() - self.start
+            )
+
+
+def enable_from_env() -> Optional[Profiler]:
+    """
+    Starts a profiler configured by the `ATHINA_PROFILE` environment variable,
+    reported at exit. Worker processes of the SDK are not profiled.
+
+    Importing the SDK never starts a profiler; applications that want to honour
+    `ATHINA_PROFILE` call this once at startup.
+
+    Returns:
+        Optional[Profiler]: The started profiler, or None if `ATHINA_PROFILE` is unset or disabled.
+    """
+    value = os.environ.get("ATHINA_PROFILE", "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return None
+    import multiprocessing
+
+    if multiprocessing.parent_process() is not None:
+        return None
+    options = {option.strip() for option in value.split(",")}
+    profiler = Profiler(
+        cprofile="cprofile" in options, tracemalloc="tracemalloc" in options
+    )
+    import atexit
+
+    atexit.register(profiler.stop)
+    return profiler.start()
@@ -0,0 +1,63 @@
+import functools
+from abc import ABC
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
+
+from .profiling import Profiling
+
+
+class Tracing(ABC):
+    """
+    Holder of the tracer used to wrap SDK entry points and API calls in spans.
+
+    A tracer provides two context managers, `span(name, attributes)` and
+    `http_span(operation, method, endpoint, headers)`; the latter may add
+    propagation headers to `headers`. Without a tracer both are no-ops.
+    """
+
+    _tracer = None
+
+    @classmethod
+    def set_tracer(cls, tracer):
+        cls._tracer = tracer
+
+    @classmethod
+    def get_tracer(cls):
+        return cls._tracer
+
+    @classmethod
+    def is_set(cls):
+        return cls._tracer is not None
+
+    @classmethod
+    def span(cls, name: str, attributes: Optional[Dict[str, Any]] = None):
+        if cls._tracer is None:
+            return nullcontext()
+        return cls._tracer.span(name, attributes or {})
+
+    @classmethod
+    def http_span(
+        cls, operation: str, method: str, endpoint: str, headers: Dict[str, str]
+    ):
+        if cls._tracer is None:
+            return nullcontext()
+        return cls._tracer.http_span(operation, method, endpoint, headers)
+
+
+def traced(name: str):
+    """
+    Decorator running the wrapped function inside a span named `name` when tracing is enabled,
+    and timing it as the SDK operation `name` when a `Profiler` is active.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if Tracing._tracer is None and Profiling._profiler is None:
+                return func(*args, **kwargs)
+            with Tracing.span(name), Profiling.call(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,3 +1,28 @@
-from .prompt import Prompt, Slug
+from .prompt import Prompt, Slug, SlugUpdateResult
+from .usage import PromptUsage, UsageAccumulator
 
-__all__ = ["Prompt", "Slug"]
+__all__ = [
+    "Prompt",
+    "PromptResultCache",
+    "PromptUsage",
+    "PromptVersionStore",
+    "Slug",
+    "SlugCatalog",
+    "SlugUpdateResult",
+    "UsageAccumulator",
+]
+
+# Caches and stores are loaded on first use to keep `import` cheap.
+_LAZY_ATTRIBUTES = {
+    "PromptResultCache": ".result_cache",
+    "PromptVersionStore": ".versions",
+    "SlugCatalog": ".catalog",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
@@ -0,0 +1,194 @@
+import bisect
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Set
+
+from athina_client.errors import CustomException
+from athina_client.services import AthinaApiService
+from .prompt import Slug
+
+
+class SlugCatalog:
+    """
+    Cached, indexed view of the prompt slugs of a workspace.
+
+    The slug list is fetched at most once per `ttl` seconds and indexed by
+    name, id and directory, so lookups and prefix or directory queries are
+    answered locally. Refreshes are incremental: the list is requested
+    conditionally, an unchanged list (same ETag, or same body for servers
+    without ETags) is neither decoded nor applied, and otherwise only slugs
+    whose `updated_at` changed are re-built and re-indexed.
+
+    Example:
+        ```python
+        catalog = SlugCatalog(ttl=300)
+        slug = catalog.get("support-answer")
+        drafts = catalog.search("draft-")
+        ```
+    """
+
+    def __init__(self, ttl: Optional[float] = 60.0):
+        """
+        Args:
+            ttl (Optional[float]): Seconds for which the cached list is used without contacting the API.
+                Defaults to 60. None never refreshes automatically.
+        """
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._refreshed_at: Optional[float] = None
+        self._version: Optional[str] = None
+        self._by_id: Dict[str, Slug] = {}
+        self._by_name: Dict[str, Slug] = {}
+        self._by_directory: Dict[Optional[str], Set[str]] = {}
+        self._names: List[str] = []
+
+    def refresh(self, force: bool = False):
+        """
+        Updates the catalog from the API if the TTL expired.
+
+        Args:
+            force (bool): Refresh even if the TTL has not expired. Defaults to False.
+
+        Raises:
+            CustomException: If the API call fails or returns an error.
+        """
+        with self._lock:
+            if not force and not self._is_expired():
+                return
+            try:
+                version, slugs_data = AthinaApiService.get_all_prompt_slugs_if_changed(
+                    self._version
+                )
+            except Exception as e:
+                raise CustomException("Error fetching all prompt slugs", str(e))
+            if slugs_data is not None:
+                self._apply(slugs_data)
+                self._version = version
+            self._refreshed_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Forces the next lookup to refresh the catalog.
+        """
+        with self._lock:
+            self._refreshed_at = None
+
+    def get(self, name: str) -> Optional[Slug]:
+        """
+        Returns the slug with the given name, or None.
+        """
+        self.refresh()
+        with self._lock:
+            return self._by_name.get(name)
+
+    def get_by_id(self, slug_id: str) -> Optional[Slug]:
+        """
+        Returns the slug with the given id, or None.
+        """
+        self.refresh()
+        with self._lock:
+            return self._by_id.get(slug_id)
+
+    def search(self, prefix: str) -> List[Slug]:
+        """
+        Returns the slugs whose name starts with `prefix`, sorted by name.
+        """
+        self.refresh()
+        with self._lock:
+            names = self._names
+            start = bisect.bisect_left(names, prefix)
+            end = start
+            while end < len(names) and names[end].startswith(prefix):
+                end += 1
+            return [self._by_name[name] for name in names[start:end]]
+
+    def in_directory(self, directory: Optional[str]) -> List[Slug]:
+        """
+        Returns the slugs in a directory, sorted by name. None returns the slugs without a directory.
+        """
+        self.refresh()
+        with self._lock:
+            return [
+                self._by_name[name]
+                for name in sorted(self._by_directory.get(directory, ()))
+            ]
+
+    def directories(self) -> List[str]:
+        """
+        Returns the names of all directories that contain at least one slug.
+        """
+        self.refresh()
+        with self._lock:
+            return sorted(d for d in self._by_directory if d is not None)
+
+    def starred(self) -> List[Slug]:
+        """
+        Returns the starred slugs, sorted by name.
+        """
+        self.refresh()
+        with self._lock:
+            return [
+                self._by_name[name]
+                for name in self._names
+                if self._by_name[name].starred
+            ]
+
+    def __len__(self) -> int:
+        self.refresh()
+        with self._lock:
+            return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Slug]:
+        self.refresh()
+        with self._lock:
+            slugs = [self._by_name[name] for name in self._names]
+        return iter(slugs)
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def _is_expired(self) -> bool:
+        if self._refreshed_at is None:
+            return True
+        if self.ttl is None:
+            return False
+        return time.monotonic() - self._refreshed_at >= self.ttl
+
+    def _apply(self, slugs_data):
+        seen = set()
+        changed = []
+        for data in slugs_data:
+            seen.add(data["id"])
+            current = self._by_id.get(data["id"])
+            if current is None or current.updated_at != data["updated_at"]:
+                changed.append(data)
+        stale = [self._by_id[slug_id] for slug_id in self._by_id.keys() - seen]
+        stale.extend(
+            self._by_id[data["id"]] for data in changed if data["id"] in self._by_id
+        )
+        # Unindex every stale slug before indexing the new ones, so that a slug
+        # which took over the name of another is not unindexed along with it.
+        old_names = {slug.id: slug.name for slug in stale}
+        for slug in stale:
+            self._unindex(slug)
+        names_changed = len(old_names) != len(changed)
+        for data in changed:
+            slug = Slug.from_dict(data)
+            self._index(slug)
+            names_changed = names_changed or old_names.get(slug.id) != slug.name
+        if names_changed:
+            self._names = sorted(self._by_name)
+
+    def _index(self, slug: Slug):
+        self._by_id[slug.id] = slug
+        self._by_name[slug.name] = slug
+        self._by_directory.setdefault(slug.directory, set()).add(slug.name)
+
+    def _unindex(self, slug: Slug):
+        del self._by_id[slug.id]
+        self._by_name.pop(slug.name, None)
+        names = self._by_directory.get(slug.directory)
+        if names is not None:
+            names.discard(slug.name)
+            if not names:
+                del self._by_directory[slug.directory]
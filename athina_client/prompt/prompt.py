@@ -1,7 +1,14 @@
-from typing import Any, Dict, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from athina_client.services import AthinaApiService
 from athina_client.errors import CustomException
+from athina_client.instrumentation import Profiling, traced
+from .usage import PromptUsage
+
+if TYPE_CHECKING:
+    from .result_cache import PromptResultCache
+    from .streaming import AsyncPromptStream, PromptStream
 
 
 @dataclass
@@ -62,6 +69,32 @@ class PromptExecution:
     created_at: str
     updated_at: str
 
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "PromptExecution":
+        return PromptExecution(
+            id=data["id"],
+            user_id=data["user_id"],
+            org_id=data["org_id"],
+            workspace_slug=data["workspace_slug"],
+            prompt_template_id=data["prompt_template_id"],
+            variables=data["variables"],
+            language_model_id=data["language_model_id"],
+            org_model_config_id=data["org_model_config_id"],
+            prompt_sent=data["prompt_sent"],
+            prompt_response=data["prompt_response"],
+            tools=data["tools"],
+            tool_choice=data["tool_choice"],
+            prompt_tokens=data["prompt_tokens"],
+            completion_tokens=data["completion_tokens"],
+            total_tokens=data["total_tokens"],
+            cost=data["cost"],
+            response_time=data["response_time"],
+            options=ModelOptions(**data.get("options", {})),
+            grader_feedback=data.get("grader_feedback"),
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+        )
+
 
 @dataclass
 class Prompt:
@@ -85,6 +118,7 @@ class Prompt:
     org_model_config: Optional[OrgModelConfig] = None
 
     @staticmethod
+    @traced("Prompt.create")
     def create(
         slug: str,
         prompt: List[Dict[str, str]],
@@ -149,6 +183,7 @@ class Prompt:
         )
 
     @staticmethod
+    @traced("Prompt.get_default")
     def get_default(slug: str) -> "Prompt":
         """
         Get default prompt by calling the Athina API.
@@ -167,44 +202,11 @@ class Prompt:
         except Exception as e:
             raise CustomException("Error fetching default prompt", str(e))
 
-        org_model_config_data = prompt_data.get("org_model_config")
-        org_model_config = None
-        if org_model_config_data:
-            org_model_config = OrgModelConfig(
-                id=org_model_config_data["id"],
-                org_id=org_model_config_data["org_id"],
-                workspace_slug=org_model_config_data["workspace_slug"],
-                provider_id=org_model_config_data["provider_id"],
-                model_id=org_model_config_data["model_id"],
-                config=org_model_config_data["config"],
-                input_tokens_cost=org_model_config_data["input_tokens_cost"],
-                output_tokens_cost=org_model_config_data["output_tokens_cost"],
-                created_at=org_model_config_data["created_at"],
-                updated_at=org_model_config_data["updated_at"],
-            )
-
-        return Prompt(
-            id=prompt_data["id"],
-            user_id=prompt_data["user_id"],
-            org_id=prompt_data["org_id"],
-            workspace_slug=prompt_data["workspace_slug"],
-            prompt_template_slug_id=prompt_data["prompt_template_slug_id"],
-            commit_message=prompt_data["commit_message"],
-            prompt=prompt_data["prompt"],
-            tools=prompt_data.get("tools"),
-            tool_choice=prompt_data.get("tool_choice"),
-            version=prompt_data["version"],
-            is_default=prompt_data["is_default"],
-            model=prompt_data.get("model"),
-            org_model_config_id=prompt_data.get("org_model_config_id"),
-            parameters=prompt_data.get("parameters"),
-            hash=prompt_data.get("hash"),
-            created_at=prompt_data.get("created_at"),
-            updated_at=prompt_data.get("updated_at"),
-            org_model_config=org_model_config,
-        )
+        with Profiling.phase("construct"):
+            return Prompt.from_dict(prompt_data)
 
     @staticmethod
+    @traced("Prompt.run")
     def run(
         slug: str,
         variables: Dict[str, Any],
@@ -214,6 +216,7 @@ class Prompt:
         parameters: Optional[ModelOptions] = None,
         log_prompt_run: Optional[bool] = None,
         metadata: Optional[PromptRunMetadata] = None,
+        cache: Optional["PromptResultCache"] = None,
     ) -> PromptExecution:
         """
         Runs a prompt.
@@ -227,6 +230,8 @@ class Prompt:
         - parameters (Optional[Dict[str, Any]]): Optional parameters.
         - log_prompt_run (Optional[bool]): Optional boolean to log prompt run or not. By default, on every prompt execution, prompt run is logged.
         - metadata (Optional[PromptRunMetadata]): Optional metadata for the prompt run.
+        - cache (Optional[PromptResultCache]): Optional result cache. Identical runs are answered from the cache
+          without calling the model; only use it for deterministic prompts.
 
         Returns:
         - The prompt execution object.
@@ -246,36 +251,30 @@ class Prompt:
 
         request_data = {k: v for k, v in request_data.items() if v is not None}
 
+        if cache is not None:
+            cache_key = cache.key(slug, variables, version, provider, model, parameters)
+            cached_execution = cache.get(cache_key)
+            if cached_execution is not None:
+                return cached_execution
+
+        start = time.perf_counter()
         try:
             response_data = AthinaApiService.run_prompt(slug, request_data)
         except Exception as e:
             raise CustomException("Error running prompt", str(e))
 
-        return PromptExecution(
-            id=response_data["prompt"]["id"],
-            user_id=response_data["prompt"]["user_id"],
-            org_id=response_data["prompt"]["org_id"],
-            workspace_slug=response_data["prompt"]["workspace_slug"],
-            prompt_template_id=response_data["prompt"]["prompt_template_id"],
-            variables=response_data["prompt"]["variables"],
-            language_model_id=response_data["prompt"]["language_model_id"],
-            org_model_config_id=response_data["prompt"]["org_model_config_id"],
-            prompt_sent=response_data["prompt"]["prompt_sent"],
-            prompt_response=response_data["prompt"]["prompt_response"],
-            tools=response_data["prompt"]["tools"],
-            tool_choice=response_data["prompt"]["tool_choice"],
-            prompt_tokens=response_data["prompt"]["prompt_tokens"],
-            completion_tokens=response_data["prompt"]["completion_tokens"],
-            total_tokens=response_data["prompt"]["total_tokens"],
-            cost=response_data["prompt"]["cost"],
-            response_time=response_data["prompt"]["response_time"],
-            options=ModelOptions(**response_data["prompt"].get("options", {})),
-            grader_feedback=response_data["prompt"].get("grader_feedback"),
-            created_at=response_data["prompt"]["created_at"],
-            updated_at=response_data["prompt"]["updated_at"],
-        )
+        with Profiling.phase("construct"):
+            execution = PromptExecution.from_dict(response_data["prompt"])
+        if PromptUsage.is_enabled():
+            PromptUsage.record(
+                slug, execution, _customer_id(metadata), time.perf_counter() - start
+            )
+        if cache is not None:
+            cache.put(cache_key, execution)
+        return execution
 
     @staticmethod
+    @traced("Prompt.set_default")
     def set_default(slug: str, version: int) -> "Prompt":
         """
         Set a prompt template version as the default by calling the Athina API.
@@ -323,6 +322,131 @@ class Prompt:
         except Exception as e:
             raise CustomException("Error setting prompt template live", str(e))
 
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "Prompt":
+        org_model_config_data = data.get("org_model_config")
+        org_model_config = None
+        if org_model_config_data:
+            org_model_config = OrgModelConfig(
+                id=org_model_config_data["id"],
+                org_id=org_model_config_data["org_id"],
+                workspace_slug=org_model_config_data["workspace_slug"],
+                provider_id=org_model_config_data["provider_id"],
+                model_id=org_model_config_data["model_id"],
+                config=org_model_config_data["config"],
+                input_tokens_cost=org_model_config_data["input_tokens_cost"],
+                output_tokens_cost=org_model_config_data["output_tokens_cost"],
+                created_at=org_model_config_data["created_at"],
+                updated_at=org_model_config_data["updated_at"],
+            )
+
+        return Prompt(
+            id=data["id"],
+            user_id=data["user_id"],
+            org_id=data["org_id"],
+            workspace_slug=data["workspace_slug"],
+            prompt_template_slug_id=data["prompt_template_slug_id"],
+            commit_message=data["commit_message"],
+            prompt=data["prompt"],
+            tools=data.get("tools"),
+            tool_choice=data.get("tool_choice"),
+            version=data["version"],
+            is_default=data["is_default"],
+            model=data.get("model"),
+            org_model_config_id=data.get("org_model_config_id"),
+            parameters=data.get("parameters"),
+            hash=data.get("hash"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            org_model_config=org_model_config,
+        )
+
+    @staticmethod
+    def stream(
+        slug: str,
+        variables: Dict[str, Any],
+        version: Optional[int] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        parameters: Optional[ModelOptions] = None,
+        log_prompt_run: Optional[bool] = None,
+        metadata: Optional[PromptRunMetadata] = None,
+    ) -> "PromptStream":
+        """
+        Runs a prompt and streams the completion as it is generated.
+
+        Parameters are the same as for `Prompt.run`.
+
+        Returns:
+        - A `PromptStream` yielding text deltas. Once it is exhausted, its `execution`
+          attribute holds the complete `PromptExecution`.
+
+        Example:
+            ```python
+            stream = Prompt.stream("support-answer", {"query": "..."})
+            for delta in stream:
+                print(delta, end="", flush=True)
+            print(stream.execution.total_tokens)
+            ```
+        """
+        from .streaming import PromptStream
+
+        request_data = {
+            "variables": variables,
+            "version": version,
+            "provider": provider,
+            "model": model,
+            "parameters": parameters,
+            "log_prompt_run": log_prompt_run,
+            "metadata": metadata,
+        }
+        request_data = {k: v for k, v in request_data.items() if v is not None}
+        return PromptStream(slug, request_data, _customer_id(metadata))
+
+    @staticmethod
+    def astream(
+        slug: str,
+        variables: Dict[str, Any],
+        version: Optional[int] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        parameters: Optional[ModelOptions] = None,
+        log_prompt_run: Optional[bool] = None,
+        metadata: Optional[PromptRunMetadata] = None,
+    ) -> "AsyncPromptStream":
+        """
+        Async variant of `Prompt.stream`, for use with `async for`.
+
+        The HTTP request runs on a background thread, so the event loop is never blocked.
+
+        Example:
+            ```python
+            stream = Prompt.astream("support-answer", {"query": "..."})
+            async for delta in stream:
+                print(delta, end="", flush=True)
+            print(stream.execution.total_tokens)
+            ```
+        """
+        from .streaming import AsyncPromptStream
+
+        return AsyncPromptStream(
+            Prompt.stream,
+            slug,
+            variables,
+            version=version,
+            provider=provider,
+            model=model,
+            parameters=parameters,
+            log_prompt_run=log_prompt_run,
+            metadata=metadata,
+        )
+
+
+def _customer_id(metadata: Any) -> Optional[str]:
+    if isinstance(metadata, dict):
+        return metadata.get("customer_id")
+    return getattr(metadata, "customer_id", None)
+
 
 @dataclass
 class Slug:
@@ -339,6 +463,7 @@ class Slug:
     user: Optional[Dict[str, Any]] = None
 
     @staticmethod
+    @traced("Slug.list")
     def list() -> List["Slug"]:
         """
         Get all prompt slugs by calling the Athina API.
@@ -354,24 +479,27 @@ class Slug:
         except Exception as e:
             raise CustomException("Error fetching all prompt slugs", str(e))
 
-        return [
-            Slug(
-                id=slug["id"],
-                org_id=slug["org_id"],
-                workspace_slug=slug["workspace_slug"],
-                name=slug["name"],
-                directory=slug.get("directory"),
-                starred=slug["starred"],
-                emoji=slug.get("emoji"),
-                created_by=slug["created_by"],
-                created_at=slug["created_at"],
-                updated_at=slug["updated_at"],
-                user=slug.get("user"),
-            )
-            for slug in slugs_data
-        ]
+        with Profiling.phase("construct"):
+            return [Slug.from_dict(slug) for slug in slugs_data]
 
     @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "Slug":
+        return Slug(
+            id=data["id"],
+            org_id=data["org_id"],
+            workspace_slug=data["workspace_slug"],
+            name=data["name"],
+            directory=data.get("directory"),
+            starred=data["starred"],
+            emoji=data.get("emoji"),
+            created_by=data["created_by"],
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+            user=data.get("user"),
+        )
+
+    @staticmethod
+    @traced("Slug.delete")
     def delete(slug: str) -> str:
         """
         Delete a prompt slug and its corresponding templates by calling the Athina API.
@@ -389,6 +517,7 @@ class Slug:
             raise CustomException("Error deleting prompt slug", str(e))
 
     @staticmethod
+    @traced("Slug.duplicate")
     def duplicate(slug: str, name: str) -> "DuplicateSlugResponse":
         """
         Duplicate a prompt slug by calling the Athina API.
@@ -411,6 +540,7 @@ class Slug:
 
     # Methods to update directory, favourite, and emoji
     @staticmethod
+    @traced("Slug.add_to_directory")
     def add_to_directory(slug: str, directory: str):
         update_data = {"directory": directory if directory else None}
         try:
@@ -422,6 +552,7 @@ class Slug:
             raise CustomException("Error updating slug directory", str(e))
 
     @staticmethod
+    @traced("Slug.favorite_slug")
     def favorite_slug(slug: str, starred: bool):
         update_data = {"starred": starred}
         try:
@@ -433,6 +564,7 @@ class Slug:
             raise CustomException("Error favouriting slug", str(e))
 
     @staticmethod
+    @traced("Slug.set_emoji")
     def set_emoji(slug: str, emoji: str):
         update_data = {"emoji": emoji if emoji else None}
         try:
@@ -443,6 +575,72 @@ class Slug:
         except Exception as e:
             raise CustomException("Error updating slug emoji", str(e))
 
+    @staticmethod
+    @traced("Slug.batch_update")
+    def batch_update(
+        updates: Union[Dict[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]],
+        max_workers: int = 8,
+    ) -> List["SlugUpdateResult"]:
+        """
+        Update the directory, starred state and emoji of many slugs at once.
+
+        All changes to the same slug are merged into a single PATCH request, later
+        changes overriding earlier ones, and the slugs are updated concurrently.
+        A failed update does not stop the others; check `SlugUpdateResult.ok`.
+
+        Parameters:
+        - updates: Mapping of slug to fields, or (slug, fields) pairs, e.g.
+          `[("a", {"directory": "support"}), ("a", {"starred": True})]`.
+        - max_workers (int): Maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+        - One `SlugUpdateResult` per slug, in the order the slugs first appear in `updates`.
+        """
+        import contextvars
+        from concurrent.futures import ThreadPoolExecutor
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        pairs = updates.items() if isinstance(updates, dict) else updates
+        for slug, fields in pairs:
+            merged.setdefault(slug, {}).update(fields)
+        for fields in merged.values():
+            for key in ("directory", "emoji"):
+                if key in fields and not fields[key]:
+                    fields[key] = None
+
+        def update(slug: str, fields: Dict[str, Any]) -> SlugUpdateResult:
+            try:
+                updated_slug = AthinaApiService.update_prompt_template_slug(
+                    slug, fields
+                )
+                return SlugUpdateResult(
+                    slug=slug, fields=fields, updated_slug=updated_slug
+                )
+            except Exception as e:
+                return SlugUpdateResult(slug=slug, fields=fields, error=str(e))
+
+        if not merged:
+            return []
+        workers = min(max_workers, len(merged))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, update, slug, fields)
+                for slug, fields in merged.items()
+            ]
+            return [future.result() for future in futures]
+
+
+@dataclass
+class SlugUpdateResult:
+    slug: str
+    fields: Dict[str, Any]
+    updated_slug: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 @dataclass
 class DuplicateSlugResponse:
@@ -454,19 +652,7 @@ class DuplicateSlugResponse:
         new_prompt_template_slug_data = data["newPromptTemplateSlug"]
         new_prompt_template_data = data.get("newPromptTemplate")
 
-        new_slug = Slug(
-            id=new_prompt_template_slug_data["id"],
-            org_id=new_prompt_template_slug_data["org_id"],
-            workspace_slug=new_prompt_template_slug_data["workspace_slug"],
-            name=new_prompt_template_slug_data["name"],
-            directory=new_prompt_template_slug_data.get("directory"),
-            starred=new_prompt_template_slug_data["starred"],
-            emoji=new_prompt_template_slug_data.get("emoji"),
-            created_by=new_prompt_template_slug_data["created_by"],
-            created_at=new_prompt_template_slug_data["created_at"],
-            updated_at=new_prompt_template_slug_data["updated_at"],
-            user=new_prompt_template_slug_data.get("user"),
-        )
+        new_slug = Slug.from_dict(new_prompt_template_slug_data)
 
         print
         new_prompt = None
@@ -0,0 +1,249 @@
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from athina_client.errors import CustomException
+from athina_client.services import AthinaApiService
+from athina_client.utils import atomic_write
+from .prompt import ModelOptions, PromptExecution
+
+
+class PromptResultCache:
+    """
+    Memoizes `Prompt.run` results for deterministic prompts.
+
+    Results are keyed on the API key, slug, resolved prompt version and hash,
+    provider, model, parameters and the canonical JSON of the variables. When
+    no version is given, the default version is resolved through a conditional
+    request and reused for `default_ttl` seconds, so a new default takes effect
+    within that time. Results are kept in an in-memory LRU and, if a directory
+    is given, on disk.
+
+    Only use the cache for runs whose output is expected to be identical for
+    identical inputs (e.g. temperature 0). Cache hits are not logged as prompt
+    runs and do not cost tokens.
+
+    Example:
+        ```python
+        cache = PromptResultCache(max_entries=10000, ttl=86400, directory=".athina-results")
+        execution = Prompt.run("support-answer", {"query": "..."}, cache=cache)
+        print(cache.stats()["hit_rate"])
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        directory: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+        default_ttl: float = 60.0,
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of results kept in memory. Defaults to 1024.
+            ttl (Optional[float]): Seconds after which a result expires. Defaults to None (never).
+            directory (Optional[str]): Directory for the on-disk cache. Defaults to None (memory only).
+            max_disk_bytes (Optional[int]): Size limit of the on-disk cache; the oldest results are
+                removed when it is exceeded. Defaults to None (unlimited).
+            default_ttl (float): Seconds for which the resolved default version of a slug is reused
+                without asking the API. Defaults to 60; 0 resolves it on every run.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.default_ttl = default_ttl
+        self._defaults: Dict[Tuple[str, str], Tuple[float, int, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+
+    def key(
+        self,
+        slug: str,
+        variables: Dict[str, Any],
+        version: Optional[int] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        parameters: Optional[Any] = None,
+    ) -> str:
+        """
+        Returns the cache key of a prompt run.
+
+        Raises:
+            CustomException: If the default version has to be resolved and the API call fails.
+        """
+        api_key = AthinaApiService._headers()["athina-api-key"]
+        prompt_hash = None
+        if version is None:
+            version, prompt_hash = self._resolve_default(api_key, slug)
+        if dataclasses.is_dataclass(parameters):
+            parameters = dataclasses.asdict(parameters)
+        key_data = [
+            api_key,
+            slug,
+            version,
+            prompt_hash,
+            provider,
+            model,
+            parameters,
+            variables,
+        ]
+        canonical = json.dumps(
+            key_data, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[PromptExecution]:
+        """
+        Returns the cached `PromptExecution` for a key, or None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._is_fresh(entry[0], now):
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._memory[key]
+
+        entry = self._read(key)
+        if entry is not None and self._is_fresh(entry[0], now):
+            data = entry[1]
+            execution = PromptExecution(
+                **{
+                    **data,
+                    "options": (
+                        ModelOptions(**data["options"]) if data.get("options") else None
+                    ),
+                }
+            )
+            self._remember(key, entry[0], execution)
+            with self._lock:
+                self._hits += 1
+            return copy.deepcopy(execution)
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key: str, execution: PromptExecution):
+        """
+        Stores the `PromptExecution` of a run.
+        """
+        created_at = time.time()
+        self._remember(key, created_at, copy.deepcopy(execution))
+        if self.directory:
+            self._write(key, created_at, dataclasses.asdict(execution))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of hits and misses, the hit rate and the number of results in memory.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._memory),
+            }
+
+    def clear(self):
+        """
+        Removes all cached results, in memory and on disk.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._hits = self._misses = 0
+            self._disk_bytes = None
+        if self.directory:
+            for path, _, _ in self._disk_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _resolve_default(self, api_key: str, slug: str) -> Tuple[int, Optional[str]]:
+        now = time.monotonic()
+        resolved = self._defaults.get((api_key, slug))
+        if resolved is not None and now - resolved[0] < self.default_ttl:
+            return resolved[1], resolved[2]
+        try:
+            prompt_data = AthinaApiService.get_default_prompt(slug)
+        except Exception as e:
+            raise CustomException("Error fetching default prompt", str(e))
+        version, prompt_hash = prompt_data["version"], prompt_data.get("hash")
+        self._defaults[(api_key, slug)] = (now, version, prompt_hash)
+        return version, prompt_hash
+
+    def _is_fresh(self, created_at: float, now: float) -> bool:
+        return self.ttl is None or now - created_at < self.ttl
+
+    def _remember(self, key: str, created_at: float, execution: PromptExecution):
+        with self._lock:
+            self._memory[key] = (created_at, execution)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _read(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry["created_at"], entry["execution"]
+
+    def _write(self, key: str, created_at: float, data: Dict[str, Any]):
+        path = self._path(key)
+        payload = json.dumps({"created_at": created_at, "execution": data}, default=str)
+        with atomic_write(path, "w") as f:
+            f.write(payload)
+        if self.max_disk_bytes is not None:
+            self._enforce_disk_limit(len(payload))
+
+    def _disk_entries(self):
+        if not os.path.isdir(self.directory):
+            return
+        for prefix in os.scandir(self.directory):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_mtime, stat.st_size
+
+    def _enforce_disk_limit(self, written: int):
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += written
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+            entries = sorted(self._disk_entries(), key=lambda entry: entry[1])
+            total = sum(size for _, _, size in entries)
+            # Evict down to 90% of the limit so that eviction does not run on every write.
+            for path, _, size in entries:
+                if total <= self.max_disk_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+            self._disk_bytes = total
@@ -0,0 +1,208 @@
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from athina_client.errors import CustomException
+from athina_client.instrumentation import Profiling, Tracing
+from athina_client.services import AthinaApiService
+from .prompt import PromptExecution
+from .usage import PromptUsage
+
+_DONE = object()
+
+
+class PromptStream:
+    """
+    Iterator over the text deltas of a streamed prompt run.
+
+    The request is sent on first iteration, in the context the stream was
+    created in, so the `AthinaClient` scope and the trace active at creation
+    apply. The `Prompt.stream` span and profiled call last from the first
+    iteration until the stream is exhausted, fails or is closed. Once the
+    stream is exhausted, `execution` holds the complete `PromptExecution` and
+    `text` the full completion.
+    """
+
+    def __init__(
+        self, slug: str, request_data: Dict[str, Any], customer_id: Optional[str]
+    ):
+        self.slug = slug
+        self.execution: Optional[PromptExecution] = None
+        self._request_data = request_data
+        self._customer_id = customer_id
+        self._deltas: List[str] = []
+        self._events: Optional[Iterator] = None
+        self._span: Optional[contextlib.ExitStack] = None
+        self._started = False
+        self._context = contextvars.copy_context()
+        self._iterator = self._iterate()
+
+    @property
+    def text(self) -> str:
+        return "".join(self._deltas)
+
+    def __iter__(self) -> "PromptStream":
+        return self
+
+    def __next__(self) -> str:
+        return self._context.run(self._next)
+
+    def close(self):
+        """
+        Stops the stream and releases its connection.
+        """
+        self._context.run(self._close)
+
+    def __del__(self):
+        # A stream abandoned before it was exhausted still ends its span, in its own context.
+        if self._span is not None:
+            self.close()
+
+    def _next(self) -> str:
+        if not self._started:
+            self._started = True
+            if Tracing.is_set() or Profiling.is_enabled():
+                self._span = contextlib.ExitStack()
+                self._span.enter_context(Tracing.span("Prompt.stream"))
+                self._span.enter_context(Profiling.call("Prompt.stream"))
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self._end_span(None)
+            raise
+        except BaseException as e:
+            self._end_span(e)
+            raise
+
+    def _close(self):
+        self._iterator.close()
+        if self._events is not None:
+            self._events.close()
+        self._end_span(None)
+
+    def _end_span(self, error: Optional[BaseException]):
+        span, self._span = self._span, None
+        if span is not None:
+            if error is None:
+                span.__exit__(None, None, None)
+            else:
+                span.__exit__(type(error), error, error.__traceback__)
+
+    def __enter__(self) -> "PromptStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _iterate(self) -> Iterator[str]:
+        start = time.perf_counter()
+        try:
+            self._events = AthinaApiService.stream_prompt(self.slug, self._request_data)
+            for kind, value in self._events:
+                if kind == "delta":
+                    if value:
+                        self._deltas.append(value)
+                        yield value
+                elif kind == "done":
+                    self.execution = PromptExecution.from_dict(value)
+        except Exception as e:
+            raise CustomException("Error running prompt", str(e))
+
+        if self.execution is not None and PromptUsage.is_enabled():
+            PromptUsage.record(
+                self.slug,
+                self.execution,
+                self._customer_id,
+                time.perf_counter() - start,
+            )
+
+
+class AsyncPromptStream:
+    """
+    Async iterator over the text deltas of a streamed prompt run.
+
+    The blocking stream is consumed on a background thread and handed to the
+    event loop, so iterating never blocks the loop. Like `PromptStream`, the
+    request runs in the context the stream was created in, inside a
+    `Prompt.astream` span that lasts until the stream is consumed. Once the
+    stream is exhausted, `execution` holds the complete `PromptExecution`.
+    """
+
+    def __init__(self, open_stream: Callable[..., PromptStream], *args, **kwargs):
+        self.execution: Optional[PromptExecution] = None
+        self._open_stream = open_stream
+        self._args = args
+        self._kwargs = kwargs
+        self._stream: Optional[PromptStream] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._finished = False
+        self._closed = threading.Event()
+        self._context = contextvars.copy_context()
+
+    @property
+    def text(self) -> str:
+        return self._stream.text if self._stream is not None else ""
+
+    def __aiter__(self) -> "AsyncPromptStream":
+        return self
+
+    async def __anext__(self) -> str:
+        if self._finished:
+            raise StopAsyncIteration
+        if self._queue is None:
+            self._start()
+        item = await self._queue.get()
+        if item is _DONE:
+            self._finished = True
+            self.execution = self._stream.execution if self._stream else None
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    async def aclose(self):
+        """
+        Stops the stream and releases its connection.
+        """
+        self._finished = True
+        self._closed.set()
+
+    async def __aenter__(self) -> "AsyncPromptStream":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+
+        def put(item) -> bool:
+            try:
+                loop.call_soon_threadsafe(self._queue.put_nowait, item)
+                return True
+            except RuntimeError:
+                # The event loop was closed without consuming the stream.
+                return False
+
+        def produce():
+            try:
+                with Tracing.span("Prompt.astream"), Profiling.call("Prompt.astream"):
+                    self._stream = self._open_stream(*self._args, **self._kwargs)
+                    with self._stream:
+                        for delta in self._stream:
+                            if self._closed.is_set() or not put(delta):
+                                return
+            except BaseException as e:
+                put(e)
+            put(_DONE)
+
+        threading.Thread(
+            target=self._context.run,
+            args=(produce,),
+            name="athina-prompt-stream",
+            daemon=True,
+        ).start()
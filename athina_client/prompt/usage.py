@@ -0,0 +1,326 @@
+import bisect
+import math
+import threading
+import time
+from abc import ABC
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_RUN_LATENCY_BUCKETS = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    4.0,
+    8.0,
+    15.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+DIMENSIONS = ("slug", "model", "customer_id")
+
+
+class UsageAccumulator:
+    """
+    Aggregates the token usage, cost and latency of prompt runs in memory.
+
+    Runs are aggregated per time window and per (slug, model, customer_id).
+    Latencies go into fixed buckets and only the last `max_windows` windows are
+    kept, so memory use does not grow with the number of runs. Lifetime totals
+    per (slug, model, customer_id) are kept separately for `prometheus`, so the
+    exported counters never decrease when old windows are dropped.
+
+    Example:
+        ```python
+        usage = UsageAccumulator(window=3600)
+        PromptUsage.add_accumulator(usage)
+
+        Prompt.run("support-answer", {"query": "..."})
+
+        spent = usage.query(customer_id="acme", since=time.time() - 86400)
+        print(spent[()]["cost"], spent[()]["p99"])
+        ```
+    """
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        max_windows: int = 1440,
+        buckets: Sequence[float] = DEFAULT_RUN_LATENCY_BUCKETS,
+    ):
+        """
+        Args:
+            window (float): Length of a time window in seconds. Defaults to 60.
+            max_windows (int): Number of most recent windows kept. Defaults to 1440 (one day of minutes).
+            buckets (Sequence[float]): Upper bounds (seconds) of the latency buckets.
+        """
+        self.window = window
+        self.max_windows = max_windows
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._windows: Dict[float, Dict[Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._totals: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    def record(
+        self,
+        slug: str,
+        model: Optional[str],
+        customer_id: Optional[str],
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cost: Optional[Any],
+        latency: float,
+        timestamp: Optional[float] = None,
+    ):
+        """
+        Adds a single prompt run.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        window_start = math.floor(timestamp / self.window) * self.window
+        bucket = bisect.bisect_left(self.buckets, latency)
+        cost = _to_float(cost)
+        key = (slug, model, customer_id)
+        with self._lock:
+            stats_by_key = self._windows.get(window_start)
+            if stats_by_key is None:
+                stats_by_key = self._windows[window_start] = {}
+                if len(self._windows) > self.max_windows:
+                    del self._windows[min(self._windows)]
+            for entries in (stats_by_key, self._totals):
+                stats = entries.get(key)
+                if stats is None:
+                    stats = entries[key] = self._empty_stats()
+                stats["runs"] += 1
+                stats["prompt_tokens"] += prompt_tokens or 0
+                stats["completion_tokens"] += completion_tokens or 0
+                stats["total_tokens"] += total_tokens or 0
+                stats["cost"] += cost
+                stats["total_time"] += latency
+                stats["max_time"] = max(stats["max_time"], latency)
+                stats["buckets"][bucket] += 1
+
+    def query(
+        self,
+        group_by: Sequence[str] = (),
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        **filters: Optional[str],
+    ) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Returns aggregated usage.
+
+        Args:
+            group_by (Sequence[str]): Any of 'slug', 'model', 'customer_id' and 'window'. Defaults to
+                no grouping, i.e. a single entry keyed by `()`.
+            since (Optional[float]): Only include windows starting at or after this UNIX timestamp
+                (rounded down to the window).
+            until (Optional[float]): Only include windows starting before this UNIX timestamp.
+            **filters: Exact matches on 'slug', 'model' or 'customer_id'.
+
+        Returns:
+            Dict[Tuple, Dict[str, Any]]: Usage keyed by the values of the `group_by` dimensions, with
+            'runs', token counts, 'cost', 'mean_time', 'max_time', 'p50', 'p95' and 'p99'.
+        """
+        for name in group_by:
+            if name not in DIMENSIONS and name != "window":
+                raise ValueError(f"Unknown usage dimension: {name}")
+        for name in filters:
+            if name not in DIMENSIONS:
+                raise ValueError(f"Unknown usage dimension: {name}")
+        since = None if since is None else math.floor(since / self.window) * self.window
+        positions = {name: DIMENSIONS.index(name) for name in filters}
+
+        merged: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        with self._lock:
+            for window_start, stats_by_key in self._windows.items():
+                if since is not None and window_start < since:
+                    continue
+                if until is not None and window_start >= until:
+                    continue
+                for key, stats in stats_by_key.items():
+                    if any(key[positions[n]] != v for n, v in filters.items()):
+                        continue
+                    group = tuple(
+                        (
+                            window_start
+                            if name == "window"
+                            else key[DIMENSIONS.index(name)]
+                        )
+                        for name in group_by
+                    )
+                    target = merged.get(group)
+                    if target is None:
+                        target = merged[group] = self._empty_stats()
+                    _merge(target, stats)
+
+        for stats in merged.values():
+            stats["mean_time"] = stats["total_time"] / stats["runs"]
+            stats["p50"] = self._percentile(stats, 50)
+            stats["p95"] = self._percentile(stats, 95)
+            stats["p99"] = self._percentile(stats, 99)
+            stats["buckets"] = list(zip(self._bucket_labels(), stats["buckets"]))
+        return merged
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Returns the per-window statistics as a list of flat records, e.g. for export.
+        """
+        return [
+            {
+                "window": window,
+                "slug": slug,
+                "model": model,
+                "customer_id": customer_id,
+                **stats,
+            }
+            for (window, slug, model, customer_id), stats in sorted(
+                self.query(group_by=("window",) + DIMENSIONS).items(),
+                key=lambda item: (item[0][0],)
+                + tuple("" if v is None else v for v in item[0][1:]),
+            )
+        ]
+
+    def prometheus(self, prefix: str = "athina_prompt") -> str:
+        """
+        Renders the lifetime totals in the Prometheus text exposition format.
+
+        Unlike `query`, the totals include runs of windows that are no longer kept.
+        """
+        with self._lock:
+            totals = {}
+            for key, stats in self._totals.items():
+                totals[key] = dict(stats)
+                totals[key]["buckets"] = list(
+                    zip(self._bucket_labels(), stats["buckets"])
+                )
+        lines = []
+        for name, field, kind in (
+            ("runs_total", "runs", "counter"),
+            ("prompt_tokens_total", "prompt_tokens", "counter"),
+            ("completion_tokens_total", "completion_tokens", "counter"),
+            ("cost_total", "cost", "counter"),
+        ):
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for key, stats in totals.items():
+                lines.append(f"{prefix}_{name}{{{_labels(key)}}} {stats[field]}")
+        lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+        for key, stats in totals.items():
+            labels = _labels(key)
+            cumulative = 0
+            for bound, count in stats["buckets"]:
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f'{prefix}_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                )
+            lines.append(
+                f"{prefix}_latency_seconds_sum{{{labels}}} {stats['total_time']}"
+            )
+            lines.append(f"{prefix}_latency_seconds_count{{{labels}}} {stats['runs']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._windows = {}
+            self._totals = {}
+
+    def _empty_stats(self) -> Dict[str, Any]:
+        return {
+            "runs": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "cost": 0.0,
+            "total_time": 0.0,
+            "max_time": 0.0,
+            "buckets": [0] * (len(self.buckets) + 1),
+        }
+
+    def _percentile(self, stats: Dict[str, Any], q: float) -> Optional[float]:
+        counts = stats["buckets"]
+        rank = q / 100 * stats["runs"]
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], stats["max_time"])
+                return stats["max_time"]
+        return None
+
+    def _bucket_labels(self) -> Tuple[float, ...]:
+        return self.buckets + (float("inf"),)
+
+
+class PromptUsage(ABC):
+    """
+    Registry of usage accumulators fed by every successful `Prompt.run`.
+    """
+
+    _accumulators: List[UsageAccumulator] = []
+
+    @classmethod
+    def add_accumulator(cls, accumulator: UsageAccumulator):
+        cls._accumulators = cls._accumulators + [accumulator]
+
+    @classmethod
+    def remove_accumulator(cls, accumulator: UsageAccumulator):
+        cls._accumulators = [a for a in cls._accumulators if a is not accumulator]
+
+    @classmethod
+    def clear(cls):
+        cls._accumulators = []
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return bool(cls._accumulators)
+
+    @classmethod
+    def record(cls, slug: str, execution, customer_id: Optional[str], latency: float):
+        for accumulator in cls._accumulators:
+            accumulator.record(
+                slug=slug,
+                model=execution.language_model_id,
+                customer_id=customer_id,
+                prompt_tokens=execution.prompt_tokens,
+                completion_tokens=execution.completion_tokens,
+                total_tokens=execution.total_tokens,
+                cost=execution.cost,
+                latency=latency,
+            )
+
+
+def _merge(target: Dict[str, Any], stats: Dict[str, Any]):
+    for field in (
+        "runs",
+        "prompt_tokens",
+        "completion_tokens",
+        "total_tokens",
+        "cost",
+        "total_time",
+    ):
+        target[field] += stats[field]
+    target["max_time"] = max(target["max_time"], stats["max_time"])
+    target["buckets"] = [a + b for a, b in zip(target["buckets"], stats["buckets"])]
+
+
+def _to_float(cost: Any) -> float:
+    try:
+        return float(cost) if cost is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _labels(key: Tuple[Any, ...]) -> str:
+    return ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(DIMENSIONS, key)
+    )
+
+
+def _escape(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,199 @@
+import copy
+import hashlib
+import json
+import os
+import shutil
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from athina_client import constants
+from athina_client.errors import CustomException
+from athina_client.services import AthinaApiService
+from athina_client.utils import atomic_write
+from .prompt import Prompt
+
+
+class PromptVersionStore:
+    """
+    Local store of prompt versions.
+
+    Prompt versions are immutable once created, so every version fetched is
+    kept forever, in memory and on disk, and later lookups of the same slug
+    and version cost no network. Entries are namespaced by API key and
+    verified against the version's `hash` whenever the API returns it again.
+
+    Example:
+        ```python
+        store = PromptVersionStore()
+        for prompt in store.prefetch("support-answer"):
+            print(prompt.version, prompt.commit_message)
+        old = store.get("support-answer", 2)
+        ```
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory (Optional[str]): Root directory of the store. Defaults to `ATHINA_CACHE_DIR/prompts`.
+        """
+        self.directory = directory or os.path.join(
+            constants.ATHINA_CACHE_DIR, "prompts"
+        )
+        self._memory: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, slug: str, version: int) -> Prompt:
+        """
+        Returns a version of a prompt, fetching it only if it is not stored yet.
+
+        Raises:
+            CustomException: If the version does not exist or the API call fails.
+        """
+        data = self._load(slug, version)
+        if data is None:
+            data = self._fetch(slug, version)
+            if data is None:
+                raise CustomException(
+                    "Prompt version not found", f"{slug} has no version {version}"
+                )
+        # Stored versions are shared by every lookup, so callers get their own copy.
+        return Prompt.from_dict(copy.deepcopy(data))
+
+    def get_default(self, slug: str) -> Prompt:
+        """
+        Returns the current default version of a prompt and stores it.
+
+        Raises:
+            CustomException: If the API call fails or returns an error.
+        """
+        try:
+            data = AthinaApiService.get_default_prompt(slug)
+        except Exception as e:
+            raise CustomException("Error fetching default prompt", str(e))
+        self._store(slug, data)
+        return Prompt.from_dict(data)
+
+    def prefetch(self, slug: str, max_workers: int = 4) -> List[Prompt]:
+        """
+        Fetches every version of a prompt that is not stored yet.
+
+        Versions up to the default version are fetched concurrently; newer
+        versions are discovered one by one until the API reports a missing version.
+
+        Args:
+            slug (str): The slug of the prompt.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 4.
+
+        Returns:
+            List[Prompt]: All stored versions of the prompt, ordered by version.
+        """
+        import contextvars
+        from concurrent.futures import ThreadPoolExecutor
+
+        default_version = self.get_default(slug).version
+        stored = set(self._stored_versions(slug))
+        missing = [v for v in range(1, default_version) if v not in stored]
+        if missing:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run, self._fetch, slug, v
+                    )
+                    for v in missing
+                ]
+                for future in futures:
+                    future.result()
+
+        version = max(stored | {default_version}) + 1
+        while self._load(slug, version) is not None or self._fetch(slug, version):
+            version += 1
+        return self.versions(slug, default_version=default_version)
+
+    def versions(
+        self, slug: str, default_version: Optional[int] = None
+    ) -> List[Prompt]:
+        """
+        Returns the stored versions of a prompt without contacting the API, ordered by version.
+
+        Args:
+            slug (str): The slug of the prompt.
+            default_version (Optional[int]): If given, `is_default` of the returned prompts is set accordingly.
+                Otherwise it reflects the state at the time each version was fetched.
+        """
+        prompts = []
+        for version in sorted(self._stored_versions(slug)):
+            data = self._load(slug, version)
+            if data is None:
+                continue
+            prompt = Prompt.from_dict(copy.deepcopy(data))
+            if default_version is not None:
+                prompt.is_default = prompt.version == default_version
+            prompts.append(prompt)
+        return prompts
+
+    def invalidate(self, slug: Optional[str] = None):
+        """
+        Removes stored versions.
+
+        Args:
+            slug (Optional[str]): The slug to drop. If None, the whole store of the current API key is cleared.
+        """
+        with self._lock:
+            scope = self._scope()
+            self._memory = {
+                key: value
+                for key, value in self._memory.items()
+                if key[0] != scope or (slug is not None and key[1] != slug)
+            }
+        path = self._slug_dir(slug) if slug else os.path.join(self.directory, scope)
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _fetch(self, slug: str, version: int) -> Optional[Dict[str, Any]]:
+        try:
+            data = AthinaApiService.get_prompt_version(slug, version)
+        except Exception as e:
+            raise CustomException("Error fetching prompt version", str(e))
+        if data is not None:
+            self._store(slug, data)
+        return data
+
+    @staticmethod
+    def _scope() -> str:
+        api_key = AthinaApiService._headers()["athina-api-key"]
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+    def _slug_dir(self, slug: str) -> str:
+        return os.path.join(self.directory, self._scope(), quote(slug, safe=""))
+
+    def _stored_versions(self, slug: str) -> List[int]:
+        try:
+            names = os.listdir(self._slug_dir(slug))
+        except OSError:
+            return []
+        return [int(name[:-5]) for name in names if name.endswith(".json")]
+
+    def _load(self, slug: str, version: int) -> Optional[Dict[str, Any]]:
+        key = (self._scope(), slug, version)
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        try:
+            with open(os.path.join(self._slug_dir(slug), f"{version}.json")) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._memory[key] = data
+        return data
+
+    def _store(self, slug: str, data: Dict[str, Any]):
+        version = data["version"]
+        stored = self._load(slug, version)
+        if stored is not None and stored.get("hash") == data.get("hash"):
+            return
+        path = os.path.join(self._slug_dir(slug), f"{version}.json")
+        with atomic_write(path, "w") as f:
+            json.dump(data, f)
+        with self._lock:
+            self._memory[(self._scope(), slug, version)] = copy.deepcopy(data)
@@ -1,3 +1,5 @@
 from .athina_api_service import AthinaApiService
+from .conditional_cache import ConditionalCache
+from .hedging import RequestHedging
 
-__all__ = ["AthinaApiService"]
+__all__ = ["AthinaApiService", "ConditionalCache", "RequestHedging"]
@@ -1,15 +1,99 @@
-import requests
-from retrying import retry
-from typing import Any, Dict, List
-from athina_client.errors import CustomException, NoAthinaApiKeyException
+import functools
+import hashlib
+import json
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from athina_client.errors import (
+    CustomException,
+    NoAthinaApiKeyException,
+    PayloadTooLargeException,
+)
 from athina_client.keys import AthinaApiKey
-from athina_client.constants import ATHINA_API_BASE_URL, MAX_DATASET_ROWS
+from athina_client import constants
+from athina_client.constants import MAX_DATASET_ROWS
 from athina_client.api_base_url import AthinaApiBaseUrl
+from athina_client.instrumentation import (
+    ApiCallEvent,
+    Instrumentation,
+    Profiling,
+    Tracing,
+)
+from athina_client.transport import (
+    AthinaTransport,
+    StreamingResponse,
+    TransportResponse,
+)
+from .client_scope import active_client
+from .conditional_cache import ConditionalCache
+from .hedging import RequestHedging
+
+# Name and attempt number of the API call running on the current thread.
+_call_state = threading.local()
+
+
+def _requests():
+    # Imported on demand: requests dominates the import time of the SDK.
+    import requests
+
+    return requests
+
+
+def _retry(operation: Optional[str] = None, **retry_kwargs):
+    """
+    `retrying.retry` that also keeps track of the attempt number, so that the
+    instrumentation events of retried calls are not indistinguishable from
+    first attempts. `retrying` is only imported on the first call.
+
+    Calls are reported under `operation`, which defaults to the function name.
+    """
+
+    def decorator(func):
+        def attempt(*args, **kwargs):
+            _call_state.attempt += 1
+            return func(*args, **kwargs)
+
+        retrying_attempt = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal retrying_attempt
+            if retrying_attempt is None:
+                from retrying import retry
+
+                retrying_attempt = retry(**retry_kwargs)(attempt)
+            _call_state.operation = operation or func.__name__
+            _call_state.attempt = -1
+            try:
+                return retrying_attempt(*args, **kwargs)
+            finally:
+                _call_state.operation = None
+                _call_state.attempt = -1
+
+        return wrapper
+
+    return decorator
+
+
+def _is_duplicate_batch(response) -> bool:
+    """
+    Whether a `409 Conflict` reports an already used idempotency key, rather than
+    another conflict that left the batch unwritten.
+    """
+    try:
+        error = response.json().get("error")
+    except (ValueError, AttributeError):
+        return False
+    return isinstance(error, str) and "idempotency key" in error.lower()
 
 
 class AthinaApiService:
     @staticmethod
     def _headers():
+        client = active_client()
+        if client is not None:
+            return dict(client.headers)
         athina_api_key = AthinaApiKey.get_key()
         if not athina_api_key:
             raise NoAthinaApiKeyException(
@@ -21,11 +105,301 @@ class AthinaApiService:
 
     @staticmethod
     def _base_url():
+        client = active_client()
+        if client is not None:
+            return client.base_url
         base_url = AthinaApiBaseUrl.get_url()
-        return base_url if base_url else ATHINA_API_BASE_URL
+        return base_url if base_url else constants.ATHINA_API_BASE_URL
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    def _request(
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Any] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Sends a request to the Athina API and reports it to the registered instrumentation collectors.
+
+        Parameters:
+        - method (str): The HTTP method.
+        - endpoint (str): The full URL of the endpoint.
+        - params (Dict, optional): Query string parameters.
+        - payload (Any, optional): Body of the request, serialized as JSON.
+        - extra_headers (Dict, optional): Headers sent in addition to the authentication headers.
+
+        Returns:
+        - The `TransportResponse` of the call.
+        """
+        client = active_client()
+        transport = client.transport if client else AthinaTransport.get_transport()
+        headers = AthinaApiService._headers()
+        if extra_headers:
+            headers.update(extra_headers)
+        body = None
+        if payload is not None:
+            with Profiling.phase("serialize"):
+                body = json.dumps(payload, allow_nan=False).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        if client is not None and client.limiter is not None:
+            with client.limiter:
+                return AthinaApiService._send(
+                    transport, method, endpoint, headers, params, body
+                )
+        return AthinaApiService._send(
+            transport, method, endpoint, headers, params, body
+        )
+
+    @staticmethod
+    def _stream(
+        method: str,
+        endpoint: str,
+        payload: Optional[Any] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> StreamingResponse:
+        """
+        Sends a request to the Athina API and returns once the response headers arrived.
+
+        The HTTP span of a streamed call ends, and its instrumentation event is emitted,
+        when its body has been read or the response is closed.
+        """
+        client = active_client()
+        transport = client.transport if client else AthinaTransport.get_transport()
+        headers = AthinaApiService._headers()
+        if extra_headers:
+            headers.update(extra_headers)
+        body = None
+        if payload is not None:
+            with Profiling.phase("serialize"):
+                body = json.dumps(payload, allow_nan=False).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        if not Instrumentation.is_enabled() and not Tracing.is_set():
+            return AthinaApiService._open_stream(
+                client, transport, method, endpoint, headers, body
+            )
+
+        operation = getattr(_call_state, "operation", None) or method
+        # The HTTP span stays open until the body has been read, so it is entered
+        # and exited by hand rather than with a `with` block.
+        span = Tracing.http_span(operation, method, endpoint, headers)
+        span.__enter__()
+        start = time.perf_counter()
+        try:
+            response = AthinaApiService._open_stream(
+                client, transport, method, endpoint, headers, body
+            )
+        except BaseException as e:
+            Instrumentation.emit(
+                ApiCallEvent(
+                    operation=operation,
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=None,
+                    total_time=time.perf_counter() - start,
+                    request_bytes=len(body) if body else 0,
+                    error=type(e).__name__,
+                )
+            )
+            span.__exit__(type(e), e, e.__traceback__)
+            raise
+
+        received = 0
+        finished = False
+
+        def finish(error: Optional[str]):
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            try:
+                Instrumentation.emit(
+                    ApiCallEvent(
+                        operation=operation,
+                        method=method,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                        total_time=time.perf_counter() - start,
+                        time_to_first_byte=response.elapsed,
+                        request_bytes=len(body) if body else 0,
+                        response_bytes=received,
+                        error=error,
+                    )
+                )
+            finally:
+                span.__exit__(None, None, None)
+
+        def counted_chunks():
+            nonlocal received
+            error = None
+            try:
+                for chunk in response.iter_chunks():
+                    received += len(chunk)
+                    yield chunk
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                finish(error)
+
+        chunks = counted_chunks()
+
+        def close():
+            chunks.close()
+            response.close()
+            # A stream closed before it was read still reports its call.
+            finish(None)
+
+        return StreamingResponse(
+            response.status_code,
+            response.headers,
+            chunks,
+            close=close,
+            elapsed=response.elapsed,
+        )
+
+    @staticmethod
+    def _open_stream(client, transport, method, endpoint, headers, body):
+        with Profiling.phase("wait"):
+            if client is not None and client.limiter is not None:
+                with client.limiter:
+                    return transport.stream(method, endpoint, headers, None, body)
+            return transport.stream(method, endpoint, headers, None, body)
+
+    @staticmethod
+    def batch_idempotency_key(
+        dataset_id: str, rows: List[Dict[str, Any]], offset: int
+    ) -> str:
+        """
+        Returns the deterministic idempotency key of a batch of rows: a hash of the
+        dataset ID, the offset of the batch's first row in the upload and the
+        canonical JSON of the rows. Identical batches at different offsets get
+        different keys.
+        """
+        with Profiling.phase("serialize"):
+            canonical = json.dumps(
+                [dataset_id, offset, rows],
+                sort_keys=True,
+                separators=(",", ":"),
+                default=str,
+            )
+            return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _conditional_get(endpoint: str) -> TransportResponse:
+        """
+        Sends a GET request with the validators of the cached response for the endpoint.
+
+        A `304 Not Modified` answer is returned as a `200` response carrying the cached body,
+        and successful responses are cached, so callers handle both alike.
+        """
+        key = ConditionalCache.key(
+            AthinaApiService._headers()["athina-api-key"], endpoint
+        )
+        entry = ConditionalCache.get(key)
+        response = AthinaApiService._read(
+            endpoint, extra_headers=entry.validators() if entry else None
+        )
+        if entry is not None and (
+            response.status_code == 304
+            or (response.status_code == 200 and entry.matches(response))
+        ):
+            ConditionalCache.record(hit=True)
+            if response.status_code == 304:
+                response = TransportResponse(
+                    200, response.headers, entry.content, response.elapsed
+                )
+            return response
+        ConditionalCache.record(hit=False)
+        if response.status_code == 304:
+            # The entry was evicted or the cache disabled since the request was sent.
+            response = AthinaApiService._read(endpoint)
+        if response.status_code == 200:
+            ConditionalCache.put(key, response)
+        return response
+
+    @staticmethod
+    def _read(endpoint: str, extra_headers: Optional[Dict[str, str]] = None):
+        """
+        Sends an idempotent GET request, hedged when `RequestHedging` is enabled.
+        """
+        if not RequestHedging.is_enabled():
+            return AthinaApiService._request(
+                "GET", endpoint, extra_headers=extra_headers
+            )
+
+        operation = getattr(_call_state, "operation", None)
+        attempt = getattr(_call_state, "attempt", -1)
+
+        def send():
+            # Hedged requests run on worker threads; keep their events attributed to the call.
+            _call_state.operation = operation
+            _call_state.attempt = attempt
+            return AthinaApiService._request(
+                "GET", endpoint, extra_headers=extra_headers
+            )
+
+        return RequestHedging.run(operation or endpoint, send)
+
+    @staticmethod
+    def _exchange(transport, method, endpoint, headers, params, body):
+        if not Profiling.is_enabled():
+            return transport.request(method, endpoint, headers, params, body)
+        start = time.perf_counter()
+        response = transport.request(method, endpoint, headers, params, body)
+        total = time.perf_counter() - start
+        # The transport reports when the headers arrived; the rest is spent on the body.
+        wait = min(response.elapsed, total) if response.elapsed is not None else total
+        Profiling.record("wait", wait)
+        Profiling.record("send", total - wait)
+        return response
+
+    @staticmethod
+    def _send(transport, method, endpoint, headers, params, body):
+        if not Instrumentation.is_enabled() and not Tracing.is_set():
+            return AthinaApiService._exchange(
+                transport, method, endpoint, headers, params, body
+            )
+
+        operation = getattr(_call_state, "operation", None) or method
+        with Tracing.http_span(operation, method, endpoint, headers):
+            start = time.perf_counter()
+            response = None
+            error = None
+            try:
+                response = AthinaApiService._exchange(
+                    transport, method, endpoint, headers, params, body
+                )
+                return response
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                Instrumentation.emit(
+                    ApiCallEvent(
+                        operation=operation,
+                        method=method,
+                        endpoint=endpoint,
+                        status_code=(
+                            response.status_code if response is not None else None
+                        ),
+                        total_time=time.perf_counter() - start,
+                        time_to_first_byte=(
+                            response.elapsed if response is not None else None
+                        ),
+                        request_bytes=len(body) if body else 0,
+                        response_bytes=(
+                            len(response.content) if response is not None else 0
+                        ),
+                        retries=max(getattr(_call_state, "attempt", 0), 0),
+                        error=error,
+                    )
+                )
+
+    @staticmethod
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def create_dataset(dataset: Dict):
         """
         Creates a dataset by calling the Athina API
@@ -41,10 +415,10 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2"
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json=dataset,
+                payload=dataset,
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -64,28 +438,61 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
-    def add_dataset_rows(dataset_id: str, rows: List[Dict[str, Any]]):
+    def add_dataset_rows(
+        dataset_id: str,
+        rows: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+    ):
         """
         Adds rows to a dataset by calling the Athina API.
 
+        Every batch is sent with an `Idempotency-Key` header, so a retry of a batch
+        the server already committed (e.g. after a timeout) is not appended twice.
+        A `409 Conflict` whose error names the duplicate idempotency key means the
+        batch was already added and is treated as success; any other conflict is an error.
+
         Parameters:
         - dataset_id (str): The ID of the dataset to which rows are added.
         - rows (List[Dict]): A list of rows to add to the dataset, where each row is represented as a dictionary.
+        - idempotency_key (str, optional): Key identifying the batch. Defaults to a random key that
+          is only reused by the retries of this call, so identical batches are all added.
 
         Returns:
         The API response data for the dataset after adding the rows.
 
         Raises:
+        - PayloadTooLargeException: If the request body exceeds the size limit of the API.
         - CustomException: If the API call fails or returns an error.
         """
+        if idempotency_key is None:
+            idempotency_key = str(uuid.uuid4())
+        return AthinaApiService._add_dataset_rows(dataset_id, rows, idempotency_key)
+
+    @staticmethod
+    @_retry(
+        operation="add_dataset_rows",
+        stop_max_attempt_number=2,
+        wait_fixed=1000,
+        # The same body would be rejected again.
+        retry_on_exception=lambda e: not isinstance(e, PayloadTooLargeException),
+    )
+    def _add_dataset_rows(
+        dataset_id: str, rows: List[Dict[str, Any]], idempotency_key: str
+    ):
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2/{dataset_id}/add-rows"
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json={"dataset_rows": rows},
+                payload={"dataset_rows": rows},
+                extra_headers={"Idempotency-Key": idempotency_key},
             )
+            if response.status_code == 409 and _is_duplicate_batch(response):
+                return {"message": "Rows already added"}
+            if response.status_code == 413:
+                raise PayloadTooLargeException(
+                    f"The batch of {len(rows)} rows is too large for the Athina API."
+                )
             if response.status_code == 401:
                 response_json = response.json()
                 error_message = response_json.get("error", "Unknown Error")
@@ -103,7 +510,7 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def list_datasets():
         """
         Lists all datasets by calling the Athina API.
@@ -116,7 +523,7 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2/all"
-            response = requests.get(endpoint, headers=AthinaApiService._headers())
+            response = AthinaApiService._conditional_get(endpoint)
             if response.status_code == 401:
                 response_json = response.json()
                 error_message = response_json.get("error", "Unknown Error")
@@ -134,7 +541,7 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def delete_dataset_by_id(dataset_id: str):
         """
         Deletes a dataset by calling the Athina API.
@@ -150,7 +557,7 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2/{dataset_id}"
-            response = requests.delete(endpoint, headers=AthinaApiService._headers())
+            response = AthinaApiService._request("DELETE", endpoint)
             if response.status_code == 401:
                 response_json = response.json()
                 error_message = response_json.get("error", "Unknown Error")
@@ -168,12 +575,13 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def get_dataset_by_id(
         dataset_id: str,
         limit: int = MAX_DATASET_ROWS,
         offset: int = 0,
-        include_dataset_annotations: bool = False
+        include_dataset_annotations: bool = False,
+        include_dataset_rows: bool = True,
     ):
         """
         Get a dataset by calling the Athina API.
@@ -183,6 +591,7 @@ class AthinaApiService:
         - limit (int, optional): Maximum number of dataset rows to return. Defaults to MAX_DATASET_ROWS.
         - offset (int, optional): Offset for dataset rows. Defaults to 0.
         - include_dataset_annotations (bool, optional): Whether to include dataset annotations. Defaults to False.
+        - include_dataset_rows (bool, optional): Whether to include dataset rows. Defaults to True.
 
         Returns:
         - The dataset object along with metrics and eval configs.
@@ -195,12 +604,12 @@ class AthinaApiService:
             params = {
                 "offset": offset,
                 "limit": limit,
-                "include_dataset_rows": "true",
-                "include_dataset_annotations": "true" if include_dataset_annotations else "false",
+                "include_dataset_rows": "true" if include_dataset_rows else "false",
+                "include_dataset_annotations": (
+                    "true" if include_dataset_annotations else "false"
+                ),
             }
-            response = requests.post(
-                endpoint, headers=AthinaApiService._headers(), params=params
-            )
+            response = AthinaApiService._request("POST", endpoint, params=params)
             if response.status_code == 401:
                 response_json = response.json()
                 error_message = response_json.get("error", "Unknown Error")
@@ -218,12 +627,58 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
+    def get_dataset_by_id_raw(
+        dataset_id: str,
+        limit: int = MAX_DATASET_ROWS,
+        offset: int = 0,
+        include_dataset_annotations: bool = False,
+    ) -> bytes:
+        """
+        Get a dataset by calling the Athina API, without decoding the response.
+
+        Parameters are the same as for `get_dataset_by_id`.
+
+        Returns:
+        - The undecoded JSON body of the response; the dataset is under its `data` key.
+
+        Raises:
+        - CustomException: If the API call fails or returns an error.
+        """
+        try:
+            endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2/fetch-by-id/{dataset_id}"
+            params = {
+                "offset": offset,
+                "limit": limit,
+                "include_dataset_rows": "true",
+                "include_dataset_annotations": (
+                    "true" if include_dataset_annotations else "false"
+                ),
+            }
+            response = AthinaApiService._request("POST", endpoint, params=params)
+            if response.status_code == 401:
+                response_json = response.json()
+                error_message = response_json.get("error", "Unknown Error")
+                details_message = "please check your athina api key and try again"
+                raise CustomException(error_message, details_message)
+            elif response.status_code != 200:
+                response_json = response.json()
+                error_message = response_json.get("error", "Unknown Error")
+                details_message = response_json.get("details", {}).get(
+                    "message", "No Details"
+                )
+                raise CustomException(error_message, details_message)
+            return response.content
+        except Exception as e:
+            raise
+
+    @staticmethod
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def get_dataset_by_name(
         name: str,
         limit: int = MAX_DATASET_ROWS,
         offset: int = 0,
-        include_dataset_annotations: bool = False
+        include_dataset_annotations: bool = False,
     ):
         """
         Get a dataset by calling the Athina API.
@@ -246,13 +701,15 @@ class AthinaApiService:
                 "offset": offset,
                 "limit": limit,
                 "include_dataset_rows": "true",
-                "include_dataset_annotations": "true" if include_dataset_annotations else "false",
+                "include_dataset_annotations": (
+                    "true" if include_dataset_annotations else "false"
+                ),
             }
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
                 params=params,
-                json={"name": name},
+                payload={"name": name},
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -271,7 +728,7 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def get_default_prompt(slug: str):
         """
         Get a default prompt by calling the Athina API.
@@ -287,7 +744,7 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/{slug}/default"
-            response = requests.get(endpoint, headers=AthinaApiService._headers())
+            response = AthinaApiService._conditional_get(endpoint)
             if response.status_code == 401:
                 response_json = response.json()
                 error_message = response_json.get("error", "Unknown Error")
@@ -305,7 +762,7 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def get_all_prompt_slugs():
         """
         Get all prompt slugs by calling the Athina API.
@@ -316,27 +773,54 @@ class AthinaApiService:
         Raises:
         - CustomException: If the API call fails or returns an error.
         """
-        try:
-            endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/slug/all"
-            response = requests.get(endpoint, headers=AthinaApiService._headers())
-            if response.status_code == 401:
-                response_json = response.json()
-                error_message = response_json.get("error", "Unknown Error")
-                details_message = "please check your athina api key and try again"
-                raise CustomException(error_message, details_message)
-            elif response.status_code != 200:
-                response_json = response.json()
-                error_message = response_json.get("error", "Unknown Error")
-                details_message = response_json.get("details", {}).get(
-                    "message", "No Details"
-                )
-                raise CustomException(error_message, details_message)
-            return response.json()["data"]["slugs"]
-        except Exception as e:
-            raise
+        return AthinaApiService._get_prompt_slugs_response().json()["data"]["slugs"]
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
+    def get_all_prompt_slugs_if_changed(version: Optional[str] = None):
+        """
+        Get all prompt slugs by calling the Athina API, unless the list is unchanged.
+
+        Parameters:
+        - version (str, optional): The version returned by an earlier call.
+
+        Returns:
+        - A `(version, slugs)` pair. `slugs` is None, and the response is not decoded, if the list
+          still has the given version. The version is the ETag of the response, or a digest of its
+          body if the server sends none.
+
+        Raises:
+        - CustomException: If the API call fails or returns an error.
+        """
+        response = AthinaApiService._get_prompt_slugs_response()
+        current = (
+            response.headers.get("etag")
+            or hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        )
+        if current == version:
+            return current, None
+        return current, response.json()["data"]["slugs"]
+
+    @staticmethod
+    def _get_prompt_slugs_response() -> TransportResponse:
+        endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/slug/all"
+        response = AthinaApiService._conditional_get(endpoint)
+        if response.status_code == 401:
+            response_json = response.json()
+            error_message = response_json.get("error", "Unknown Error")
+            details_message = "please check your athina api key and try again"
+            raise CustomException(error_message, details_message)
+        elif response.status_code != 200:
+            response_json = response.json()
+            error_message = response_json.get("error", "Unknown Error")
+            details_message = response_json.get("details", {}).get(
+                "message", "No Details"
+            )
+            raise CustomException(error_message, details_message)
+        return response
+
+    @staticmethod
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def delete_prompt_slug(slug: str):
         """
         Delete a prompt slug and its templates by calling the Athina API.
@@ -352,7 +836,7 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/slug/{slug}"
-            response = requests.delete(endpoint, headers=AthinaApiService._headers())
+            response = AthinaApiService._request("DELETE", endpoint)
             if response.status_code == 401:
                 response_json = response.json()
                 error_message = response_json.get("error", "Unknown Error")
@@ -370,7 +854,7 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def duplicate_prompt_slug(slug: str, name: str):
         """
         Duplicate a prompt slug by calling the Athina API.
@@ -389,10 +873,10 @@ class AthinaApiService:
             endpoint = (
                 f"{AthinaApiService._base_url()}/api/v1/prompt/slug/{slug}/duplicate"
             )
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json={"name": name},
+                payload={"name": name},
             )
             response_json = response.json()
 
@@ -408,13 +892,13 @@ class AthinaApiService:
                 raise CustomException(error_message, details_message)
 
             return response_json["data"]["slug"]
-        except requests.RequestException as e:
+        except _requests().RequestException as e:
             raise CustomException("Request failed", str(e))
         except Exception as e:
             raise CustomException("Unexpected error occurred", str(e))
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def create_prompt(slug: str, prompt_data: Dict[str, Any]):
         """
         Creates a prompt by calling the Athina API.
@@ -431,10 +915,10 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/{slug}"
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json=prompt_data,
+                payload=prompt_data,
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -453,7 +937,7 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def run_prompt(slug: str, request_data: Dict[str, Any]):
         """
         Runs a prompt by calling the Athina API.
@@ -470,10 +954,10 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/{slug}/run"
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json=request_data,
+                payload=request_data,
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -492,7 +976,118 @@ class AthinaApiService:
             raise
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    def stream_prompt(
+        slug: str, request_data: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Runs a prompt by calling the Athina API and streams the completion.
+
+        Streamed runs are not retried, since part of the output may already
+        have been consumed. If the server answers without an event stream, the
+        whole completion is reported as a single delta.
+
+        Parameters:
+        - slug (str): The slug of the prompt.
+        - request_data (Dict): The request data to run the prompt
+
+        Returns:
+        - An iterator of `("delta", text)` pairs, followed by one `("done", prompt_execution)` pair.
+
+        Raises:
+        - CustomException: If the API call fails or returns an error.
+        """
+        from athina_client.transport.sse import iter_sse_events
+
+        endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/{slug}/run"
+        # Streamed runs are not wrapped in `_retry`, which otherwise names the call.
+        _call_state.operation = "stream_prompt"
+        _call_state.attempt = 0
+        try:
+            response = AthinaApiService._stream(
+                "POST",
+                endpoint,
+                payload={**request_data, "stream": True},
+                extra_headers={"Accept": "text/event-stream"},
+            )
+        finally:
+            _call_state.operation = None
+            _call_state.attempt = -1
+        with response:
+            if response.status_code == 401:
+                response_json = json.loads(response.read() or b"{}")
+                error_message = response_json.get("error", "Unknown Error")
+                details_message = "please check your athina api key and try again"
+                raise CustomException(error_message, details_message)
+            elif response.status_code != 200:
+                response_json = json.loads(response.read() or b"{}")
+                error_message = response_json.get("error", "Unknown Error")
+                details_message = response_json.get("details", {}).get(
+                    "message", "No Details"
+                )
+                raise CustomException(error_message, details_message)
+
+            content_type = response.headers.get("content-type", "")
+            if not content_type.startswith("text/event-stream"):
+                execution = json.loads(response.read())["data"]["prompt"]
+                yield "delta", execution.get("prompt_response") or ""
+                yield "done", execution
+                return
+
+            for event, data in iter_sse_events(response.iter_lines()):
+                event_data = json.loads(data)
+                if event == "delta":
+                    yield "delta", event_data.get("text", "")
+                elif event == "done":
+                    yield "done", event_data.get("prompt", event_data)
+                    return
+                elif event == "error":
+                    raise CustomException(
+                        event_data.get("error", "Unknown Error"),
+                        event_data.get("details", {}).get("message", "No Details"),
+                    )
+            raise CustomException(
+                "Incomplete response", "the prompt run stream ended early"
+            )
+
+    @staticmethod
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
+    def get_prompt_version(slug: str, version: int):
+        """
+        Get a specific version of a prompt by calling the Athina API.
+
+        Parameters:
+        - slug (str): The slug of the prompt.
+        - version (int): The version to get.
+
+        Returns:
+        - The prompt object, or None if the slug has no such version.
+
+        Raises:
+        - CustomException: If the API call fails or returns an error.
+        """
+        try:
+            endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/{slug}/{version}"
+            response = AthinaApiService._request("GET", endpoint)
+            if response.status_code == 404:
+                return None
+            if response.status_code == 401:
+                response_json = response.json()
+                error_message = response_json.get("error", "Unknown Error")
+                details_message = "please check your athina api key and try again"
+                raise CustomException(error_message, details_message)
+            elif response.status_code != 200:
+                response_json = response.json()
+                error_message = response_json.get("error", "Unknown Error")
+                details_message = response_json.get("details", {}).get(
+                    "message", "No Details"
+                )
+                raise CustomException(error_message, details_message)
+            return response.json()["data"]["prompt"]
+        except Exception as e:
+            raise
+
+    @staticmethod
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def mark_prompt_as_default(slug: str, version: int):
         """
         Set a prompt version as the default by calling the Athina API.
@@ -509,7 +1104,7 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/{slug}/{version}/set-default"
-            response = requests.patch(endpoint, headers=AthinaApiService._headers())
+            response = AthinaApiService._request("PATCH", endpoint)
             response_json = response.json()
 
             if response.status_code == 401:
@@ -524,13 +1119,13 @@ class AthinaApiService:
                 raise CustomException(error_message, details_message)
 
             return response_json["data"]["prompt"]
-        except requests.RequestException as e:
+        except _requests().RequestException as e:
             raise CustomException("Request failed", str(e))
         except Exception as e:
             raise CustomException("Unexpected error occurred", str(e))
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def update_prompt_template_slug(slug: str, update_data: Dict[str, Any]):
         """
         Updates a prompt template slug by calling the Athina API.
@@ -547,10 +1142,10 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/prompt/slug/{slug}"
-            response = requests.patch(
+            response = AthinaApiService._request(
+                "PATCH",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json=update_data,
+                payload=update_data,
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -569,7 +1164,7 @@ class AthinaApiService:
             raise CustomException("Error updating prompt template slug", str(e))
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def change_dataset_project(dataset_id: str, project_name: str):
         """
         Change the project of a dataset by calling the Athina API.
@@ -586,10 +1181,10 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2/{dataset_id}/change-project/"
-            response = requests.post(
+            response = AthinaApiService._request(
+                "POST",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json={"project_name": project_name},
+                payload={"project_name": project_name},
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -608,7 +1203,7 @@ class AthinaApiService:
             raise CustomException("Error changing dataset project", str(e))
 
     @staticmethod
-    @retry(stop_max_attempt_number=2, wait_fixed=1000)
+    @_retry(stop_max_attempt_number=2, wait_fixed=1000)
     def update_dataset_cells(dataset_id: str, cells: List[Dict[str, Any]]):
         """
         Updates specific cells in a dataset by calling the Athina API.
@@ -628,10 +1223,10 @@ class AthinaApiService:
         """
         try:
             endpoint = f"{AthinaApiService._base_url()}/api/v1/dataset_v2/{dataset_id}/cells"
-            response = requests.put(
+            response = AthinaApiService._request(
+                "PUT",
                 endpoint,
-                headers=AthinaApiService._headers(),
-                json={"cells": cells},
+                payload={"cells": cells},
             )
             if response.status_code == 401:
                 response_json = response.json()
@@ -648,4 +1243,3 @@ class AthinaApiService:
             return response.json()["data"]
         except Exception as e:
             raise CustomException("Error updating dataset cells", str(e))
-
@@ -0,0 +1,20 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The `AthinaClient` whose configuration applies to API calls in the current
+# context. Context variables are per thread and per asyncio task, so clients
+# for different workspaces can be active concurrently.
+_active_client: ContextVar = ContextVar("athina_active_client", default=None)
+
+
+def active_client():
+    return _active_client.get()
+
+
+@contextmanager
+def client_scope(client):
+    token = _active_client.set(client)
+    try:
+        yield client
+    finally:
+        _active_client.reset(token)
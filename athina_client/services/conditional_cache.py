@@ -0,0 +1,136 @@
+import hashlib
+import threading
+from abc import ABC
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from athina_client.transport import TransportResponse
+
+
+class CachedResponse:
+    """
+    Validators and body of a previously fetched GET response.
+    """
+
+    __slots__ = ("etag", "last_modified", "digest", "content")
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        digest: bytes,
+        content: bytes,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.content = content
+
+    def validators(self) -> Optional[Dict[str, str]]:
+        """
+        Returns the conditional request headers for this response, if the server sent any validators.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers or None
+
+    def matches(self, response: TransportResponse) -> bool:
+        """
+        Whether a full response carries the same body as the cached one.
+        """
+        return _digest(response.content) == self.digest
+
+
+class ConditionalCache(ABC):
+    """
+    Process-wide LRU of validators (ETag / Last-Modified) and raw bodies for
+    the read endpoints that are typically polled, such as the default prompt of
+    a slug, the slug list and the dataset list.
+
+    Entries are keyed by API key and URL, so different workspaces never share
+    an entry. When a request is answered with `304 Not Modified`, the cached
+    body is decoded again, so every caller gets its own objects and the body
+    is not transferred.
+    """
+
+    _max_entries = 256
+    _enabled = True
+    _entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+    _stats = {"hits": 0, "misses": 0}
+    _lock = threading.Lock()
+
+    @classmethod
+    def enable(cls):
+        cls._enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls._enabled = False
+        cls.clear()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def set_max_entries(cls, max_entries: int):
+        with cls._lock:
+            cls._max_entries = max_entries
+            while len(cls._entries) > max_entries:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Returns the number of cache hits and misses, and the current number of entries.
+        """
+        with cls._lock:
+            return {**cls._stats, "entries": len(cls._entries)}
+
+    @staticmethod
+    def key(api_key: str, url: str) -> str:
+        return f"{hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]} {url}"
+
+    @classmethod
+    def get(cls, key: str) -> Optional[CachedResponse]:
+        if not cls._enabled:
+            return None
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                cls._entries.move_to_end(key)
+            return entry
+
+    @classmethod
+    def put(cls, key: str, response: TransportResponse):
+        if not cls._enabled:
+            return
+        entry = CachedResponse(
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            digest=_digest(response.content),
+            content=response.content,
+        )
+        with cls._lock:
+            cls._entries[key] = entry
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls._max_entries:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def record(cls, hit: bool):
+        with cls._lock:
+            cls._stats["hits" if hit else "misses"] += 1
+
+
+def _digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
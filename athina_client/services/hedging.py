@@ -0,0 +1,208 @@
+import contextvars
+import threading
+import time
+from abc import ABC
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class RequestHedging(ABC):
+    """
+    Opt-in request hedging for idempotent reads, such as fetching the default
+    prompt of a slug.
+
+    When enabled, a read that has not been answered after the `percentile`
+    latency of recent reads of the same operation is sent a second time, and
+    whichever request answers first is used. The other one is cancelled if it
+    has not been sent yet, and its response is discarded otherwise. A request
+    that fails does not win while the other one is still pending.
+
+    Hedges are paid for from a budget that grows by `max_extra_load` per read,
+    so hedging never adds more than that fraction of extra requests, even when
+    the server is slow for every caller.
+
+    Example:
+        ```python
+        RequestHedging.enable(percentile=95, max_extra_load=0.05)
+        prompt = Prompt.get_default("support-answer")
+        print(RequestHedging.stats())  # {"requests": 1, "hedges_issued": 0, ...}
+        ```
+    """
+
+    _enabled = False
+    _percentile = 95.0
+    _min_delay = 0.005
+    _max_extra_load = 0.05
+    _max_budget = 10.0
+    _min_samples = 20
+    _window = 256
+    _max_workers = 64
+    _budget = 0.0
+    _latencies: Dict[str, Deque[float]] = {}
+    _stats = {"requests": 0, "hedges_issued": 0, "hedges_won": 0, "hedges_skipped": 0}
+    _executor = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def enable(
+        cls,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        max_extra_load: float = 0.05,
+        min_samples: int = 20,
+        window: int = 256,
+        max_workers: int = 64,
+    ):
+        """
+        Args:
+            percentile (float): Latency percentile of recent reads after which a hedge is sent. Defaults to 95.
+            min_delay (float): Minimum delay in seconds before a hedge is sent. Defaults to 5 ms.
+            max_extra_load (float): Maximum number of hedges per read. Defaults to 0.05 (5% extra requests).
+            min_samples (int): Number of latencies an operation needs before its reads are hedged. Defaults to 20.
+            window (int): Number of most recent latencies kept per operation. Defaults to 256.
+            max_workers (int): Number of threads sending hedged reads. Defaults to 64.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100.")
+        with cls._lock:
+            cls._percentile = percentile
+            cls._min_delay = min_delay
+            cls._max_extra_load = max_extra_load
+            cls._min_samples = min_samples
+            if window != cls._window:
+                cls._window = window
+                cls._latencies = {}
+            if max_workers != cls._max_workers and cls._executor is not None:
+                cls._executor.shutdown(wait=False)
+                cls._executor = None
+            cls._max_workers = max_workers
+            cls._enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls._enabled = False
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Returns the number of reads sent while hedging was enabled, hedges issued,
+        hedges that answered first, and hedges skipped because the extra load
+        budget was spent.
+        """
+        with cls._lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def reset(cls):
+        """
+        Forgets the recorded latencies, the budget and the counters.
+        """
+        with cls._lock:
+            cls._latencies = {}
+            cls._budget = 0.0
+            cls._stats = {
+                "requests": 0,
+                "hedges_issued": 0,
+                "hedges_won": 0,
+                "hedges_skipped": 0,
+            }
+
+    @classmethod
+    def delay(cls, key: str) -> Optional[float]:
+        """
+        Returns the delay in seconds after which a read of the operation `key` is
+        hedged, or None while too few of its latencies have been recorded.
+        """
+        with cls._lock:
+            latencies = cls._latencies.get(key)
+            if latencies is None or len(latencies) < cls._min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(int(cls._percentile / 100 * len(ordered)), len(ordered) - 1)
+        return max(ordered[index], cls._min_delay)
+
+    @classmethod
+    def run(cls, key: str, send: Callable[[], Any]) -> Any:
+        """
+        Calls `send`, and calls it a second time if the first call takes longer
+        than the hedging delay of the operation `key`.
+
+        `send` must be idempotent. Once the operation can be hedged, it runs on a
+        worker thread in a copy of the caller's context.
+
+        Returns:
+            The result of the call that returned first.
+        """
+        delay = cls.delay(key)
+        with cls._lock:
+            cls._stats["requests"] += 1
+            cls._budget = min(cls._budget + cls._max_extra_load, cls._max_budget)
+        if delay is None:
+            start = time.perf_counter()
+            result = send()
+            cls._record(key, time.perf_counter() - start)
+            return result
+
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        primary = cls._submit(key, send)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+        with cls._lock:
+            hedge_allowed = cls._budget >= 1
+            if hedge_allowed:
+                cls._budget -= 1
+                cls._stats["hedges_issued"] += 1
+            else:
+                cls._stats["hedges_skipped"] += 1
+        if not hedge_allowed:
+            return primary.result()
+
+        hedge = cls._submit(key, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        with cls._lock:
+                            cls._stats["hedges_won"] += 1
+                    return future.result()
+        # Both requests failed: report the error of the original one.
+        return primary.result()
+
+    @classmethod
+    def _submit(cls, key: str, send: Callable[[], Any]):
+        with cls._lock:
+            if cls._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls._max_workers, thread_name_prefix="athina-hedge"
+                )
+            executor = cls._executor
+        context = contextvars.copy_context()
+
+        def timed():
+            start = time.perf_counter()
+            result = context.run(send)
+            cls._record(key, time.perf_counter() - start)
+            return result
+
+        return executor.submit(timed)
+
+    @classmethod
+    def _record(cls, key: str, latency: float):
+        # Latencies of every request, including discarded ones, so that the delay
+        # follows the latency of single requests rather than of hedged reads.
+        with cls._lock:
+            latencies = cls._latencies.get(key)
+            if latencies is None:
+                latencies = cls._latencies[key] = deque(maxlen=cls._window)
+            latencies.append(latency)
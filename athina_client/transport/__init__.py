@@ -0,0 +1,29 @@
+from .base import StreamingResponse, Transport, TransportResponse
+from .athina_transport import AthinaTransport
+
+__all__ = [
+    "AthinaTransport",
+    "CassetteMissError",
+    "CassetteTransport",
+    "HttpxTransport",
+    "RequestsTransport",
+    "StreamingResponse",
+    "Transport",
+    "TransportResponse",
+]
+
+# Transport backends import their HTTP libraries, so they are loaded on first use.
+_LAZY_ATTRIBUTES = {
+    "RequestsTransport": ".requests_transport",
+    "CassetteTransport": ".cassette",
+    "CassetteMissError": ".cassette",
+    "HttpxTransport": ".httpx_transport",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
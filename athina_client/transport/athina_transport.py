@@ -0,0 +1,65 @@
+from abc import ABC
+from typing import Optional
+
+from athina_client import constants
+
+TRANSPORT_BACKENDS = ("requests", "httpx")
+
+
+class AthinaTransport(ABC):
+    _transport = None
+
+    @classmethod
+    def set_transport(cls, transport):
+        cls._transport = transport
+
+    @classmethod
+    def get_transport(cls):
+        if cls._transport is None:
+            cls._transport = cls._default_transport()
+        return cls._transport
+
+    @classmethod
+    def is_set(cls):
+        return cls._transport is not None
+
+    @staticmethod
+    def create(
+        backend: Optional[str] = None,
+        max_connections: int = 10,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Creates a transport with its own connection pool.
+
+        Args:
+            backend (Optional[str]): 'requests' (pooled HTTP/1.1) or 'httpx' (HTTP/2).
+                Defaults to the ATHINA_TRANSPORT environment variable, else 'requests'.
+            max_connections (int): Maximum number of pooled connections. Defaults to 10.
+            timeout (Optional[float]): Request timeout in seconds.
+        """
+        backend = (backend or constants.ATHINA_TRANSPORT).lower()
+        if backend == "httpx":
+            from .httpx_transport import HttpxTransport
+
+            return HttpxTransport(max_connections=max_connections, timeout=timeout)
+        if backend == "requests":
+            from .requests_transport import RequestsTransport
+
+            return RequestsTransport(
+                pool_connections=max_connections,
+                pool_maxsize=max_connections,
+                timeout=timeout,
+            )
+        choices = ", ".join(TRANSPORT_BACKENDS)
+        raise ValueError(f"Unknown transport {backend!r}, expected one of: {choices}")
+
+    @staticmethod
+    def _default_transport():
+        if constants.ATHINA_CASSETTE:
+            from .cassette import CassetteTransport
+
+            return CassetteTransport(
+                constants.ATHINA_CASSETTE, mode=constants.ATHINA_CASSETTE_MODE
+            )
+        return AthinaTransport.create()
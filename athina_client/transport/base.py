@@ -0,0 +1,149 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from athina_client.instrumentation.profiling import Profiling
+
+
+class TransportResponse:
+    """
+    HTTP response returned by a transport.
+
+    Header names are lower-cased. `elapsed` is the time in seconds until the
+    response headers arrived, when the transport can measure it.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Optional[Dict[str, str]] = None,
+        content: bytes = b"",
+        elapsed: Optional[float] = None,
+    ):
+        self.status_code = status_code
+        self.headers = {k.lower(): v for k, v in (headers or {}).items()}
+        self.content = content
+        self.elapsed = elapsed
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        with Profiling.phase("decode"):
+            return json.loads(self.content)
+
+
+class StreamingResponse:
+    """
+    HTTP response whose body is read incrementally.
+
+    Header names are lower-cased. The body must be consumed or the response
+    closed (it is a context manager) to release the connection.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Optional[Dict[str, str]],
+        chunks: Iterator[bytes],
+        close: Optional[Callable[[], None]] = None,
+        elapsed: Optional[float] = None,
+    ):
+        self.status_code = status_code
+        self.headers = {k.lower(): v for k, v in (headers or {}).items()}
+        self.elapsed = elapsed
+        self._chunks = chunks
+        self._close = close
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """
+        Yields the body in chunks as they arrive.
+        """
+        for chunk in self._chunks:
+            if chunk:
+                yield chunk
+
+    def iter_lines(self) -> Iterator[bytes]:
+        """
+        Yields the body line by line as it arrives, without line terminators.
+        """
+        pending = b""
+        for chunk in self.iter_chunks():
+            pending += chunk
+            lines = pending.split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if pending:
+            yield pending.rstrip(b"\r")
+
+    def read(self) -> bytes:
+        """
+        Reads the remaining body at once.
+        """
+        return b"".join(self.iter_chunks())
+
+    def close(self):
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> "StreamingResponse":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Transport(ABC):
+    """
+    Sends HTTP requests on behalf of `AthinaApiService`.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> TransportResponse:
+        """
+        Sends a request and returns the fully read response.
+
+        Parameters:
+        - method (str): The HTTP method.
+        - url (str): The full URL, without query string.
+        - headers (Dict[str, str]): Request headers.
+        - params (Dict, optional): Query string parameters.
+        - body (bytes, optional): The encoded request body.
+        """
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> StreamingResponse:
+        """
+        Sends a request and returns as soon as the response headers arrived.
+
+        Transports that cannot stream fall back to this implementation, which
+        reads the whole response and returns it as a single chunk.
+        """
+        response = self.request(method, url, headers, params, body)
+        return StreamingResponse(
+            response.status_code,
+            response.headers,
+            iter([response.content]),
+            elapsed=response.elapsed,
+        )
+
+    def close(self):
+        """
+        Releases the resources (e.g. pooled connections) held by the transport.
+        """
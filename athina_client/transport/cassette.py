@@ -0,0 +1,145 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from athina_client.errors import CustomException
+from .base import Transport, TransportResponse
+
+CASSETTE_MODES = ("record", "replay", "auto")
+
+
+class CassetteMissError(CustomException):
+    def __init__(self, method: str, url: str):
+        super().__init__(
+            "No recorded response for request",
+            f"{method} {url} is not in the cassette",
+        )
+
+
+class CassetteTransport(Transport):
+    """
+    Records API responses to a cassette file and replays them without network.
+
+    Requests are keyed by method, URL path, query parameters, a hash of the
+    body and the conditional request headers (`If-None-Match`,
+    `If-Modified-Since`), so that a `304 Not Modified` is only replayed for the
+    conditional request it answered. A conditional request that was not
+    recorded is answered with the recorded full response. The base URL and
+    other request headers (including the API key) are not part of the key and
+    are never written to the cassette, so a cassette recorded against one
+    environment replays against any other.
+
+    Modes:
+    - "record": always send the request and store the response.
+    - "replay": only serve stored responses; unknown requests raise `CassetteMissError`.
+    - "auto": serve stored responses and record the ones that are missing.
+    """
+
+    def __init__(
+        self, path: str, mode: str = "auto", transport: Optional[Transport] = None
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Cassette mode must be one of {CASSETTE_MODES}")
+        self.path = path
+        self.mode = mode
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if mode != "record" and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+
+    @staticmethod
+    def request_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        parts = urlsplit(url)
+        key = {
+            "method": method.upper(),
+            "path": parts.path,
+            "params": sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            "body": hashlib.sha256(body or b"").hexdigest(),
+        }
+        validators = _validators(headers)
+        if validators:
+            key["validators"] = validators
+        return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> TransportResponse:
+        key = self.request_key(method, url, params, body, headers)
+        if self.mode != "record":
+            entry = self._entries.get(key)
+            if entry is None and _validators(headers):
+                # A full response answers a conditional request as well.
+                entry = self._entries.get(self.request_key(method, url, params, body))
+            if entry is not None:
+                return TransportResponse(
+                    entry["status_code"],
+                    entry["headers"],
+                    base64.b64decode(entry["content"]),
+                    0.0,
+                )
+            if self.mode == "replay":
+                raise CassetteMissError(method, url)
+
+        response = self._inner().request(method, url, headers, params, body)
+        self._record(key, method, url, response)
+        return response
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+    def _inner(self) -> Transport:
+        if self._transport is None:
+            from .requests_transport import RequestsTransport
+
+            self._transport = RequestsTransport()
+        return self._transport
+
+    def _record(self, key: str, method: str, url: str, response: TransportResponse):
+        entry = {
+            "key": key,
+            "method": method,
+            "path": urlsplit(url).path,
+            "status_code": response.status_code,
+            "headers": {
+                k: v
+                for k, v in response.headers.items()
+                if k in ("content-type", "etag", "last-modified")
+            },
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            self._entries[key] = entry
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+def _validators(headers: Optional[Dict[str, str]]):
+    return sorted(
+        (name.lower(), value)
+        for name, value in (headers or {}).items()
+        if name.lower() in ("if-none-match", "if-modified-since")
+    )
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Dict, Iterator, Optional, TypeVar
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError(
+        "HttpxTransport requires httpx. Install it with `pip install 'httpx[http2]'`."
+    )
+
+from .base import StreamingResponse, Transport, TransportResponse
+
+T = TypeVar("T")
+
+
+class HttpxTransport(Transport):
+    """
+    Transport backed by an `httpx.AsyncClient`, multiplexing requests over HTTP/2.
+
+    With HTTP/2, concurrent requests to the API share a few connections
+    instead of holding one HTTP/1.1 connection each. HTTP/2 is negotiated over
+    TLS; with `http1=False` it is also used without TLS (prior knowledge),
+    e.g. against a local server. Without the `h2` package, pass `http2=False`
+    to use httpx over HTTP/1.1.
+
+    The HTTP/2 connection state of httpx is not safe to share between threads,
+    so requests from all threads are run on one event loop owned by the transport.
+
+    Example:
+        ```python
+        AthinaTransport.set_transport(HttpxTransport(max_connections=4))
+        ```
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int = 10,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            http2 (bool): Use HTTP/2 when the server supports it. Requires `h2`. Defaults to True.
+            http1 (bool): Allow HTTP/1.1. Defaults to True; False forces HTTP/2.
+            max_connections (int): Maximum number of open connections. Defaults to 10.
+            timeout (Optional[float]): Request timeout in seconds. Defaults to None (no timeout).
+        """
+        self.timeout = timeout
+        try:
+            self.client = httpx.AsyncClient(
+                http1=http1,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=timeout,
+            )
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 requires h2. Install it with `pip install 'httpx[http2]'`."
+            )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="athina-httpx", daemon=True
+        )
+        self._thread.start()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> TransportResponse:
+        response = self._run(
+            self.client.request(
+                method, url, headers=headers, params=params, content=body
+            )
+        )
+        return TransportResponse(
+            response.status_code,
+            response.headers,
+            response.content,
+            response.elapsed.total_seconds(),
+        )
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> StreamingResponse:
+        request = self.client.build_request(
+            method, url, headers=headers, params=params, content=body
+        )
+        response = self._run(self.client.send(request, stream=True))
+        return StreamingResponse(
+            response.status_code,
+            response.headers,
+            self._iter_bytes(response),
+            close=lambda: self._run(response.aclose()),
+        )
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def _iter_bytes(self, response: "httpx.Response") -> Iterator[bytes]:
+        chunks = response.aiter_bytes()
+
+        async def next_chunk():
+            return await chunks.__anext__()
+
+        while True:
+            try:
+                yield self._run(next_chunk())
+            except StopAsyncIteration:
+                return
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            # E.g. a KeyboardInterrupt of the calling thread: stop the request as well.
+            future.cancel()
+            raise
@@ -0,0 +1,77 @@
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .base import StreamingResponse, Transport, TransportResponse
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by a `requests.Session`, reusing pooled HTTP/1.1 connections.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: Optional[float] = None,
+    ):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> TransportResponse:
+        response = self.session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=body,
+            timeout=self.timeout,
+        )
+        return TransportResponse(
+            response.status_code,
+            response.headers,
+            response.content,
+            response.elapsed.total_seconds(),
+        )
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+    ) -> StreamingResponse:
+        response = self.session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=body,
+            timeout=self.timeout,
+            stream=True,
+        )
+        return StreamingResponse(
+            response.status_code,
+            response.headers,
+            response.iter_content(chunk_size=None),
+            close=response.close,
+            elapsed=response.elapsed.total_seconds(),
+        )
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,28 @@
+from typing import Iterable, Iterator, Tuple
+
+
+def iter_sse_events(lines: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+    """
+    Parses a `text/event-stream` body into `(event, data)` pairs.
+
+    Multi-line data fields are joined with newlines; events without a name are
+    reported as "message", as in the SSE specification.
+    """
+    event, data = "message", []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+            continue
+        if line.startswith(b":"):
+            continue
+        field, _, value = line.decode("utf-8").partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
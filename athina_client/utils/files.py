@@ -0,0 +1,56 @@
+import contextlib
+import os
+import tempfile
+from typing import IO, Iterator, Optional
+
+_umask: Optional[int] = None
+
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = "wb") -> Iterator[IO]:
+    """
+    Opens a temporary file next to `path` and moves it to `path` when the block exits.
+
+    Readers never see a partially written file. Every call uses its own
+    temporary file, so concurrent writers of the same path (threads or
+    processes) do not interfere, and the temporary file is removed if the
+    block raises. The file gets the permissions of a file created with `open`.
+
+    Example:
+        ```python
+        with atomic_write("manifest.json", "w") as f:
+            json.dump(manifest, f)
+        ```
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    f = tempfile.NamedTemporaryFile(
+        mode,
+        encoding=None if "b" in mode else "utf-8",
+        dir=directory or None,
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with f:
+            # Temporary files are only accessible to their owner.
+            os.chmod(f.name, 0o666 & ~_get_umask())
+            yield f
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.remove(f.name)
+        except OSError:
+            pass
+        raise
+
+
+def _get_umask() -> int:
+    # The umask can only be read by setting it, so it is read once.
+    global _umask
+    if _umask is None:
+        _umask = os.umask(0o022)
+        os.umask(_umask)
+    return _umask
@@ -0,0 +1,94 @@
+"""
+Import-time benchmark for the SDK, based on `python -X importtime`.
+
+Every measurement runs in a fresh interpreter, so nothing is already cached in
+`sys.modules`. Reports the median cumulative import time of each module and
+the slowest modules it pulls in.
+
+Usage:
+    python -m benchmarks.import_time [--repeat N] [--top N] [--json PATH] [module ...]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_MODULES = ["athina_client.datasets", "athina_client.prompt"]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(module: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Imports `module` in a fresh interpreter.
+
+    Returns:
+        The cumulative import time of `module` in microseconds, and the
+        cumulative time of every module it imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            entries.append((match.group(4), int(match.group(2)), len(match.group(3))))
+
+    # A module's own imports are the deeper-indented lines right before it.
+    index = max(i for i, entry in enumerate(entries) if entry[0] == module)
+    _, total, depth = entries[index]
+    children = {}
+    for name, cumulative, child_depth in reversed(entries[:index]):
+        if child_depth <= depth:
+            break
+        children[name] = cumulative
+    return total, children
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        totals = []
+        for _ in range(args.repeat):
+            total, modules = import_times(module)
+            totals.append(total)
+        slowest = sorted(
+            modules.items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )[: args.top]
+        results[module] = {
+            "median_ms": statistics.median(totals) / 1000,
+            "min_ms": min(totals) / 1000,
+            "slowest_imports_ms": {name: time / 1000 for name, time in slowest},
+        }
+        print(
+            f"{module:<30} median {results[module]['median_ms']:>7.1f} ms"
+            f"  min {results[module]['min_ms']:>7.1f} ms"
+        )
+        for name, time in slowest:
+            print(f"    {name:<40} {time / 1000:>7.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
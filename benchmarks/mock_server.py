@@ -0,0 +1,654 @@
+"""
+In-process stand-in for the Athina API, used by the benchmarks.
+
+Serves the `/api/v1/dataset_v2/*` and `/api/v1/prompt/*` endpoints used by the
+SDK with generated payloads. Latency, error rate and payload sizes are
+configurable, so client-side performance can be measured without network
+access.
+"""
+
+import hashlib
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+TIMESTAMP = "2024-01-01T00:00:00.000Z"
+
+
+class MockAthinaServer:
+    """
+    Local HTTP server answering like the Athina API.
+
+    Args:
+        latency (float): Seconds to wait before answering each request.
+        error_rate (float): Fraction of requests answered with a 500 error.
+        slow_rate (float): Fraction of requests delayed by an extra `slow_latency`.
+        slow_latency (float): Extra seconds a slow request waits before it is answered.
+        latency_per_mb (float): Extra seconds per MB of request body, as spent parsing and storing it.
+        max_body_bytes (Optional[int]): Requests with a larger body are answered with a 413 error.
+        lost_response_rate (float): Fraction of row batches that are committed but whose
+            connection is dropped before the response is sent.
+        dataset_rows (int): Number of rows in every dataset.
+        eval_configs (int): Number of eval columns in every dataset.
+        cell_bytes (int): Approximate size of every text cell.
+        slugs (int): Number of prompt slugs in the workspace.
+        prompt_versions (int): Number of versions of every prompt.
+        completion_tokens (int): Number of words in prompt run responses.
+        token_latency (float): Seconds between two streamed completion tokens.
+        seed (int): Seed of the payload generator.
+        etags (bool): Answer GET requests with an ETag and honour If-None-Match.
+        http2 (bool): Serve HTTP/2 without TLS (prior knowledge) instead of HTTP/1.1.
+            Requires the `h2` package.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_latency: float = 0.0,
+        latency_per_mb: float = 0.0,
+        max_body_bytes: Optional[int] = None,
+        lost_response_rate: float = 0.0,
+        dataset_rows: int = 1000,
+        eval_configs: int = 3,
+        cell_bytes: int = 200,
+        slugs: int = 200,
+        prompt_versions: int = 3,
+        completion_tokens: int = 50,
+        token_latency: float = 0.0,
+        seed: int = 0,
+        etags: bool = True,
+        http2: bool = False,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.latency_per_mb = latency_per_mb
+        self.max_body_bytes = max_body_bytes
+        self.lost_response_rate = lost_response_rate
+        self.dataset_rows = dataset_rows
+        self.eval_configs = eval_configs
+        self.cell_bytes = cell_bytes
+        self.slugs = slugs
+        self.prompt_versions = prompt_versions
+        self.completion_tokens = completion_tokens
+        self.token_latency = token_latency
+        self.random = random.Random(seed)
+        self.etags = etags
+        self.http2 = http2
+        self.requests = 0
+        self.connections = 0
+        self.not_modified = 0
+        self.received_rows = 0
+        self.duplicate_batches = 0
+        self._idempotency_keys = set()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockAthinaServer":
+        server = self
+
+        class Handler(_Handler):
+            mock = server
+
+        server_class = _H2Server if self.http2 else ThreadingHTTPServer
+        self._server = server_class(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockAthinaServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Payload generators
+
+    def text(self, prefix: str) -> str:
+        filler = "lorem ipsum dolor sit amet "
+        repeat = max(self.cell_bytes // len(filler), 1)
+        return f"{prefix} {filler * repeat}".strip()
+
+    def dataset(self, dataset_id: str, name: str = "benchmark") -> Dict[str, Any]:
+        return {
+            "id": dataset_id,
+            "source": "dev_sdk",
+            "user_id": "user",
+            "org_id": "org",
+            "workspace_slug": "default",
+            "name": name,
+            "description": None,
+            "language_model_id": None,
+            "prompt_template": None,
+            "reference_dataset_id": None,
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "project_name": None,
+        }
+
+    def eval_config_list(self) -> List[Dict[str, Any]]:
+        return [
+            {"id": f"config-{i}", "display_name": f"Eval {i}", "eval_type_id": "llm"}
+            for i in range(self.eval_configs)
+        ]
+
+    def dataset_page(
+        self, dataset_id: str, limit: int, offset: int, include_rows: bool
+    ):
+        rows = []
+        if include_rows:
+            first = offset * limit
+            for row_no in range(first, min(first + limit, self.dataset_rows)):
+                rows.append(
+                    {
+                        "query": self.text(f"query {row_no}"),
+                        "context": [self.text(f"context {row_no}")],
+                        "response": self.text(f"response {row_no}"),
+                        "dataset_eval_results": [
+                            {
+                                "development_eval_config_id": f"config-{i}",
+                                "metric_id": "score",
+                                "metric_value": str(row_no % 5),
+                                "explanation": self.text("explanation"),
+                            }
+                            for i in range(self.eval_configs)
+                        ],
+                    }
+                )
+        return {
+            "dataset": self.dataset(dataset_id),
+            "dataset_rows": rows,
+            "development_eval_configs": self.eval_config_list(),
+        }
+
+    def prompt(self, slug: str, version: int = 1) -> Dict[str, Any]:
+        return {
+            "id": f"{slug}-{version}",
+            "user_id": "user",
+            "org_id": "org",
+            "workspace_slug": "default",
+            "prompt_template_slug_id": slug,
+            "commit_message": "benchmark",
+            "prompt": [{"role": "user", "content": "Answer {{query}}"}],
+            "tools": None,
+            "tool_choice": None,
+            "version": version,
+            "is_default": version == 1,
+            "model": "gpt-4o",
+            "org_model_config_id": None,
+            "parameters": {"temperature": 0},
+            "hash": f"hash-{slug}-{version}",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "org_model_config": None,
+        }
+
+    def slug(self, index: int) -> Dict[str, Any]:
+        return {
+            "id": f"slug-{index}",
+            "org_id": "org",
+            "workspace_slug": "default",
+            "name": f"prompt-{index}",
+            "directory": f"directory-{index % 10}",
+            "starred": index % 7 == 0,
+            "emoji": None,
+            "created_by": "user",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "user": None,
+        }
+
+    def completion(self) -> str:
+        return " ".join(["token"] * self.completion_tokens)
+
+    def prompt_execution(self, slug: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": str(uuid.uuid4()),
+            "user_id": "user",
+            "org_id": "org",
+            "workspace_slug": "default",
+            "prompt_template_id": f"{slug}-{request.get('version') or 1}",
+            "variables": request.get("variables", {}),
+            "language_model_id": request.get("model") or "gpt-4o",
+            "org_model_config_id": None,
+            "prompt_sent": [{"role": "user", "content": "Answer"}],
+            "prompt_response": self.completion(),
+            "tools": None,
+            "tool_choice": None,
+            "prompt_tokens": 10,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": 10 + self.completion_tokens,
+            "cost": 0.0001,
+            "response_time": 100,
+            "options": {},
+            "grader_feedback": None,
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+        }
+
+
+_ROUTES = []
+
+
+def _route(method: str, pattern: str):
+    def decorator(func):
+        _ROUTES.append((method, re.compile(f"^{pattern}$"), func))
+        return func
+
+    return decorator
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    mock: MockAthinaServer
+
+    def setup(self):
+        super().setup()
+        with self.mock._lock:
+            self.mock.connections += 1
+        # Headers and body are written separately; without TCP_NODELAY, Nagle's
+        # algorithm delays the body on kept-alive connections.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away, e.g. after closing a stream early.
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        self._handle(method, raw_body)
+
+    def _handle(self, method: str, raw_body: bytes):
+        mock = self.mock
+        with mock._lock:
+            mock.requests += 1
+            fail = mock.random.random() < mock.error_rate
+            slow = mock.random.random() < mock.slow_rate
+        if mock.latency:
+            time.sleep(mock.latency)
+        if slow:
+            time.sleep(mock.slow_latency)
+        if mock.latency_per_mb and raw_body:
+            time.sleep(mock.latency_per_mb * len(raw_body) / 1_000_000)
+
+        if "athina-api-key" not in self.headers:
+            return self._send(401, {"error": "Unauthorized"})
+        if fail:
+            return self._send(500, {"error": "Injected error"})
+        if mock.max_body_bytes is not None and len(raw_body) > mock.max_body_bytes:
+            return self._send(413, {"error": "Payload Too Large"})
+
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        body = json.loads(raw_body) if raw_body else {}
+        for route_method, pattern, handler in _ROUTES:
+            match = pattern.match(url.path)
+            if route_method == method and match:
+                return handler(self, *match.groups(), query=query, body=body)
+        self._send(404, {"error": "Not Found"})
+
+    def _send(self, status: int, payload: Any):
+        data = json.dumps(payload).encode("utf-8")
+        etag = None
+        if self.command == "GET" and status == 200 and self.mock.etags:
+            etag = f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                with self.mock._lock:
+                    self.mock.not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @_route("POST", "/api/v1/dataset_v2")
+    def create_dataset(self, query, body):
+        with self.mock._lock:
+            self.mock.received_rows += len(body.get("dataset_rows", []))
+        dataset = self.mock.dataset(str(uuid.uuid4()), body.get("name", "benchmark"))
+        self._send(200, {"data": {"dataset": dataset}})
+
+    @_route("POST", "/api/v1/dataset_v2/([^/]+)/add-rows")
+    def add_rows(self, dataset_id, query, body):
+        key = self.headers.get("Idempotency-Key")
+        mock = self.mock
+        with mock._lock:
+            if key is not None and (dataset_id, key) in mock._idempotency_keys:
+                mock.duplicate_batches += 1
+                duplicate = True
+            else:
+                duplicate = False
+                mock._idempotency_keys.add((dataset_id, key))
+                mock.received_rows += len(body.get("dataset_rows", []))
+            lose_response = mock.random.random() < mock.lost_response_rate
+        if duplicate:
+            return self._send(409, {"error": "Duplicate idempotency key"})
+        if lose_response:
+            self.close_connection = True
+            return
+        self._send(200, {"data": {"message": "Rows added"}})
+
+    @_route("GET", "/api/v1/dataset_v2/all")
+    def list_datasets(self, query, body):
+        self._send(
+            200, {"datasets": [self.mock.dataset(f"dataset-{i}") for i in range(10)]}
+        )
+
+    @_route("POST", "/api/v1/dataset_v2/fetch-by-id/([^/]+)")
+    def fetch_by_id(self, dataset_id, query, body):
+        page = self.mock.dataset_page(
+            dataset_id,
+            int(query.get("limit", 50000)),
+            int(query.get("offset", 0)),
+            query.get("include_dataset_rows", "true") == "true",
+        )
+        self._send(200, {"data": page})
+
+    @_route("POST", "/api/v1/dataset_v2/fetch-by-name")
+    def fetch_by_name(self, query, body):
+        self.fetch_by_id(body.get("name", "benchmark"), query, body)
+
+    @_route("DELETE", "/api/v1/dataset_v2/([^/]+)")
+    def delete_dataset(self, dataset_id, query, body):
+        self._send(200, {"data": {"message": "Dataset deleted"}})
+
+    @_route("PUT", "/api/v1/dataset_v2/([^/]+)/cells")
+    def update_cells(self, dataset_id, query, body):
+        self._send(200, {"data": {"updated": len(body.get("cells", []))}})
+
+    @_route("POST", "/api/v1/dataset_v2/([^/]+)/change-project/")
+    def change_project(self, dataset_id, query, body):
+        self._send(200, {"data": self.mock.dataset(dataset_id)})
+
+    @_route("GET", "/api/v1/prompt/slug/all")
+    def list_slugs(self, query, body):
+        slugs = [self.mock.slug(i) for i in range(self.mock.slugs)]
+        self._send(200, {"data": {"slugs": slugs}})
+
+    @_route("PATCH", "/api/v1/prompt/slug/([^/]+)")
+    def update_slug(self, slug, query, body):
+        self._send(200, {"data": {"slug": {**self.mock.slug(0), "name": slug, **body}}})
+
+    @_route("DELETE", "/api/v1/prompt/slug/([^/]+)")
+    def delete_slug(self, slug, query, body):
+        self._send(200, {"message": "Slug deleted"})
+
+    @_route("POST", "/api/v1/prompt/slug/([^/]+)/duplicate")
+    def duplicate_slug(self, slug, query, body):
+        new_slug = {**self.mock.slug(0), "name": body.get("name", slug)}
+        self._send(
+            200,
+            {
+                "data": {
+                    "slug": {
+                        "newPromptTemplateSlug": new_slug,
+                        "newPromptTemplate": self.mock.prompt(new_slug["name"]),
+                    }
+                }
+            },
+        )
+
+    @_route("GET", "/api/v1/prompt/([^/]+)/default")
+    def default_prompt(self, slug, query, body):
+        self._send(200, {"data": {"prompt": self.mock.prompt(slug)}})
+
+    @_route("GET", "/api/v1/prompt/([^/]+)/(\\d+)")
+    def prompt_version(self, slug, version, query, body):
+        if not 1 <= int(version) <= self.mock.prompt_versions:
+            return self._send(404, {"error": "Prompt version not found"})
+        self._send(200, {"data": {"prompt": self.mock.prompt(slug, int(version))}})
+
+    @_route("PATCH", "/api/v1/prompt/([^/]+)/(\\d+)/set-default")
+    def set_default(self, slug, version, query, body):
+        self._send(200, {"data": {"prompt": self.mock.prompt(slug, int(version))}})
+
+    def _send_events(self, events):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for event, data in events:
+                payload = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode(
+                    "utf-8"
+                )
+                self.wfile.write(
+                    f"{len(payload):x}\r\n".encode("ascii") + payload + b"\r\n"
+                )
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading the stream.
+            self.close_connection = True
+
+    @_route("POST", "/api/v1/prompt/([^/]+)/run")
+    def run_prompt(self, slug, query, body):
+        execution = self.mock.prompt_execution(slug, body)
+        if not body.get("stream"):
+            return self._send(200, {"data": {"prompt": execution}})
+
+        def events():
+            for index in range(self.mock.completion_tokens):
+                if self.mock.token_latency:
+                    time.sleep(self.mock.token_latency)
+                yield "delta", {"text": "token" if index == 0 else " token"}
+            yield "done", {"prompt": execution}
+
+        self._send_events(events())
+
+    @_route("POST", "/api/v1/prompt/([^/]+)")
+    def create_prompt(self, slug, query, body):
+        self._send(200, {"data": {"prompt": {**self.mock.prompt(slug), **body}}})
+
+
+class _H2Server(ThreadingHTTPServer):
+    """
+    Serves HTTP/2 with prior knowledge: one thread per connection reads frames,
+    and every request runs on its own thread through the HTTP/1.1 route handlers.
+    """
+
+    def finish_request(self, request, client_address):
+        _H2Connection(request, self.RequestHandlerClass).serve()
+
+
+class _H2Connection:
+    def __init__(self, sock: socket.socket, handler_class):
+        import h2.config
+        import h2.connection
+
+        self.sock = sock
+        self.handler_class = handler_class
+        self.h2 = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        # Guards the H2 state machine and the socket; notified on flow control updates.
+        self.condition = threading.Condition()
+        self.streams: Dict[int, Any] = {}
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with handler_class.mock._lock:
+            handler_class.mock.connections += 1
+
+    def serve(self):
+        import h2.events
+
+        with self.condition:
+            self.h2.initiate_connection()
+            self._flush()
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except OSError:
+                return
+            if not data:
+                return
+            with self.condition:
+                events = self.h2.receive_data(data)
+                self._flush()
+                self.condition.notify_all()
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    self.streams[event.stream_id] = (dict(event.headers), bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    self.streams[event.stream_id][1].extend(event.data)
+                    with self.condition:
+                        self.h2.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                        self._flush()
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = self.streams.pop(event.stream_id)
+                    threading.Thread(
+                        target=self._respond,
+                        args=(event.stream_id, headers, bytes(body)),
+                        daemon=True,
+                    ).start()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+
+    def _respond(self, stream_id: int, headers: Dict[str, str], body: bytes):
+        import h2.exceptions
+
+        exchange = _H2Exchange(self, stream_id, headers)
+        try:
+            exchange._handle(headers[":method"], body)
+            exchange.finish()
+        except (OSError, h2.exceptions.H2Error):
+            # The client reset the stream or closed the connection.
+            pass
+
+    def send_headers(self, stream_id: int, headers, end_stream: bool = False):
+        with self.condition:
+            self.h2.send_headers(stream_id, headers, end_stream=end_stream)
+            self._flush()
+
+    def send_data(self, stream_id: int, data: bytes, end_stream: bool = False):
+        with self.condition:
+            while True:
+                window = min(
+                    self.h2.local_flow_control_window(stream_id),
+                    self.h2.max_outbound_frame_size,
+                )
+                if data and window <= 0:
+                    self.condition.wait()
+                    continue
+                chunk, data = data[:window], data[window:]
+                self.h2.send_data(stream_id, chunk, end_stream=end_stream and not data)
+                self._flush()
+                if not data:
+                    return
+
+    def reset(self, stream_id: int):
+        with self.condition:
+            self.h2.reset_stream(stream_id)
+            self._flush()
+
+    def _flush(self):
+        data = self.h2.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+
+class _H2Exchange(_Handler):
+    """
+    A single HTTP/2 request, answered by the HTTP/1.1 route handlers.
+    """
+
+    def __init__(self, connection: _H2Connection, stream_id: int, headers):
+        from http.client import HTTPMessage
+
+        self.mock = connection.handler_class.mock
+        self.connection = connection
+        self.stream_id = stream_id
+        self.command = headers[":method"]
+        self.path = headers[":path"]
+        self.headers = HTTPMessage()
+        for name, value in headers.items():
+            if not name.startswith(":"):
+                self.headers[name] = value
+        self.close_connection = False
+        self.wfile = self
+        self._response_headers = []
+        self._headers_sent = False
+
+    def send_response(self, code, message=None):
+        self._response_headers = [(":status", str(code))]
+
+    def send_header(self, keyword, value):
+        if keyword.lower() not in ("connection", "transfer-encoding"):
+            self._response_headers.append((keyword.lower(), str(value)))
+
+    def end_headers(self):
+        self.connection.send_headers(self.stream_id, self._response_headers)
+        self._headers_sent = True
+
+    def write(self, data: bytes):
+        self.connection.send_data(self.stream_id, data)
+
+    def flush(self):
+        pass
+
+    def finish(self):
+        if self.close_connection or not self._headers_sent:
+            # A lost response: the request was handled but no answer is sent.
+            self.connection.reset(self.stream_id)
+        else:
+            self.connection.send_data(self.stream_id, b"", end_stream=True)
+
+    def _send_events(self, events):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for event, data in events:
+            self.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
@@ -0,0 +1,464 @@
+"""
+Client-side benchmarks against the local mock Athina server.
+
+Usage:
+    python -m benchmarks.run [--iterations N] [--latency SECONDS] [--error-rate RATE]
+                             [--rows N] [--json PATH] [benchmark ...]
+"""
+
+import argparse
+import copy
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from athina_client.api_base_url import AthinaApiBaseUrl
+from athina_client.datasets import Dataset
+from athina_client.keys import AthinaApiKey
+from athina_client.prompt import Prompt, Slug
+
+from .mock_server import MockAthinaServer
+
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def measure(
+    func: Callable[[], Optional[int]],
+    iterations: int,
+    setup: Optional[Callable[[], None]] = None,
+    warmup: int = 1,
+) -> Dict[str, float]:
+    """
+    Runs `func` repeatedly and summarizes its latency.
+
+    `func` may return the number of items (e.g. rows) it processed, which is
+    reported as item throughput. `setup` runs before every call and is not timed.
+    Calls that raise are counted as errors and still included in the latencies.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+
+    latencies: List[float] = []
+    items = 0
+    errors = 0
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        try:
+            items += func() or 0
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    total = sum(latencies)
+    result = {
+        "iterations": iterations,
+        "ops_per_second": iterations / total if total else float("inf"),
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "errors": errors,
+    }
+    if items:
+        result["items_per_second"] = items / total if total else float("inf")
+    return result
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = min(int(round(q / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+@benchmark("add_rows")
+def bench_add_rows(server: MockAthinaServer, args):
+    rows = [
+        {"query": server.text(f"query {i}"), "response": server.text(f"response {i}")}
+        for i in range(args.rows)
+    ]
+
+    def run():
+        Dataset.add_rows("benchmark", rows)
+        return len(rows)
+
+    return measure(run, args.iterations)
+
+
+@benchmark("upload_adaptive")
+def bench_upload_adaptive(server: MockAthinaServer, args):
+    """
+    `upload_rows` of short and of long rows with a fixed `batch_size` of 100 and
+    with an `AdaptiveBatcher`, against a mock server that charges `--latency-per-mb`
+    per MB of request body and rejects bodies over `--max-body-bytes`.
+    """
+    from athina_client.datasets import AdaptiveBatcher, upload_rows
+
+    shapes = {
+        "short": [
+            {"query": f"query {i}", "response": "ok"} for i in range(args.rows * 10)
+        ],
+        "long": [
+            {"query": f"query {i}", "context": "lorem ipsum " * 4000}
+            for i in range(max(args.rows // 5, 1))
+        ],
+    }
+    variants = {}
+    with MockAthinaServer(
+        latency=max(args.latency, 0.01),
+        latency_per_mb=args.latency_per_mb,
+        max_body_bytes=args.max_body_bytes,
+    ) as upload_server:
+        AthinaApiBaseUrl.set_url(upload_server.url)
+        try:
+            for shape, rows in shapes.items():
+
+                def fixed():
+                    upload_rows(rows, dataset_id="benchmark", max_workers=4)
+                    return len(rows)
+
+                batcher = None
+
+                def adaptive():
+                    nonlocal batcher
+                    batcher = AdaptiveBatcher(max_workers=4)
+                    upload_rows(rows, dataset_id="benchmark", batcher=batcher)
+                    return len(rows)
+
+                # Fixed batches of long rows exceed the body limit, so no warmup call
+                # that would abort the benchmark.
+                variants[f"{shape} fixed"] = measure(fixed, args.iterations, warmup=0)
+                variants[f"{shape} adaptive"] = measure(adaptive, args.iterations)
+                variants[f"{shape} adaptive"].update(batcher.stats())
+        finally:
+            AthinaApiBaseUrl.set_url(server.url)
+
+    result = dict(variants["short adaptive"])
+    result["variants"] = variants
+    return result
+
+
+@benchmark("conditional_slug_list")
+def bench_conditional_slug_list(server: MockAthinaServer, args):
+    """
+    `Slug.list` of `--slugs` slugs with the `ConditionalCache` disabled, where
+    every response carries and decodes the full list, and enabled, where the
+    unchanged list is answered with `304 Not Modified` and the cached body is
+    decoded again.
+    """
+    from athina_client.services import ConditionalCache
+
+    def run():
+        return len(Slug.list())
+
+    variants = {}
+    try:
+        ConditionalCache.disable()
+        variants["unconditional"] = measure(run, args.iterations)
+        ConditionalCache.enable()
+        variants["not modified"] = measure(run, args.iterations)
+        variants["not modified"].update(ConditionalCache.stats())
+    finally:
+        ConditionalCache.enable()
+
+    result = dict(variants["not modified"])
+    result["variants"] = variants
+    return result
+
+
+@benchmark("get_dataset_by_id")
+def bench_get_dataset_by_id(server: MockAthinaServer, args):
+    def run():
+        response = Dataset.get_dataset_by_id("benchmark", limit=args.rows)
+        return len(response["dataset_rows"])
+
+    return measure(run, args.iterations)
+
+
+@benchmark("clean_response")
+def bench_clean_response(server: MockAthinaServer, args):
+    raw = server.dataset_page("benchmark", args.rows, 0, True)
+    state = {}
+
+    def setup():
+        # _clean_response rewrites rows in place, so every run gets a fresh copy.
+        state["response"] = copy.deepcopy(raw)
+
+    def run():
+        cleaned = Dataset._clean_response(state["response"], args.response_format)
+        return len(cleaned["dataset_rows"])
+
+    return measure(run, args.iterations, setup=setup)
+
+
+@benchmark("clean_parallel")
+def bench_clean_parallel(server: MockAthinaServer, args):
+    from athina_client.datasets import ParallelCleaner
+
+    page = server.dataset_page("benchmark", args.rows, 0, True)
+    raw = json.dumps({"status": "success", "data": page}).encode("utf-8")
+    results = {}
+    for processes in args.processes:
+        with ParallelCleaner(max_workers=processes, min_bytes=0) as cleaner:
+
+            def run():
+                cleaned = cleaner.clean(raw, args.response_format)
+                return len(cleaned["dataset_rows"])
+
+            results[processes] = measure(run, args.iterations)
+    # Report the largest pool; the per-pool results show the scaling.
+    result = dict(results[args.processes[-1]])
+    result["variants"] = {
+        f"{processes} processes": by_processes
+        for processes, by_processes in results.items()
+    }
+    return result
+
+
+@benchmark("concurrent_prompt_run")
+def bench_concurrent_prompt_run(server: MockAthinaServer, args):
+    """
+    `--concurrency` concurrent `Prompt.run` calls over pooled HTTP/1.1 (requests)
+    and, if httpx and h2 are installed, multiplexed HTTP/2 against an HTTP/2 mock server.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from athina_client.client import AthinaClient
+    from athina_client.transport import RequestsTransport
+
+    def run_with(mock: MockAthinaServer, transport) -> Dict[str, float]:
+        connections = mock.connections
+        with AthinaClient(
+            "benchmark", base_url=mock.url, transport=transport
+        ) as client, ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+
+            def call(_):
+                client.prompts.run("benchmark", {"query": "What is Athina?"})
+
+            def run():
+                list(executor.map(call, range(args.concurrency)))
+                return args.concurrency
+
+            result = measure(run, args.iterations)
+        result["connections"] = mock.connections - connections
+        return result
+
+    variants = {
+        "requests HTTP/1.1": run_with(
+            server,
+            RequestsTransport(
+                pool_connections=args.concurrency, pool_maxsize=args.concurrency
+            ),
+        )
+    }
+    try:
+        from athina_client.transport import HttpxTransport
+
+        variants["httpx HTTP/1.1"] = run_with(
+            server, HttpxTransport(http2=False, max_connections=args.concurrency)
+        )
+        with MockAthinaServer(
+            latency=args.latency, error_rate=args.error_rate, http2=True
+        ) as h2_server:
+            variants["httpx HTTP/2"] = run_with(
+                h2_server, HttpxTransport(http1=False, max_connections=args.concurrency)
+            )
+    except ImportError as e:
+        print(f"concurrent_prompt_run: skipping httpx ({e})", file=sys.stderr)
+
+    result = dict(variants["requests HTTP/1.1"])
+    result["variants"] = variants
+    return result
+
+
+@benchmark("hedged_get_default")
+def bench_hedged_get_default(server: MockAthinaServer, args):
+    """
+    `Prompt.get_default` against a mock server that answers `--slow-rate` of the
+    requests `--slow-latency` seconds late, without and with `RequestHedging`.
+    """
+    from athina_client.services import RequestHedging
+
+    iterations = max(args.iterations, 200)
+    variants = {}
+    with MockAthinaServer(
+        latency=args.latency,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+    ) as slow_server:
+        AthinaApiBaseUrl.set_url(slow_server.url)
+
+        def run():
+            Prompt.get_default("benchmark")
+
+        try:
+            variants["unhedged"] = measure(run, iterations)
+            RequestHedging.reset()
+            RequestHedging.enable()
+            # Collect the latencies the hedging delay is derived from.
+            for _ in range(50):
+                run()
+            hedged = measure(run, iterations)
+            hedged.update(RequestHedging.stats())
+            variants["hedged"] = hedged
+        finally:
+            RequestHedging.disable()
+            AthinaApiBaseUrl.set_url(server.url)
+
+    result = dict(variants["hedged"])
+    result["variants"] = variants
+    return result
+
+
+@benchmark("prompt_run")
+def bench_prompt_run(server: MockAthinaServer, args):
+    def run():
+        Prompt.run("benchmark", {"query": "What is Athina?"})
+
+    return measure(run, args.iterations)
+
+
+@benchmark("slug_list")
+def bench_slug_list(server: MockAthinaServer, args):
+    def run():
+        return len(Slug.list())
+
+    return measure(run, args.iterations)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument(
+        "benchmarks", nargs="*", help=f"Benchmarks to run: {', '.join(BENCHMARKS)}."
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--eval-configs", type=int, default=3)
+    parser.add_argument("--cell-bytes", type=int, default=200)
+    parser.add_argument("--slugs", type=int, default=200)
+    parser.add_argument(
+        "--response-format", choices=["flat", "detailed"], default="flat"
+    )
+    parser.add_argument(
+        "--processes",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[1, 2, 4, 8],
+        help="Comma-separated worker process counts of clean_parallel.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="Number of requests in flight in concurrent_prompt_run.",
+    )
+    parser.add_argument(
+        "--slow-rate",
+        type=float,
+        default=0.02,
+        help="Fraction of slow requests in hedged_get_default.",
+    )
+    parser.add_argument(
+        "--slow-latency",
+        type=float,
+        default=0.2,
+        help="Extra seconds of a slow request in hedged_get_default.",
+    )
+    parser.add_argument(
+        "--latency-per-mb",
+        type=float,
+        default=0.5,
+        help="Extra seconds per MB of request body in upload_adaptive.",
+    )
+    parser.add_argument(
+        "--max-body-bytes",
+        type=int,
+        default=2_000_000,
+        help="Largest request body accepted in upload_adaptive.",
+    )
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = {}
+    with MockAthinaServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        dataset_rows=args.rows,
+        eval_configs=args.eval_configs,
+        cell_bytes=args.cell_bytes,
+        slugs=args.slugs,
+    ) as server:
+        AthinaApiKey.set_key("benchmark")
+        AthinaApiBaseUrl.set_url(server.url)
+        for name in args.benchmarks or sorted(BENCHMARKS):
+            results[name] = BENCHMARKS[name](server, args)
+            _print_result(name, results[name])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "arguments": {
+                        key: value for key, value in vars(args).items() if key != "json"
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+def _print_result(name: str, result: Dict[str, Any]):
+    line = (
+        f"{name:<20} {result['ops_per_second']:>10.1f} ops/s"
+        f"  p50 {result['p50_ms']:>9.2f} ms  p99 {result['p99_ms']:>9.2f} ms"
+    )
+    if "items_per_second" in result:
+        line += f"  {result['items_per_second']:>12,.0f} items/s"
+    if result["errors"]:
+        line += f"  ({result['errors']} errors)"
+    print(line)
+    for label, variant in result.get("variants", {}).items():
+        line = (
+            f"  {label:<18} {variant['ops_per_second']:>10.1f} ops/s"
+            f"  p50 {variant['p50_ms']:>9.2f} ms  p99 {variant['p99_ms']:>9.2f} ms"
+        )
+        if "items_per_second" in variant:
+            line += f"  {variant['items_per_second']:>12,.0f} items/s"
+        if variant["errors"]:
+            line += f"  ({variant['errors']} errors)"
+        if "connections" in variant:
+            line += f"  {variant['connections']} connections"
+        if "batch_bytes" in variant:
+            line += (
+                f"  batch {variant['batch_bytes']:,} B" f" x {variant['concurrency']}"
+            )
+        if "hedges_issued" in variant:
+            line += (
+                f"  {variant['hedges_issued']} hedges" f" ({variant['hedges_won']} won)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
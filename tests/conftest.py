@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+
+import pytest
+
+from athina_client.api_base_url import AthinaApiBaseUrl
+from athina_client.instrumentation import Instrumentation, Profiling, Tracing
+from athina_client.keys import AthinaApiKey
+from athina_client.services import ConditionalCache, RequestHedging
+from athina_client.transport import AthinaTransport
+from benchmarks.mock_server import MockAthinaServer
+
+
+@pytest.fixture(autouse=True)
+def reset_global_state():
+    """
+    Restores the process-wide SDK settings after every test.
+    """
+    yield
+    AthinaApiKey.set_key(None)
+    AthinaApiBaseUrl.set_url(None)
+    AthinaTransport.set_transport(None)
+    ConditionalCache.enable()
+    ConditionalCache.clear()
+    RequestHedging.disable()
+    RequestHedging.reset()
+    Instrumentation.clear()
+    Tracing.set_tracer(None)
+    Profiling.reset()
+
+
+@pytest.fixture
+def mock_server():
+    with MockAthinaServer(dataset_rows=20, slugs=5) as server:
+        yield server
+
+
+@pytest.fixture
+def api(mock_server):
+    """
+    Points the SDK at the mock server and returns the server.
+    """
+    AthinaApiKey.set_key("test-key")
+    AthinaApiBaseUrl.set_url(mock_server.url)
+    return mock_server
+
+
+class RecordingTracer:
+    """
+    Tracer recording the spans it is asked to open.
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def span(self, name, attributes):
+        self.spans.append(("span", name, attributes))
+        yield
+
+    @contextmanager
+    def http_span(self, operation, method, endpoint, headers):
+        self.spans.append(("http", operation, method))
+        headers["traceparent"] = "00-trace-span-01"
+        yield
+
+
+@pytest.fixture
+def tracer():
+    recording = RecordingTracer()
+    Tracing.set_tracer(recording)
+    return recording
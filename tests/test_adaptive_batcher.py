@@ -0,0 +1,76 @@
+import pytest
+
+from athina_client.datasets import AdaptiveBatcher, BatchLedger, Dataset, upload_rows
+from athina_client.errors import PayloadTooLargeException
+
+
+def rows(count, cell_bytes=100):
+    return [{"query": f"{i:04d}" + "x" * cell_bytes} for i in range(count)]
+
+
+def test_batches_are_sized_in_bytes():
+    batcher = AdaptiveBatcher(initial_bytes=1000, min_bytes=100, max_rows=1000)
+
+    batches = list(batcher.batches(rows(50)))
+
+    assert [len(batch) for batch in batches] == [8] * 6 + [2]
+    assert [row for batch in batches for row in batch] == rows(50)
+
+
+def test_batches_are_limited_to_max_rows():
+    batcher = AdaptiveBatcher(max_rows=7)
+
+    assert max(len(batch) for batch in batcher.batches(rows(50, 1))) == 7
+
+
+def test_fast_batches_grow_and_slow_or_failed_ones_shrink():
+    batcher = AdaptiveBatcher(
+        initial_bytes=32_000, min_bytes=16_000, increase_bytes=8_000
+    )
+
+    batcher.send(lambda dataset_id, batch: None, "dataset-1", [{"query": "q"}])
+    assert batcher.batch_bytes == 40_000
+
+    batcher.target_latency = 0
+    batcher.send(lambda dataset_id, batch: None, "dataset-1", [{"query": "q"}])
+    assert batcher.batch_bytes == 20_000
+
+    def fail(dataset_id, batch):
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        batcher.send(fail, "dataset-1", [{"query": "q"}])
+    assert batcher.batch_bytes == 16_000
+    assert batcher.stats()["errors"] == 1
+
+
+def test_batches_rejected_as_too_large_are_split(api, mock_server):
+    mock_server.max_body_bytes = 3000
+    batcher = AdaptiveBatcher(initial_bytes=100_000, min_bytes=1000)
+
+    upload_rows(rows(100), dataset_id="dataset-1", batcher=batcher)
+
+    assert mock_server.received_rows == 100
+    stats = batcher.stats()
+    assert stats["splits"] > 0
+    assert stats["rows"] == 100
+    assert batcher.max_bytes < 100_000
+
+
+def test_a_single_row_too_large_is_raised(api, mock_server):
+    mock_server.max_body_bytes = 100
+    batcher = AdaptiveBatcher()
+
+    with pytest.raises(PayloadTooLargeException):
+        Dataset.add_rows("dataset-1", rows(1), batcher=batcher)
+
+
+def test_batcher_and_ledger_cannot_be_combined(api, tmp_path):
+    ledger = BatchLedger(str(tmp_path / "upload.ledger"))
+
+    with pytest.raises(ValueError):
+        upload_rows(
+            rows(1), dataset_id="dataset-1", ledger=ledger, batcher=AdaptiveBatcher()
+        )
+    with pytest.raises(ValueError):
+        Dataset.add_rows("dataset-1", rows(1), ledger=ledger, batcher=AdaptiveBatcher())
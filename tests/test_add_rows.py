@@ -0,0 +1,106 @@
+import pytest
+
+from athina_client.datasets import BatchLedger, Dataset, upload_rows
+from athina_client.errors import CustomException
+from athina_client.services import AthinaApiService
+from athina_client.transport import AthinaTransport, Transport, TransportResponse
+
+
+class ConflictTransport(Transport):
+    """
+    Transport answering every request with a `409 Conflict`.
+    """
+
+    def __init__(self, error):
+        self.error = error
+        self.requests = 0
+
+    def request(self, method, url, headers, params=None, body=None):
+        self.requests += 1
+        return TransportResponse(
+            409, {"Content-Type": "application/json"}, b'{"error": "%s"}' % self.error
+        )
+
+
+def test_identical_rows_are_all_added(api, mock_server):
+    rows = [{"query": "same"}] * 250
+
+    Dataset.add_rows("dataset-1", rows)
+
+    assert mock_server.received_rows == 250
+    assert mock_server.duplicate_batches == 0
+
+
+def test_identical_appends_are_both_added(api, mock_server):
+    Dataset.add_rows("dataset-1", [{"query": "same"}])
+    Dataset.add_rows("dataset-1", [{"query": "same"}])
+
+    assert mock_server.received_rows == 2
+
+
+def test_identical_batches_of_an_upload_are_all_added(api, mock_server):
+    upload_rows([{"query": "same"}] * 250, dataset_id="dataset-1", batch_size=50)
+
+    assert mock_server.received_rows == 250
+
+
+def test_retry_after_a_lost_response_is_not_added_twice(api, mock_server):
+    mock_server.lost_response_rate = 1.0
+
+    AthinaApiService.add_dataset_rows("dataset-1", [{"query": "q"}])
+
+    assert mock_server.received_rows == 1
+    assert mock_server.duplicate_batches == 1
+
+
+def test_ledger_keys_depend_on_the_offset():
+    rows = [{"query": "same"}]
+
+    assert BatchLedger.key("dataset-1", rows, 0) == BatchLedger.key(
+        "dataset-1", rows, 0
+    )
+    assert BatchLedger.key("dataset-1", rows, 0) != BatchLedger.key(
+        "dataset-1", rows, 1
+    )
+
+
+def test_ledger_adds_identical_batches(api, mock_server, tmp_path):
+    ledger = BatchLedger(str(tmp_path / "upload.ledger"))
+
+    Dataset.add_rows("dataset-1", [{"query": "same"}] * 250, ledger=ledger)
+
+    assert mock_server.received_rows == 250
+    assert len(ledger) == 3
+
+
+def test_ledger_resume_skips_acknowledged_batches(api, mock_server, tmp_path):
+    path = str(tmp_path / "upload.ledger")
+    rows = [{"query": f"q{i % 7}"} for i in range(250)]
+    upload_rows(
+        rows[:100], dataset_id="dataset-1", batch_size=50, ledger=BatchLedger(path)
+    )
+
+    upload_rows(rows, dataset_id="dataset-1", batch_size=50, ledger=BatchLedger(path))
+
+    assert mock_server.received_rows == 250
+    assert len(BatchLedger(path)) == 5
+
+
+def test_duplicate_key_conflicts_are_success(api):
+    AthinaTransport.set_transport(ConflictTransport(b"Duplicate idempotency key"))
+
+    result = AthinaApiService.add_dataset_rows("dataset-1", [{"query": "q"}])
+
+    assert result == {"message": "Rows already added"}
+
+
+def test_other_conflicts_are_not_recorded_in_the_ledger(api, tmp_path):
+    transport = ConflictTransport(b"Dataset is being modified")
+    AthinaTransport.set_transport(transport)
+    ledger = BatchLedger(str(tmp_path / "upload.ledger"))
+
+    with pytest.raises(CustomException, match="Dataset is being modified"):
+        Dataset.add_rows("dataset-1", [{"query": "q"}], ledger=ledger)
+
+    assert transport.requests == 2
+    assert len(ledger) == 0
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+import requests
+
+from benchmarks import run
+from benchmarks.mock_server import MockAthinaServer
+
+
+def test_measure_counts_items_and_errors():
+    calls = []
+
+    def func():
+        calls.append(None)
+        if len(calls) == 3:
+            raise RuntimeError("injected")
+        return 10
+
+    result = run.measure(func, iterations=4, warmup=1)
+
+    assert len(calls) == 5
+    assert result["iterations"] == 4
+    assert result["errors"] == 1
+    assert result["items_per_second"] > 0
+    assert result["p50_ms"] <= result["p99_ms"]
+
+
+def test_mock_server_requires_an_api_key(mock_server):
+    response = requests.get(f"{mock_server.url}/api/v1/dataset_v2/all")
+
+    assert response.status_code == 401
+
+
+def test_mock_server_injects_errors():
+    with MockAthinaServer(error_rate=1.0) as server:
+        response = requests.get(
+            f"{server.url}/api/v1/dataset_v2/all",
+            headers={"athina-api-key": "test-key"},
+        )
+
+    assert response.status_code == 500
+
+
+@pytest.mark.parametrize(
+    "name", ["add_rows", "conditional_slug_list", "get_dataset_by_id", "slug_list"]
+)
+def test_benchmark_runs(name, tmp_path, capsys):
+    output = tmp_path / "results.json"
+
+    code = run.main([name, "--iterations", "2", "--rows", "50", "--json", str(output)])
+
+    assert code == 0
+    assert name in capsys.readouterr().out
+    results = json.loads(output.read_text())["results"]
+    assert results[name]["iterations"] == 2
+    assert results[name]["errors"] == 0
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from athina_client.client import AthinaClient
+from athina_client.datasets import Dataset, upload_rows
+from athina_client.errors import NoAthinaApiKeyException
+from athina_client.services.client_scope import active_client
+from benchmarks.mock_server import MockAthinaServer
+
+
+def test_client_requires_an_api_key():
+    with pytest.raises(NoAthinaApiKeyException):
+        AthinaClient(api_key="")
+
+
+def test_client_does_not_need_global_configuration(mock_server):
+    with AthinaClient(api_key="client-key", base_url=mock_server.url) as client:
+        datasets = client.datasets.list_datasets()
+
+    assert len(datasets) == 10
+    assert mock_server.requests == 1
+    assert active_client() is None
+
+
+def test_clients_are_isolated_across_threads():
+    with MockAthinaServer() as first, MockAthinaServer() as second:
+        clients = [
+            AthinaClient(api_key="first", base_url=first.url),
+            AthinaClient(api_key="second", base_url=second.url),
+        ]
+        errors = []
+
+        def work(client):
+            try:
+                for _ in range(10):
+                    client.datasets.get_dataset_by_id("dataset-1", limit=1)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(c,)) for c in clients * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for client in clients:
+            client.close()
+
+    assert errors == []
+    assert first.requests == second.requests == 20
+
+
+def test_scope_applies_to_helpers_and_their_worker_threads(mock_server):
+    client = AthinaClient(api_key="client-key", base_url=mock_server.url)
+
+    with client.scope():
+        upload_rows(
+            [{"query": f"q{i}"} for i in range(30)],
+            dataset_id="dataset-1",
+            batch_size=5,
+            max_workers=3,
+        )
+
+    assert mock_server.received_rows == 30
+
+
+def test_unscoped_calls_use_the_global_configuration(mock_server):
+    AthinaClient(api_key="client-key", base_url=mock_server.url)
+
+    with pytest.raises(NoAthinaApiKeyException):
+        Dataset.list_datasets()
+
+
+def test_namespace_exposes_public_methods_only(mock_server):
+    client = AthinaClient(api_key="client-key", base_url=mock_server.url)
+
+    assert "get_dataset_by_id" in dir(client.datasets)
+    assert not any(name.startswith("_") for name in dir(client.prompts))
@@ -0,0 +1,88 @@
+from athina_client.datasets import Dataset
+from athina_client.keys import AthinaApiKey
+from athina_client.prompt import Prompt, Slug
+from athina_client.services import ConditionalCache
+from athina_client.transport import AthinaTransport, CassetteTransport
+
+
+def test_unchanged_responses_are_served_from_the_cache(api):
+    first = Prompt.get_default("slug-1")
+    second = Prompt.get_default("slug-1")
+
+    assert second.prompt == first.prompt
+    assert api.not_modified == 1
+    assert ConditionalCache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_cached_objects_are_not_shared_between_callers(api):
+    first = Prompt.get_default("slug-1")
+    first.prompt.append({"role": "user", "content": "mutated"})
+    first.prompt[0]["content"] = "mutated"
+
+    second = Prompt.get_default("slug-1")
+    second.prompt[0]["role"] = "system"
+    third = Prompt.get_default("slug-1")
+
+    assert api.not_modified == 2
+    assert third.prompt == [{"role": "user", "content": "Answer {{query}}"}]
+
+
+def test_disabled_cache_sends_unconditional_requests(api):
+    ConditionalCache.disable()
+
+    Dataset.list_datasets()
+    Dataset.list_datasets()
+
+    assert api.not_modified == 0
+    assert ConditionalCache.stats()["entries"] == 0
+
+
+def test_entries_are_per_api_key(api):
+    Slug.list()
+    AthinaApiKey.set_key("other-key")
+    Slug.list()
+
+    assert api.not_modified == 0
+    assert ConditionalCache.stats()["entries"] == 2
+
+
+def test_cassette_with_conditional_requests_replays_in_a_fresh_process(api, tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    AthinaTransport.set_transport(CassetteTransport(path, mode="record"))
+    recorded_prompt = Prompt.get_default("slug-1")
+    Prompt.get_default("slug-1")
+    recorded_slugs = Slug.list()
+    Slug.list()
+    assert api.not_modified == 2
+
+    # A new process starts with an empty cache, so its first requests are unconditional.
+    ConditionalCache.clear()
+    AthinaTransport.set_transport(CassetteTransport(path, mode="replay"))
+    api.stop()
+
+    for _ in range(2):
+        assert Prompt.get_default("slug-1").prompt == recorded_prompt.prompt
+        assert [slug.id for slug in Slug.list()] == [slug.id for slug in recorded_slugs]
+    assert ConditionalCache.stats()["hits"] == 2
+
+
+def test_cassette_answers_unrecorded_conditional_requests(api, tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    AthinaTransport.set_transport(CassetteTransport(path, mode="record"))
+    Slug.list()
+    api.stop()
+
+    AthinaTransport.set_transport(CassetteTransport(path, mode="replay"))
+
+    assert len(Slug.list()) == 5
+
+
+def test_entries_keep_the_raw_body(api):
+    slugs = Slug.list()
+    key = ConditionalCache.key("test-key", f"{api.url}/api/v1/prompt/slug/all")
+
+    entry = ConditionalCache.get(key)
+
+    assert isinstance(entry.content, bytes)
+    assert [slug.id for slug in Slug.list()] == [slug.id for slug in slugs]
+    assert api.not_modified == 1
@@ -0,0 +1,80 @@
+import os
+import threading
+
+from athina_client.datasets import Dataset
+from athina_client.datasets.cache import DatasetCache
+
+
+def test_cached_page_is_served_from_disk(api, tmp_path):
+    cache = DatasetCache(directory=str(tmp_path))
+    first = Dataset.get_dataset_by_id("dataset-1", cache=cache)
+    requests = api.requests
+
+    second = Dataset.get_dataset_by_id("dataset-1", cache=cache)
+
+    assert second == first
+    # Only the freshness check went to the API.
+    assert api.requests == requests + 1
+
+
+def test_max_age_skips_the_freshness_check(api, tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), max_age=60)
+    Dataset.get_dataset_by_id("dataset-1", cache=cache)
+    requests = api.requests
+
+    Dataset.get_dataset_by_id("dataset-1", cache=cache)
+
+    assert api.requests == requests
+
+
+def test_invalidate_drops_the_dataset(api, tmp_path):
+    cache = DatasetCache(directory=str(tmp_path))
+    Dataset.get_dataset_by_id("dataset-1", cache=cache)
+
+    cache.invalidate("dataset-1")
+
+    assert not os.path.exists(cache._dataset_dir("dataset-1"))
+
+
+def test_datasets_without_updated_at_are_not_cached(api, tmp_path, monkeypatch):
+    dataset = api.dataset
+    monkeypatch.setattr(
+        api, "dataset", lambda *args: {**dataset(*args), "updated_at": None}
+    )
+    cache = DatasetCache(directory=str(tmp_path))
+    first = Dataset.get_dataset_by_id("dataset-1", cache=cache)
+    requests = api.requests
+
+    second = Dataset.get_dataset_by_id("dataset-1", cache=cache)
+
+    assert second == first
+    # The freshness check and the page itself.
+    assert api.requests == requests + 2
+
+
+def test_concurrent_loaders_keep_each_others_pages(api, tmp_path):
+    cache = DatasetCache(directory=str(tmp_path))
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def load(offset):
+        try:
+            barrier.wait()
+            DatasetCache(directory=str(tmp_path)).get_dataset_by_id(
+                "dataset-1", limit=2, offset=offset
+            )
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=load, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache._read_manifest("dataset-1")["pages"]) == 8
+    requests = api.requests
+    for offset in range(8):
+        cache.get_dataset_by_id("dataset-1", limit=2, offset=offset)
+    assert api.requests == requests + 8
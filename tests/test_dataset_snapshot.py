@@ -0,0 +1,124 @@
+import os
+import pickle
+import threading
+
+import pytest
+
+from athina_client.datasets import Dataset, DatasetSnapshot
+
+DATASET = {
+    "dataset": {"id": "dataset-1", "name": "snapshot"},
+    "development_eval_configs": [],
+    "dataset_rows": [
+        {"row_no": 1, "query": "q1", "context": ["c1"], "score": 0.5},
+        {"row_no": 2, "query": "q2", "response": None},
+        {"row_no": 5, "query": "q5", "context": ["c5", "c6"]},
+    ],
+}
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = str(tmp_path / "dataset.snap")
+    DatasetSnapshot.write(path, DATASET)
+    with DatasetSnapshot.open(path) as snapshot:
+        yield snapshot
+
+
+def test_rows_round_trip(snapshot):
+    assert len(snapshot) == 3
+    assert list(snapshot) == DATASET["dataset_rows"]
+    assert snapshot[-1] == DATASET["dataset_rows"][2]
+    assert snapshot.dataset == DATASET["dataset"]
+    assert snapshot.extra == {"development_eval_configs": []}
+
+
+def test_missing_cells_are_not_confused_with_null(snapshot):
+    assert "response" not in snapshot[0]
+    assert snapshot[1]["response"] is None
+
+
+def test_get_row_by_row_no(snapshot):
+    assert snapshot.get_row(5)["query"] == "q5"
+    with pytest.raises(KeyError):
+        snapshot.get_row(3)
+
+
+def test_column_decodes_a_single_column(snapshot):
+    assert list(snapshot.column("query")) == ["q1", "q2", "q5"]
+    assert list(snapshot.column("score")) == [0.5, None, None]
+
+
+def test_snapshot_pickles_by_path(snapshot):
+    clone = pickle.loads(pickle.dumps(snapshot))
+    try:
+        assert clone[0] == snapshot[0]
+    finally:
+        clone.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        DatasetSnapshot.open(str(path))
+
+
+def test_export_matches_get_dataset_by_id(api, tmp_path):
+    with DatasetSnapshot.export("dataset-1", str(tmp_path / "d.snap")) as snapshot:
+        assert list(snapshot) == Dataset.get_dataset_by_id("dataset-1")["dataset_rows"]
+
+
+def test_failed_write_keeps_the_previous_snapshot(snapshot, tmp_path):
+    path = snapshot.path
+    broken = {**DATASET, "dataset_rows": [{"query": object()}]}
+
+    with pytest.raises(TypeError):
+        DatasetSnapshot.write(path, broken)
+
+    with DatasetSnapshot.open(path) as reopened:
+        assert len(reopened) == 3
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_concurrent_writes_of_one_path(tmp_path):
+    path = str(tmp_path / "dataset.snap")
+    errors = []
+
+    def write():
+        try:
+            for _ in range(10):
+                DatasetSnapshot.write(path, DATASET)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with DatasetSnapshot.open(path) as snapshot:
+        assert snapshot.get_row(5)["context"] == ["c5", "c6"]
+    assert os.listdir(tmp_path) == ["dataset.snap"]
+
+
+def test_corrupt_footer_unmaps_the_file(tmp_path, monkeypatch):
+    path = tmp_path / "dataset.snap"
+    DatasetSnapshot.write(str(path), DATASET)
+    data = bytearray(path.read_bytes())
+    footer_end = len(data) - 16
+    data[footer_end - 1 : footer_end] = b"!"
+    path.write_bytes(bytes(data))
+    closed = []
+    close = DatasetSnapshot.close
+    monkeypatch.setattr(
+        DatasetSnapshot, "close", lambda self: closed.append(self) or close(self)
+    )
+
+    with pytest.raises(ValueError, match="corrupt"):
+        DatasetSnapshot.open(str(path))
+
+    assert len(closed) == 1
+    assert closed[0]._mmap.closed
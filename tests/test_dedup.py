@@ -0,0 +1,93 @@
+import pytest
+
+from athina_client.datasets import Dataset, RowDeduplicator, upload_rows
+
+
+def test_filter_drops_rows_seen_before_and_repeats():
+    dedup = RowDeduplicator()
+    dedup.commit([{"query": "a"}])
+
+    rows = list(dedup.filter([{"query": "a"}, {"query": "b"}, {"query": "b"}]))
+
+    assert rows == [{"query": "b"}]
+    assert dedup.dropped == 2
+
+
+def test_filtered_rows_are_only_indexed_when_committed():
+    dedup = RowDeduplicator()
+
+    rows = list(dedup.filter([{"query": "a"}]))
+
+    assert {"query": "a"} not in dedup
+    assert list(dedup.filter(rows)) == rows
+    dedup.commit(rows)
+    assert {"query": "a"} in dedup
+
+
+def test_fields_restrict_the_row_identity():
+    dedup = RowDeduplicator(fields=["query"])
+    dedup.commit([{"query": "a", "response": "x"}])
+
+    assert {"query": "a", "response": "y"} in dedup
+
+
+def test_keys_added_by_the_api_are_ignored():
+    dedup = RowDeduplicator()
+    dedup.commit([{"query": "a"}])
+
+    assert {"query": "a", "__id": "1", "row_no": 3} in dedup
+
+
+def test_bloom_index_survives_reopening(tmp_path):
+    path = str(tmp_path / "rows.bloom")
+    with RowDeduplicator(path=path, capacity=1000) as dedup:
+        dedup.commit([{"query": "a"}])
+
+    with RowDeduplicator(path=path) as dedup:
+        assert {"query": "a"} in dedup
+        assert {"query": "b"} not in dedup
+
+
+def test_bloom_index_is_created_without_leaving_temporary_files(tmp_path):
+    path = tmp_path / "index" / "rows.bloom"
+
+    with RowDeduplicator(path=str(path), capacity=1000) as dedup:
+        dedup.commit([{"query": "a"}])
+
+    assert [p.name for p in path.parent.iterdir()] == ["rows.bloom"]
+
+
+def test_failed_upload_can_be_repeated_without_losing_rows(api, mock_server, tmp_path):
+    path = str(tmp_path / "rows.bloom")
+    rows = [{"query": f"q{i}"} for i in range(20)]
+    mock_server.error_rate = 1.0
+    with RowDeduplicator(path=path, capacity=1000) as dedup:
+        with pytest.raises(Exception):
+            upload_rows(rows, dataset_id="dataset-1", dedup=dedup, max_workers=1)
+
+    mock_server.error_rate = 0.0
+    with RowDeduplicator(path=path) as dedup:
+        upload_rows(rows, dataset_id="dataset-1", dedup=dedup)
+        upload_rows(rows, dataset_id="dataset-1", dedup=dedup)
+
+    assert mock_server.received_rows == 20
+    assert dedup.dropped == 20
+
+
+def test_failed_add_rows_can_be_repeated_without_losing_rows(api, mock_server):
+    dedup = RowDeduplicator()
+    rows = [{"query": f"q{i}"} for i in range(5)]
+    mock_server.error_rate = 1.0
+    with pytest.raises(Exception):
+        Dataset.add_rows("dataset-1", rows, dedup=dedup)
+
+    mock_server.error_rate = 0.0
+    Dataset.add_rows("dataset-1", rows, dedup=dedup)
+
+    assert mock_server.received_rows == 5
+
+
+def test_seed_indexes_the_stored_rows(api, mock_server):
+    dedup = RowDeduplicator()
+
+    assert dedup.seed("dataset-1", page_size=8) == 20
@@ -0,0 +1,207 @@
+import json
+
+import pytest
+
+from athina_client.datasets import Dataset, export_rows, iter_pages
+from athina_client.datasets.export import _export_parquet
+
+
+def pages_of(*pages):
+    return iter((offset, {"dataset_rows": rows}) for offset, rows in enumerate(pages))
+
+
+def test_iter_pages_stops_at_the_last_page(api):
+    pages = list(iter_pages("dataset-1", page_size=8))
+
+    assert [offset for offset, _ in pages] == [0, 1, 2]
+    assert sum(len(page["dataset_rows"]) for _, page in pages) == 20
+
+
+def test_export_jsonl(api, tmp_path):
+    path = str(tmp_path / "rows.jsonl")
+    progress = []
+
+    written = export_rows("dataset-1", path, page_size=8, on_progress=progress.append)
+
+    with open(path) as f:
+        rows = [json.loads(line) for line in f]
+    assert written == 20
+    assert progress == [8, 16, 20]
+    assert rows == Dataset.get_dataset_by_id("dataset-1")["dataset_rows"]
+    assert not (tmp_path / "rows.jsonl.progress").exists()
+
+
+def test_export_jsonl_resumes_after_the_last_complete_page(api, tmp_path):
+    path = tmp_path / "rows.jsonl"
+    full = tmp_path / "full.jsonl"
+    export_rows("dataset-1", str(full), page_size=8)
+    # An export interrupted after the first page, in the middle of the second one.
+    first_page = b"".join(full.read_bytes().splitlines(keepends=True)[:8])
+    path.write_bytes(first_page + b'{"partial": ')
+    (tmp_path / "rows.jsonl.progress").write_text(
+        json.dumps(
+            {
+                "dataset_id": "dataset-1",
+                "response_format": "flat",
+                "page_size": 8,
+                "next_offset": 1,
+                "rows": 8,
+                "bytes": len(first_page),
+            }
+        )
+    )
+
+    written = export_rows("dataset-1", str(path), page_size=8, resume=True)
+
+    assert written == 12
+    assert path.read_bytes() == full.read_bytes()
+
+
+def test_resume_rejects_a_different_page_size(api, tmp_path):
+    path = tmp_path / "rows.jsonl"
+    path.write_bytes(b"")
+    (tmp_path / "rows.jsonl.progress").write_text(
+        json.dumps(
+            {
+                "dataset_id": "dataset-1",
+                "response_format": "flat",
+                "page_size": 8,
+                "next_offset": 1,
+                "rows": 8,
+                "bytes": 0,
+            }
+        )
+    )
+    with pytest.raises(ValueError, match="page_size"):
+        export_rows("dataset-1", str(path), page_size=10, resume=True)
+
+
+def test_export_parquet(api, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+
+    written = export_rows("dataset-1", path, page_size=8)
+
+    assert written == 20
+    assert (
+        pq.read_table(path).to_pylist()
+        == Dataset.get_dataset_by_id("dataset-1")["dataset_rows"]
+    )
+
+
+def test_parquet_column_empty_on_the_first_page(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+    progress = []
+
+    written = _export_parquet(
+        path,
+        pages_of(
+            [{"query": "a", "score": None}, {"query": "b", "score": None}],
+            [{"query": "c", "score": 0.5}],
+        ),
+        progress.append,
+    )
+
+    table = pq.read_table(path)
+    assert written == 3
+    assert progress == [2, 3]
+    assert str(table.schema.field("score").type) == "double"
+    assert table.column("score").to_pylist() == [None, None, 0.5]
+
+
+def test_parquet_column_empty_on_every_page(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+
+    written = _export_parquet(
+        path, pages_of([{"query": "a", "score": None}], [{"query": "b"}]), None
+    )
+
+    assert written == 2
+    assert pq.read_table(path).column("score").to_pylist() == [None, None]
+
+
+def test_parquet_explicit_schema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+    schema = pa.schema([("query", pa.string()), ("score", pa.float64())])
+
+    _export_parquet(
+        path,
+        pages_of([{"query": "a", "score": None}], [{"query": "b", "score": 1}]),
+        None,
+        schema,
+    )
+
+    assert pq.read_table(path).schema == schema
+
+
+def test_parquet_type_conflict_is_reported(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    with pytest.raises(ValueError, match="pass a schema"):
+        _export_parquet(
+            str(tmp_path / "rows.parquet"),
+            pages_of([{"score": 1}], [{"score": "high"}]),
+            None,
+        )
+
+
+def test_parquet_float_after_int_page_is_not_truncated(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    with pytest.raises(ValueError, match="pass a schema"):
+        _export_parquet(
+            str(tmp_path / "rows.parquet"),
+            pages_of([{"score": 1}], [{"score": 0.5}]),
+            None,
+        )
+
+
+def test_parquet_buffered_pages_widen_int_to_float(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+
+    _export_parquet(
+        path,
+        pages_of(
+            [{"score": 1, "label": None}],
+            [{"score": 0.5, "label": "good"}],
+        ),
+        None,
+    )
+
+    table = pq.read_table(path)
+    assert str(table.schema.field("score").type) == "double"
+    assert table.column("score").to_pylist() == [1.0, 0.5]
+
+
+def test_parquet_incompatible_buffered_pages_raise_value_error(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    with pytest.raises(ValueError, match="pass a schema"):
+        _export_parquet(
+            str(tmp_path / "rows.parquet"),
+            pages_of(
+                [{"score": 1, "label": None}],
+                [{"score": "high", "label": None}],
+            ),
+            None,
+        )
+
+
+def test_parquet_empty_dataset_writes_an_empty_file(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+
+    written = _export_parquet(path, pages_of([]), None)
+
+    assert written == 0
+    assert pq.read_table(path).num_rows == 0
+
+
+def test_parquet_cannot_be_resumed(tmp_path):
+    with pytest.raises(ValueError):
+        export_rows("dataset-1", str(tmp_path / "rows.parquet"), resume=True)
@@ -0,0 +1,134 @@
+import contextvars
+import threading
+import time
+
+import pytest
+
+from athina_client.prompt import Prompt
+from athina_client.services import RequestHedging
+
+
+def warm_up(key, latency=0.001, samples=5):
+    for _ in range(samples):
+        RequestHedging._record(key, latency)
+
+
+def test_reads_are_not_hedged_before_enough_samples():
+    RequestHedging.enable(min_samples=5)
+    warm_up("op", samples=4)
+
+    assert RequestHedging.delay("op") is None
+    assert RequestHedging.run("op", lambda: "value") == "value"
+    assert RequestHedging.delay("op") is not None
+
+
+def test_delay_is_the_percentile_with_a_floor():
+    RequestHedging.enable(percentile=50, min_delay=0.01, min_samples=4)
+    for latency in (0.02, 0.04, 0.06, 0.08):
+        RequestHedging._record("slow", latency)
+    warm_up("fast", latency=0.001, samples=4)
+
+    assert RequestHedging.delay("slow") == 0.06
+    assert RequestHedging.delay("fast") == 0.01
+
+
+def test_enable_rejects_invalid_percentiles():
+    with pytest.raises(ValueError):
+        RequestHedging.enable(percentile=100)
+
+
+def test_slow_read_is_hedged_and_the_hedge_wins():
+    RequestHedging.enable(min_samples=5, max_extra_load=1.0)
+    warm_up("op")
+    calls = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        time.sleep(0.5 if first else 0)
+        return "slow" if first else "fast"
+
+    start = time.perf_counter()
+    assert RequestHedging.run("op", send) == "fast"
+
+    assert time.perf_counter() - start < 0.4
+    assert RequestHedging.stats()["hedges_issued"] == 1
+    assert RequestHedging.stats()["hedges_won"] == 1
+
+
+def test_hedges_are_limited_by_the_budget():
+    RequestHedging.enable(min_samples=5, max_extra_load=0.1)
+    warm_up("op", samples=200)
+
+    def send():
+        time.sleep(0.02)
+        return "value"
+
+    for _ in range(5):
+        assert RequestHedging.run("op", send) == "value"
+
+    stats = RequestHedging.stats()
+    assert stats["hedges_issued"] == 0
+    assert stats["hedges_skipped"] == 5
+
+
+def test_a_failed_hedge_does_not_win():
+    RequestHedging.enable(min_samples=5, max_extra_load=1.0)
+    warm_up("op")
+    calls = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.1)
+            return "primary"
+        raise RuntimeError("hedge failed")
+
+    assert RequestHedging.run("op", send) == "primary"
+    assert RequestHedging.stats()["hedges_won"] == 0
+
+
+def test_the_primary_error_is_raised_when_both_fail():
+    RequestHedging.enable(min_samples=5, max_extra_load=1.0)
+    warm_up("op")
+    calls = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.05)
+            raise RuntimeError("primary failed")
+        raise KeyError("hedge failed")
+
+    with pytest.raises(RuntimeError, match="primary failed"):
+        RequestHedging.run("op", send)
+
+
+def test_hedged_reads_run_in_the_caller_context():
+    variable = contextvars.ContextVar("variable", default=None)
+    RequestHedging.enable(min_samples=5)
+    warm_up("op")
+    variable.set("caller")
+
+    assert RequestHedging.run("op", variable.get) == "caller"
+
+
+def test_hedged_prompt_reads_against_a_slow_tail(api, mock_server):
+    mock_server.slow_rate = 0.3
+    mock_server.slow_latency = 0.3
+    RequestHedging.enable(percentile=50, min_samples=5, max_extra_load=1.0)
+
+    prompts = [Prompt.get_default("slug-1") for _ in range(30)]
+
+    assert all(prompt.prompt == prompts[0].prompt for prompt in prompts)
+    stats = RequestHedging.stats()
+    assert stats["requests"] == 30
+    assert stats["hedges_issued"] >= 1
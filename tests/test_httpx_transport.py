@@ -0,0 +1,72 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from athina_client.prompt import Prompt
+from athina_client.transport import AthinaTransport
+from benchmarks.mock_server import MockAthinaServer
+
+
+def test_request_over_http1(mock_server):
+    from athina_client.transport.httpx_transport import HttpxTransport
+
+    transport = HttpxTransport(http2=False)
+    try:
+        response = transport.request(
+            "GET",
+            f"{mock_server.url}/api/v1/dataset_v2/all",
+            {"athina-api-key": "test-key"},
+            params={"unused": "1"},
+        )
+    finally:
+        transport.close()
+
+    assert response.status_code == 200
+    assert len(response.json()["datasets"]) == 10
+    assert response.elapsed is not None
+
+
+def test_sdk_calls_through_the_httpx_backend(api):
+    AthinaTransport.set_transport(AthinaTransport.create("httpx"))
+
+    stream = Prompt.stream("slug-1", {"query": "q"})
+    text = "".join(stream)
+
+    assert Prompt.run("slug-1", {"query": "q"}).prompt_response == text
+
+
+def test_http2_multiplexes_concurrent_requests():
+    pytest.importorskip("h2")
+    from athina_client.transport.httpx_transport import HttpxTransport
+
+    with MockAthinaServer(http2=True, latency=0.05, slugs=5) as server:
+        transport = HttpxTransport(http1=False, max_connections=1)
+        url = f"{server.url}/api/v1/prompt/slug/all"
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(
+                    executor.map(
+                        lambda _: transport.request(
+                            "GET", url, {"athina-api-key": "test-key"}
+                        ),
+                        range(8),
+                    )
+                )
+        finally:
+            transport.close()
+
+    assert [response.status_code for response in responses] == [200] * 8
+    assert server.connections == 1
+
+
+def test_missing_httpx_raises_an_install_hint(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    monkeypatch.delitem(
+        sys.modules, "athina_client.transport.httpx_transport", raising=False
+    )
+
+    with pytest.raises(ImportError, match="pip install"):
+        AthinaTransport.create("httpx")
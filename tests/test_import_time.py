@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.import_time import import_times
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code, **env):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env={**os.environ, **env},
+    ).stdout.strip()
+
+
+def test_importing_the_sdk_does_not_load_heavy_dependencies():
+    loaded = run_python(
+        "import sys, athina_client.datasets, athina_client.prompt\n"
+        "heavy = ['requests', 'retrying', 'dotenv', 'pyarrow', 'opentelemetry', 'httpx']\n"
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+
+    assert loaded == ""
+
+
+def test_prompt_helpers_are_imported_on_first_use():
+    loaded = run_python(
+        "import sys, athina_client.prompt\n"
+        "helpers = ['catalog', 'result_cache', 'versions']\n"
+        "print(','.join(m for m in helpers if 'athina_client.prompt.' + m in sys.modules))"
+    )
+
+    assert loaded == ""
+
+
+def test_lazy_prompt_attributes_resolve():
+    import athina_client.prompt as prompt
+    from athina_client.prompt.catalog import SlugCatalog
+
+    assert prompt.SlugCatalog is SlugCatalog
+    assert all(hasattr(prompt, name) for name in prompt.__all__)
+    with pytest.raises(AttributeError):
+        prompt.NotAHelper
+
+
+def test_settings_are_read_from_the_environment_on_first_access():
+    value = run_python(
+        "from athina_client import constants\n"
+        "import sys\n"
+        "assert 'dotenv' not in sys.modules\n"
+        "print(constants.ATHINA_TRANSPORT)",
+        ATHINA_TRANSPORT="httpx",
+    )
+
+    assert value == "httpx"
+
+
+def test_unknown_settings_raise_attribute_error():
+    from athina_client import constants
+
+    with pytest.raises(AttributeError):
+        constants.ATHINA_NOT_A_SETTING
+
+
+def test_import_times_reports_the_module_and_its_imports():
+    total, children = import_times("athina_client.datasets")
+
+    assert total > 0
+    assert "athina_client.datasets.dataset" in children
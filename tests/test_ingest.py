@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from athina_client.cli.main import main
+from athina_client.datasets import read_rows, upload_rows
+
+
+def write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return str(path)
+
+
+def test_read_rows_jsonl_and_csv(tmp_path):
+    jsonl = write_jsonl(tmp_path / "rows.jsonl", [{"query": "a"}, {"query": "b"}])
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("query,response\na,x\nb,y\n")
+
+    assert list(read_rows(jsonl)) == [{"query": "a"}, {"query": "b"}]
+    assert list(read_rows(str(csv_path))) == [
+        {"query": "a", "response": "x"},
+        {"query": "b", "response": "y"},
+    ]
+
+
+def test_read_rows_rejects_non_objects(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"query": "a"}\n[1, 2]\n')
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_rows(str(path)))
+
+
+def test_read_rows_requires_a_known_format(tmp_path):
+    with pytest.raises(ValueError):
+        list(read_rows(str(tmp_path / "rows.txt")))
+
+
+def test_upload_rows_creates_and_appends(api):
+    rows = [{"query": f"q{i}"} for i in range(250)]
+    progress = []
+
+    dataset_id = upload_rows(
+        rows, name="upload", batch_size=100, on_progress=progress.append
+    )
+
+    assert dataset_id
+    assert api.received_rows == 250
+    assert progress[-1] == 250
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_upload_rows_rejects_empty_batches(api, batch_size):
+    with pytest.raises(ValueError, match="batch_size"):
+        upload_rows([{"query": "q"}], dataset_id="dataset-1", batch_size=batch_size)
+    assert api.requests == 0
+
+
+def test_upload_rows_rejects_forbidden_keys(api):
+    with pytest.raises(ValueError):
+        upload_rows([{"__id": 1}], dataset_id="dataset-1")
+
+
+def test_cli_upload(api, tmp_path, capsys):
+    path = write_jsonl(tmp_path / "rows.jsonl", [{"query": "a"}, {"query": "b"}])
+
+    code = main(
+        ["--api-key", "test-key", "--base-url", api.url]
+        + ["datasets", "upload", path, "--name", "cli", "--batch-size", "1"]
+    )
+
+    assert code == 0
+    assert capsys.readouterr().out.strip()
+    assert api.received_rows == 2
+
+
+@pytest.mark.parametrize("batch_size", ["0", "-5"])
+def test_cli_rejects_invalid_batch_size(api, tmp_path, capsys, batch_size):
+    path = write_jsonl(tmp_path / "rows.jsonl", [{"query": "a"}])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(
+            ["--api-key", "test-key", "--base-url", api.url]
+            + ["datasets", "upload", path, "--dataset-id", "dataset-1"]
+            + ["--batch-size", batch_size]
+        )
+
+    assert exit_info.value.code == 2
+    assert "--batch-size" in capsys.readouterr().err
+    assert api.requests == 0
@@ -0,0 +1,80 @@
+import logging
+
+from athina_client.datasets import Dataset
+from athina_client.instrumentation import (
+    ApiCallEvent,
+    HistogramCollector,
+    Instrumentation,
+    LoggingCollector,
+)
+
+
+def event(operation="op", total_time=0.02, **fields):
+    return ApiCallEvent(
+        operation=operation,
+        method="GET",
+        endpoint="/api/v1/dataset_v2/all",
+        status_code=fields.pop("status_code", 200),
+        total_time=total_time,
+        **fields,
+    )
+
+
+def test_collectors_receive_one_event_per_call(api):
+    events = []
+    Instrumentation.add_collector(events.append)
+
+    Dataset.list_datasets()
+
+    assert len(events) == 1
+    assert events[0].method == "GET"
+    assert events[0].status_code == 200
+    assert events[0].response_bytes > 0
+    assert events[0].total_time > 0
+
+
+def test_failing_collector_does_not_affect_the_call(api, caplog):
+    def broken(event):
+        raise RuntimeError("collector bug")
+
+    Instrumentation.add_collector(broken)
+
+    with caplog.at_level(logging.ERROR):
+        assert Dataset.list_datasets()
+    assert "collector" in caplog.text
+
+
+def test_remove_collector():
+    collector = HistogramCollector()
+    Instrumentation.add_collector(collector)
+    Instrumentation.remove_collector(collector)
+
+    assert not Instrumentation.is_enabled()
+
+
+def test_histogram_collector_aggregates_per_operation():
+    histogram = HistogramCollector(buckets=(0.01, 0.1, 1.0))
+    for total_time in (0.005, 0.05, 0.05, 0.5):
+        histogram(event(total_time=total_time, response_bytes=10))
+    histogram(event(total_time=2.0, status_code=500, error="HTTPError"))
+
+    stats = histogram.snapshot()["op"]
+
+    assert stats["count"] == 5
+    assert stats["errors"] == 1
+    assert stats["response_bytes"] == 40
+    assert stats["status_codes"] == {200: 4, 500: 1}
+    assert stats["buckets"] == [(0.01, 1), (0.1, 2), (1.0, 1), (float("inf"), 1)]
+    assert stats["p50"] == 0.1
+    assert stats["p99"] == 2.0
+    assert histogram.percentile("other", 50) is None
+
+
+def test_logging_collector(caplog):
+    collector = LoggingCollector(level=logging.INFO)
+
+    with caplog.at_level(logging.INFO, logger="athina_client.api"):
+        collector(event(time_to_first_byte=0.01, retries=1))
+
+    assert "op GET /api/v1/dataset_v2/all status=200" in caplog.text
+    assert "retries=1" in caplog.text
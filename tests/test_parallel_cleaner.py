@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from athina_client.datasets import ParallelCleaner
+
+
+def page(rows, indent=None):
+    data = {
+        "dataset": {"id": "dataset-1", "name": "dataset"},
+        "dataset_rows": rows,
+        "development_eval_configs": [],
+    }
+    body = {"status": "success", "data": data}
+    return json.dumps(body, indent=indent).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def cleaner():
+    with ParallelCleaner(max_workers=3, min_bytes=0) as cleaner:
+        yield cleaner
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [{"query": f"q{i}", "response": "r" * 50} for i in range(300)],
+        [{"query": "é€𝄞" * (i % 40), "id": i} for i in range(300)],
+        # Candidate row boundaries inside strings and nested lists.
+        [{"query": '}, {"x": 1}', "tags": [{"a": i}, {"b": [i]}]} for i in range(300)],
+        # Rows larger than the text first decoded past the end of a range.
+        [{"query": "x" * 200_000, "id": i} for i in range(6)],
+        [],
+    ],
+)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_parallel_result_equals_serial_result(cleaner, rows, indent):
+    raw = page(rows, indent)
+    serial = ParallelCleaner(max_workers=1)
+
+    for response_format in ("flat", "detailed"):
+        cleaned = cleaner._clean_parallel(raw, response_format)
+        assert cleaned is not None
+        assert cleaned == serial.clean(raw, response_format)
+
+
+def test_small_pages_are_cleaned_serially():
+    cleaner = ParallelCleaner(max_workers=4)
+
+    cleaned = cleaner.clean(page([{"query": "q"}]))
+
+    assert cleaned["dataset_rows"] == [{"query": "q"}]
+    assert cleaner._executor is None
@@ -0,0 +1,118 @@
+import io
+import os
+import subprocess
+import sys
+
+from athina_client.cli.main import main
+from athina_client.datasets import Dataset
+from athina_client.instrumentation import Profiler, Profiling, enable_from_env
+from athina_client.prompt import Prompt
+
+
+def test_profiler_times_calls_and_phases(api):
+    stream = io.StringIO()
+
+    with Profiler(stream=stream) as profiler:
+        Dataset.get_dataset_by_id("dataset-1")
+        Prompt.run("slug-1", {"query": "q"})
+
+    stats = profiler.stats()
+    dataset = stats["Dataset.get_dataset_by_id"]
+    assert dataset["calls"] == 1
+    assert dataset["wait"] > 0
+    assert dataset["decode"] > 0
+    assert dataset["clean"] > 0
+    assert stats["Prompt.run"]["calls"] == 1
+    for entry in stats.values():
+        parts = sum(entry[phase] for phase in ("serialize", "wait", "send"))
+        assert parts <= entry["total"]
+    report = stream.getvalue()
+    assert "Athina SDK profile" in report
+    assert "Dataset.get_dataset_by_id" in report
+    assert not Profiling.is_enabled()
+
+
+def test_profiler_reports_cprofile_and_tracemalloc(api):
+    with Profiler(cprofile=True, tracemalloc=True, print_report=False) as profiler:
+        Dataset.get_dataset_by_id("dataset-1")
+
+    report = profiler.report()
+    assert "cProfile of SDK functions" in report
+    assert "Largest allocations by SDK code" in report
+
+
+def test_nested_profilers_restore_the_outer_one():
+    with Profiler(print_report=False) as outer:
+        with Profiler(print_report=False):
+            assert Profiling._profiler is not outer
+        assert Profiling._profiler is outer
+    assert Profiling._profiler is None
+
+
+def test_profilers_can_be_stopped_out_of_order(api):
+    first = Profiler(print_report=False).start()
+    second = Profiler(print_report=False).start()
+
+    first.stop()
+    assert Profiling._profiler is second
+    Prompt.get_default("slug-1")
+    second.stop()
+
+    assert Profiling._profiler is None
+    assert second.stats()["Prompt.get_default"]["calls"] == 1
+    assert first.stats() == {}
+
+
+def test_phases_are_no_ops_without_a_profiler():
+    assert Profiling.phase("decode") is Profiling.call("Dataset.list_datasets")
+
+
+def test_importing_the_sdk_does_not_start_a_profiler():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import athina_client.instrumentation as instrumentation\n"
+            "print(instrumentation.Profiling.is_enabled())",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "ATHINA_PROFILE": "1"},
+    )
+
+    assert result.stdout.strip() == "False"
+    assert result.stderr == ""
+
+
+def test_enable_from_env(monkeypatch):
+    registered = []
+    monkeypatch.setattr("atexit.register", registered.append)
+    monkeypatch.delenv("ATHINA_PROFILE", raising=False)
+    assert enable_from_env() is None
+
+    monkeypatch.setenv("ATHINA_PROFILE", "off")
+    assert enable_from_env() is None
+
+    monkeypatch.setenv("ATHINA_PROFILE", "cprofile")
+    profiler = enable_from_env()
+    profiler.stream = io.StringIO()
+    assert profiler.cprofile and not profiler.tracemalloc
+    assert Profiling._profiler is profiler
+    assert registered == [profiler.stop]
+    profiler.stop()
+
+
+def test_the_cli_honours_athina_profile(monkeypatch, tmp_path, capsys):
+    registered = []
+    monkeypatch.setattr("atexit.register", registered.append)
+    monkeypatch.setenv("ATHINA_PROFILE", "1")
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"query": "a"}\n')
+
+    assert main(["datasets", "validate", str(path)]) == 0
+
+    assert Profiling.is_enabled()
+    registered[0]()
+    assert "Athina SDK profile" in capsys.readouterr().err
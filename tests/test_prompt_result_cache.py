@@ -0,0 +1,87 @@
+import os
+import time
+
+from athina_client.prompt import Prompt, PromptResultCache
+
+
+def test_identical_runs_are_answered_from_the_cache(api):
+    cache = PromptResultCache()
+    first = Prompt.run("slug-1", {"query": "q"}, cache=cache)
+    requests = api.requests
+
+    second = Prompt.run("slug-1", {"query": "q"}, cache=cache)
+
+    assert second.id == first.id
+    assert api.requests == requests
+    assert cache.stats()["hits"] == 1
+
+
+def test_different_inputs_miss(api):
+    cache = PromptResultCache()
+    Prompt.run("slug-1", {"query": "q"}, cache=cache)
+
+    other_variables = Prompt.run("slug-1", {"query": "other"}, cache=cache)
+    other_version = Prompt.run("slug-1", {"query": "q"}, version=2, cache=cache)
+
+    assert other_variables.variables == {"query": "other"}
+    assert other_version.prompt_template_id == "slug-1-2"
+    assert cache.stats() == {"hits": 0, "misses": 3, "hit_rate": 0.0, "entries": 3}
+
+
+def test_default_version_is_reused_within_default_ttl(api):
+    cache = PromptResultCache(default_ttl=60)
+    cache.key("slug-1", {})
+    requests = api.requests
+
+    cache.key("slug-1", {"query": "q"})
+
+    assert api.requests == requests
+
+
+def test_results_expire_after_ttl(api, monkeypatch):
+    cache = PromptResultCache(ttl=10)
+    key = cache.key("slug-1", {"query": "q"})
+    Prompt.run("slug-1", {"query": "q"}, cache=cache)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+
+    assert cache.get(key) is None
+
+
+def test_results_survive_on_disk(api, tmp_path):
+    directory = str(tmp_path)
+    first = Prompt.run(
+        "slug-1", {"query": "q"}, cache=PromptResultCache(directory=directory)
+    )
+
+    second = Prompt.run(
+        "slug-1", {"query": "q"}, cache=PromptResultCache(directory=directory)
+    )
+
+    assert second == first
+
+
+def test_disk_limit_evicts_the_oldest_results(api, tmp_path):
+    cache = PromptResultCache(directory=str(tmp_path), max_disk_bytes=4000)
+    for i in range(20):
+        Prompt.run("slug-1", {"query": f"q{i}"}, cache=cache)
+
+    sizes = [
+        entry.stat().st_size
+        for prefix in os.scandir(tmp_path)
+        for entry in os.scandir(prefix.path)
+    ]
+    assert sum(sizes) <= 4000
+    assert 0 < len(sizes) < 20
+
+
+def test_cached_results_are_not_shared_between_callers(api):
+    cache = PromptResultCache()
+    first = Prompt.run("slug-1", {"query": "q"}, cache=cache)
+    first.variables["query"] = "mutated"
+    first.prompt_sent.clear()
+
+    second = Prompt.run("slug-1", {"query": "q"}, cache=cache)
+
+    assert second.variables == {"query": "q"}
+    assert second.prompt_sent != []
@@ -0,0 +1,161 @@
+import asyncio
+import gc
+from contextlib import contextmanager
+
+import pytest
+
+from athina_client.client import AthinaClient
+from athina_client.errors import CustomException
+from athina_client.instrumentation import Instrumentation, Profiler, Tracing
+from athina_client.prompt import Prompt
+from athina_client.services.athina_api_service import _call_state
+
+
+class NestingTracer:
+    """
+    Tracer recording when spans are entered and exited.
+    """
+
+    def __init__(self):
+        self.log = []
+
+    @contextmanager
+    def span(self, name, attributes):
+        self.log.append(("enter", name))
+        yield
+        self.log.append(("exit", name))
+
+    @contextmanager
+    def http_span(self, operation, method, endpoint, headers):
+        self.log.append(("enter", operation))
+        yield
+        self.log.append(("exit", operation))
+
+
+def test_stream_yields_deltas_and_the_execution(api):
+    stream = Prompt.stream("slug-1", {"query": "q"})
+
+    deltas = list(stream)
+
+    assert len(deltas) == 50
+    assert stream.text == " ".join(["token"] * 50)
+    assert stream.execution.prompt_response == stream.text
+
+
+def test_astream(api):
+    async def consume():
+        stream = Prompt.astream("slug-1", {"query": "q"})
+        deltas = [delta async for delta in stream]
+        return deltas, stream
+
+    deltas, stream = asyncio.run(consume())
+
+    assert len(deltas) == 50
+    assert stream.execution.total_tokens == 60
+
+
+def test_client_streams_use_the_client_configuration(mock_server):
+    client = AthinaClient(api_key="client-key", base_url=mock_server.url)
+
+    stream = client.prompts.stream("slug-1", {"query": "q"})
+    text = "".join(stream)
+
+    async def consume():
+        return "".join([delta async for delta in client.prompts.astream("slug-1", {})])
+
+    assert text == stream.execution.prompt_response
+    assert asyncio.run(consume()) == text
+    assert mock_server.requests == 2
+
+
+def test_streams_without_any_configuration_fail(mock_server):
+    with pytest.raises(CustomException):
+        list(Prompt.stream("slug-1", {"query": "q"}))
+
+
+def test_streamed_calls_are_traced_and_instrumented(api, tracer):
+    events = []
+    Instrumentation.add_collector(events.append)
+
+    list(Prompt.stream("slug-1", {"query": "q"}))
+
+    assert tracer.spans[0] == ("span", "Prompt.stream", {})
+    assert tracer.spans[1] == ("http", "stream_prompt", "POST")
+    assert len(events) == 1
+    assert events[0].operation == "stream_prompt"
+    assert events[0].response_bytes > 0
+
+
+def test_closing_an_unread_stream_reports_the_call(api):
+    events = []
+    Instrumentation.add_collector(events.append)
+    stream = Prompt.stream("slug-1", {"query": "q"})
+
+    next(stream)
+    stream.close()
+
+    assert len(events) == 1
+    assert stream.execution is None
+
+
+def test_stream_span_covers_the_iteration(api):
+    tracer = NestingTracer()
+    Tracing.set_tracer(tracer)
+    stream = Prompt.stream("slug-1", {"query": "q"})
+    assert tracer.log == []
+
+    next(stream)
+    assert tracer.log == [("enter", "Prompt.stream"), ("enter", "stream_prompt")]
+    list(stream)
+
+    assert tracer.log[2:] == [("exit", "stream_prompt"), ("exit", "Prompt.stream")]
+
+
+def test_closed_and_abandoned_streams_end_their_span(api):
+    tracer = NestingTracer()
+    Tracing.set_tracer(tracer)
+
+    with Prompt.stream("slug-1", {"query": "q"}) as stream:
+        next(stream)
+    abandoned = Prompt.stream("slug-1", {"query": "q"})
+    next(abandoned)
+    del abandoned
+    gc.collect()
+
+    assert tracer.log.count(("exit", "Prompt.stream")) == 2
+
+
+def test_stream_iteration_is_profiled_as_the_stream_call(api):
+    with Profiler(print_report=False) as profiler:
+        list(Prompt.stream("slug-1", {"query": "q"}))
+
+    stats = profiler.stats()
+    assert stats["Prompt.stream"]["calls"] == 1
+    assert "untraced" not in stats
+
+
+def test_stream_resets_the_call_state(api):
+    stream = Prompt.stream("slug-1", {"query": "q"})
+
+    next(stream)
+
+    assert _call_state.operation is None
+    assert _call_state.attempt == -1
+    stream.close()
+
+
+def test_exhausted_and_closed_async_streams_stay_stopped(api):
+    async def consume():
+        stream = Prompt.astream("slug-1", {"query": "q"})
+        deltas = [delta async for delta in stream]
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(stream.__anext__(), timeout=5)
+
+        closed = Prompt.astream("slug-1", {"query": "q"})
+        await closed.__anext__()
+        await closed.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(closed.__anext__(), timeout=5)
+        return deltas
+
+    assert len(asyncio.run(consume())) == 50
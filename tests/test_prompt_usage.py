@@ -0,0 +1,109 @@
+import re
+
+import pytest
+
+from athina_client.prompt import Prompt, PromptUsage, UsageAccumulator
+
+
+@pytest.fixture
+def usage():
+    accumulator = UsageAccumulator()
+    PromptUsage.add_accumulator(accumulator)
+    yield accumulator
+    PromptUsage.clear()
+
+
+def record(accumulator, timestamp, slug="a", customer_id=None, latency=0.3):
+    accumulator.record(
+        slug=slug,
+        model="gpt-4o",
+        customer_id=customer_id,
+        prompt_tokens=10,
+        completion_tokens=5,
+        total_tokens=15,
+        cost="0.01",
+        latency=latency,
+        timestamp=timestamp,
+    )
+
+
+def metric(text, name):
+    return sum(
+        float(value)
+        for value in re.findall(rf"^{name}{{[^}}]*}} (\S+)$", text, re.MULTILINE)
+    )
+
+
+def test_prompt_runs_are_recorded(api, usage):
+    Prompt.run("slug-1", {"query": "q"}, metadata={"customer_id": "acme"})
+    Prompt.run("slug-1", {"query": "q"})
+
+    totals = usage.query(group_by=("customer_id",))
+
+    assert totals[("acme",)]["runs"] == 1
+    assert totals[(None,)]["completion_tokens"] == 50
+    assert usage.query()[()]["total_tokens"] == 120
+
+
+def test_query_groups_and_filters_by_window():
+    usage = UsageAccumulator(window=60)
+    record(usage, 0, slug="a")
+    record(usage, 30, slug="b", latency=5.0)
+    record(usage, 90, slug="a", customer_id="acme")
+
+    by_window = usage.query(group_by=("window",))
+    assert by_window[(0,)]["runs"] == 2
+    assert by_window[(60,)]["runs"] == 1
+    assert usage.query(since=61)[()]["runs"] == 1
+    assert usage.query(until=60, slug="a")[()]["runs"] == 1
+    assert usage.query(customer_id="acme")[()]["cost"] == pytest.approx(0.01)
+    assert usage.query()[()]["p99"] == 5.0
+    with pytest.raises(ValueError):
+        usage.query(group_by=("region",))
+
+
+def test_old_windows_are_dropped():
+    usage = UsageAccumulator(window=60, max_windows=2)
+    for minute in range(5):
+        record(usage, minute * 60)
+
+    assert [record["window"] for record in usage.snapshot()] == [180, 240]
+
+
+def test_prometheus_counters_do_not_decrease_when_windows_are_dropped():
+    usage = UsageAccumulator(window=60, max_windows=2)
+    previous = None
+    for minute in range(6):
+        record(usage, minute * 60)
+        text = usage.prometheus()
+        runs = metric(text, "athina_prompt_runs_total")
+        if previous is not None:
+            assert runs >= previous
+        previous = runs
+
+    text = usage.prometheus()
+    assert runs == 6
+    assert metric(text, "athina_prompt_cost_total") == pytest.approx(0.06)
+    assert metric(text, "athina_prompt_latency_seconds_count") == 6
+    assert 'le="+Inf"} 6' in text
+    assert usage.query()[()]["runs"] == 2
+
+
+def test_prometheus_labels_are_escaped():
+    usage = UsageAccumulator()
+    record(usage, 0, slug='say "hi"\n')
+
+    text = usage.prometheus()
+
+    assert 'slug="say \\"hi\\"\\n"' in text
+    assert "# TYPE athina_prompt_runs_total counter" in text
+
+
+def test_reset_clears_the_totals():
+    usage = UsageAccumulator()
+    record(usage, 0)
+
+    usage.reset()
+
+    assert usage.query() == {}
+    assert metric(usage.prometheus(), "athina_prompt_runs_total") == 0
@@ -0,0 +1,72 @@
+import pytest
+
+from athina_client.errors import CustomException
+from athina_client.keys import AthinaApiKey
+from athina_client.prompt import PromptVersionStore
+
+
+def test_versions_are_fetched_once_and_kept_on_disk(api, tmp_path):
+    store = PromptVersionStore(directory=str(tmp_path))
+    assert store.get("slug-1", 2).version == 2
+    store.get("slug-1", 2)
+    assert api.requests == 1
+
+    api.stop()
+    reopened = PromptVersionStore(directory=str(tmp_path))
+
+    assert reopened.get("slug-1", 2).hash == "hash-slug-1-2"
+
+
+def test_prefetch_discovers_every_version(api, tmp_path):
+    store = PromptVersionStore(directory=str(tmp_path))
+
+    prompts = store.prefetch("slug-1")
+
+    assert [prompt.version for prompt in prompts] == [1, 2, 3]
+    assert [prompt.is_default for prompt in prompts] == [True, False, False]
+    requests = api.requests
+    assert [p.version for p in store.versions("slug-1")] == [1, 2, 3]
+    assert api.requests == requests
+
+
+def test_missing_versions_raise(api, tmp_path):
+    store = PromptVersionStore(directory=str(tmp_path))
+
+    with pytest.raises(CustomException):
+        store.get("slug-1", 7)
+
+
+def test_returned_prompts_do_not_share_stored_data(api, tmp_path):
+    store = PromptVersionStore(directory=str(tmp_path))
+    first = store.get("slug-1", 2)
+    first.prompt[0]["content"] = "mutated"
+    default = store.get_default("slug-1")
+    default.prompt.clear()
+
+    assert store.get("slug-1", 2).prompt[0]["content"] == "Answer {{query}}"
+    assert store.get("slug-1", 1).prompt != []
+    assert store.versions("slug-1")[1].prompt[0]["content"] == "Answer {{query}}"
+
+
+def test_versions_are_namespaced_by_api_key(api, tmp_path):
+    store = PromptVersionStore(directory=str(tmp_path))
+    store.get("slug-1", 2)
+
+    AthinaApiKey.set_key("other-key")
+
+    assert store.versions("slug-1") == []
+    store.invalidate()
+    AthinaApiKey.set_key("test-key")
+    assert [p.version for p in store.versions("slug-1")] == [2]
+
+
+def test_failed_store_keeps_the_stored_version(api, tmp_path):
+    store = PromptVersionStore(directory=str(tmp_path))
+    store.get("slug-1", 2)
+
+    with pytest.raises(TypeError):
+        store._store("slug-1", {"version": 2, "hash": "changed", "prompt": object()})
+
+    reopened = PromptVersionStore(directory=str(tmp_path))
+    assert reopened.get("slug-1", 2).hash == "hash-slug-1-2"
+    assert list(tmp_path.rglob("*.tmp")) == []
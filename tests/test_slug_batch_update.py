@@ -0,0 +1,55 @@
+from athina_client.client import AthinaClient
+from athina_client.prompt import Slug
+from athina_client.services import AthinaApiService
+
+
+def test_changes_to_a_slug_are_merged_into_one_request(api):
+    results = Slug.batch_update(
+        [
+            ("b", {"directory": "support"}),
+            ("a", {"starred": True}),
+            ("b", {"starred": False, "directory": "sales"}),
+        ]
+    )
+
+    assert api.requests == 2
+    assert [result.slug for result in results] == ["b", "a"]
+    assert results[0].fields == {"directory": "sales", "starred": False}
+    assert results[0].updated_slug["directory"] == "sales"
+    assert all(result.ok for result in results)
+
+
+def test_empty_directory_and_emoji_are_cleared(api):
+    (result,) = Slug.batch_update({"a": {"directory": "", "emoji": ""}})
+
+    assert result.fields == {"directory": None, "emoji": None}
+
+
+def test_a_failed_update_does_not_stop_the_others(api, monkeypatch):
+    update = AthinaApiService.update_prompt_template_slug
+
+    def flaky(slug, fields):
+        if slug == "broken":
+            raise RuntimeError("rejected")
+        return update(slug, fields)
+
+    monkeypatch.setattr(AthinaApiService, "update_prompt_template_slug", flaky)
+
+    results = Slug.batch_update({"a": {"starred": True}, "broken": {"starred": True}})
+
+    assert [result.ok for result in results] == [True, False]
+    assert "rejected" in results[1].error
+
+
+def test_no_updates(api):
+    assert Slug.batch_update([]) == []
+    assert api.requests == 0
+
+
+def test_runs_under_the_calling_client(mock_server):
+    client = AthinaClient(api_key="client-key", base_url=mock_server.url)
+
+    results = client.slugs.batch_update({f"s{i}": {"starred": True} for i in range(5)})
+
+    assert all(result.ok for result in results)
+    assert mock_server.requests == 5
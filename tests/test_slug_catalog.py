@@ -0,0 +1,133 @@
+import pytest
+
+from athina_client.api_base_url import AthinaApiBaseUrl
+from athina_client.keys import AthinaApiKey
+from athina_client.prompt import Slug, SlugCatalog
+from athina_client.services import AthinaApiService
+from benchmarks.mock_server import MockAthinaServer
+
+
+def slug_data(index, name=None, updated_at="2024-01-01T00:00:00.000Z", **fields):
+    return {
+        **MockAthinaServer().slug(index),
+        "name": name or f"prompt-{index}",
+        "updated_at": updated_at,
+        **fields,
+    }
+
+
+def test_lookups(api):
+    catalog = SlugCatalog()
+
+    assert len(catalog) == 5
+    assert catalog.get("prompt-3").id == "slug-3"
+    assert catalog.get_by_id("slug-2").name == "prompt-2"
+    assert "prompt-9" not in catalog
+    assert [slug.name for slug in catalog.search("prompt-")] == [
+        f"prompt-{i}" for i in range(5)
+    ]
+    assert [slug.name for slug in catalog.in_directory("directory-1")] == ["prompt-1"]
+    assert catalog.directories() == [f"directory-{i}" for i in range(5)]
+    assert [slug.name for slug in catalog.starred()] == ["prompt-0"]
+
+
+def test_ttl_limits_requests(api):
+    catalog = SlugCatalog(ttl=60)
+    catalog.get("prompt-1")
+    catalog.search("prompt")
+    assert api.requests == 1
+
+    catalog.invalidate()
+    catalog.get("prompt-1")
+
+    assert api.requests == 2
+    assert api.not_modified == 1
+
+
+def test_refresh_applies_changes_incrementally(monkeypatch):
+    responses = [
+        [slug_data(0), slug_data(1), slug_data(2)],
+        [
+            slug_data(0),
+            slug_data(1, name="renamed", updated_at="2024-02-01T00:00:00.000Z"),
+            slug_data(3),
+        ],
+    ]
+    monkeypatch.setattr(
+        AthinaApiService,
+        "get_all_prompt_slugs_if_changed",
+        lambda version: (str(len(responses)), responses.pop(0)),
+    )
+    catalog = SlugCatalog(ttl=None)
+    unchanged = catalog.get("prompt-0")
+
+    catalog.refresh(force=True)
+
+    assert catalog.get("prompt-0") is unchanged
+    assert catalog.get("prompt-1") is None
+    assert catalog.get("renamed").id == "slug-1"
+    assert catalog.get("prompt-2") is None
+    assert [slug.name for slug in catalog] == ["prompt-0", "prompt-3", "renamed"]
+    assert catalog.directories() == ["directory-0", "directory-1", "directory-3"]
+
+
+def test_errors_are_wrapped(monkeypatch):
+    def fail(version):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(AthinaApiService, "get_all_prompt_slugs_if_changed", fail)
+
+    with pytest.raises(Exception, match="Error fetching all prompt slugs"):
+        SlugCatalog().get("prompt-0")
+
+
+def test_slug_objects_are_reused_across_unchanged_refreshes(api):
+    catalog = SlugCatalog(ttl=None)
+    first = catalog.get("prompt-1")
+
+    catalog.refresh(force=True)
+
+    assert catalog.get("prompt-1") is first
+    assert isinstance(first, Slug)
+
+
+def test_swapped_names_keep_both_slugs(monkeypatch):
+    later = "2024-02-01T00:00:00.000Z"
+    responses = [
+        [slug_data(0, name="a"), slug_data(1, name="b")],
+        [
+            slug_data(0, name="b", updated_at=later),
+            slug_data(1, name="a", updated_at=later),
+        ],
+    ]
+    monkeypatch.setattr(
+        AthinaApiService,
+        "get_all_prompt_slugs_if_changed",
+        lambda version: (str(len(responses)), responses.pop(0)),
+    )
+    catalog = SlugCatalog(ttl=None)
+    catalog.refresh()
+
+    catalog.refresh(force=True)
+
+    assert catalog.get("a").id == "slug-1"
+    assert catalog.get("b").id == "slug-0"
+    assert [slug.id for slug in catalog] == ["slug-1", "slug-0"]
+
+
+@pytest.mark.parametrize("etags", [True, False])
+def test_unchanged_list_is_not_applied(etags, monkeypatch):
+    with MockAthinaServer(slugs=5, etags=etags) as server:
+        AthinaApiKey.set_key("test-key")
+        AthinaApiBaseUrl.set_url(server.url)
+        catalog = SlugCatalog(ttl=None)
+        catalog.refresh()
+
+        def fail(slugs_data):
+            raise AssertionError("an unchanged list was applied")
+
+        monkeypatch.setattr(catalog, "_apply", fail)
+        catalog.refresh(force=True)
+
+    assert len(catalog) == 5
+    assert server.not_modified == (1 if etags else 0)
@@ -0,0 +1,71 @@
+import pytest
+
+from athina_client.datasets import Dataset
+from athina_client.instrumentation import Instrumentation, Tracing, traced
+
+
+def test_traced_is_transparent_without_a_tracer():
+    @traced("double")
+    def double(value):
+        return 2 * value
+
+    assert double(21) == 42
+    assert double.__name__ == "double"
+
+
+def test_entry_points_and_http_calls_get_spans(api, tracer):
+    Dataset.list_datasets()
+
+    assert tracer.spans[0] == ("span", "Dataset.list_datasets", {})
+    assert tracer.spans[1][0] == "http"
+    assert tracer.spans[1][2] == "GET"
+
+
+def test_add_rows_spans_every_batch(api, tracer):
+    Dataset.add_rows("dataset-1", [{"query": f"q{i}"} for i in range(250)])
+
+    batches = [span[2] for span in tracer.spans if span[1] == "Dataset.add_rows.batch"]
+    assert batches == [
+        {"athina.batch.index": 0, "athina.batch.rows": 100},
+        {"athina.batch.index": 1, "athina.batch.rows": 100},
+        {"athina.batch.index": 2, "athina.batch.rows": 50},
+    ]
+
+
+def test_opentelemetry_spans_and_metrics(api):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from athina_client.instrumentation import (
+        disable_opentelemetry,
+        enable_opentelemetry,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    enable_opentelemetry(tracer_provider, MeterProvider(metric_readers=[reader]))
+
+    Dataset.list_datasets()
+    disable_opentelemetry()
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    http_span = next(span for name, span in spans.items() if name.startswith("GET"))
+    assert http_span.parent.span_id == spans["Dataset.list_datasets"].context.span_id
+    assert http_span.attributes["http.response.status_code"] == 200
+    metrics = {
+        metric.name
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert "athina.client.request.duration" in metrics
+    assert not Tracing.is_set()
+    assert not Instrumentation.is_enabled()
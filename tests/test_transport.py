@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from athina_client.api_base_url import AthinaApiBaseUrl
+from athina_client.datasets import Dataset
+from athina_client.keys import AthinaApiKey
+from athina_client.transport import (
+    AthinaTransport,
+    CassetteMissError,
+    CassetteTransport,
+    RequestsTransport,
+    TransportResponse,
+)
+
+
+def test_requests_transport(mock_server):
+    transport = RequestsTransport()
+    try:
+        response = transport.request(
+            "GET",
+            f"{mock_server.url}/api/v1/dataset_v2/all",
+            {"athina-api-key": "test-key"},
+        )
+    finally:
+        transport.close()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert len(response.json()["datasets"]) == 10
+    assert response.elapsed is not None
+
+
+def test_create_rejects_unknown_backends():
+    with pytest.raises(ValueError, match="Unknown transport"):
+        AthinaTransport.create("curl")
+
+
+def test_cassette_replays_without_network(api, tmp_path):
+    path = str(tmp_path / "cassette.jsonl")
+    AthinaTransport.set_transport(CassetteTransport(path, mode="record"))
+    recorded = Dataset.get_dataset_by_id("dataset-1")
+    api.stop()
+
+    # Replays against another base URL and API key.
+    AthinaApiKey.set_key("other-key")
+    AthinaApiBaseUrl.set_url("http://127.0.0.1:9")
+    AthinaTransport.set_transport(CassetteTransport(path, mode="replay"))
+
+    assert Dataset.get_dataset_by_id("dataset-1") == recorded
+    with pytest.raises(CassetteMissError):
+        Dataset.get_dataset_by_id("dataset-2")
+
+
+def test_cassette_does_not_store_request_headers(api, tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    AthinaTransport.set_transport(CassetteTransport(str(path), mode="record"))
+
+    Dataset.get_dataset_by_id("dataset-1")
+
+    assert "test-key" not in path.read_text()
+    entry = json.loads(path.read_text().splitlines()[0])
+    assert set(entry["headers"]) <= {"content-type", "etag", "last-modified"}
+
+
+def test_cassette_auto_mode_records_missing_requests(tmp_path):
+    class FakeTransport:
+        def __init__(self):
+            self.requests = 0
+
+        def request(self, method, url, headers, params=None, body=None):
+            self.requests += 1
+            return TransportResponse(200, {}, b'{"ok": true}')
+
+    inner = FakeTransport()
+    cassette = CassetteTransport(str(tmp_path / "c.jsonl"), transport=inner)
+
+    for _ in range(2):
+        response = cassette.request("POST", "http://a/x", {}, body=b"1")
+    cassette.request("POST", "http://b/x", {}, body=b"2")
+
+    assert response.json() == {"ok": True}
+    assert inner.requests == 2
+
+
+def test_cassette_rejects_unknown_modes(tmp_path):
+    with pytest.raises(ValueError):
+        CassetteTransport(str(tmp_path / "c.jsonl"), mode="rewind")
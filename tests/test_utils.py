@@ -0,0 +1,64 @@
+import os
+import threading
+
+import pytest
+
+from athina_client.utils import atomic_write
+
+
+def test_concurrent_atomic_writes_do_not_clobber_each_other(tmp_path):
+    path = str(tmp_path / "objects" / "manifest.json")
+    payloads = [bytes([i]) * 100_000 for i in range(8)]
+    errors = []
+
+    def write(data):
+        try:
+            for _ in range(20):
+                with atomic_write(path) as f:
+                    f.write(data)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(data,)) for data in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with open(path, "rb") as f:
+        assert f.read() in payloads
+    assert os.listdir(tmp_path / "objects") == ["manifest.json"]
+
+
+def test_failed_atomic_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path), "w") as f:
+            f.write("new")
+            raise RuntimeError("failed")
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["state.json"]
+
+
+def test_text_mode_writes_utf8(tmp_path):
+    path = tmp_path / "state.json"
+
+    with atomic_write(str(path), "w") as f:
+        f.write("é")
+
+    assert path.read_bytes() == "é".encode("utf-8")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_written_files_get_the_default_permissions(tmp_path):
+    with open(tmp_path / "plain", "w"):
+        pass
+
+    with atomic_write(str(tmp_path / "atomic")) as f:
+        f.write(b"data")
+
+    assert os.stat(tmp_path / "atomic").st_mode == os.stat(tmp_path / "plain").st_mode
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from athina_client.datasets import Dataset, DatasetSchema, validate_rows
+from athina_client.errors import DatasetValidationException
+
+
+def test_schema_inference():
+    schema = DatasetSchema.infer(
+        [
+            {"query": "a", "score": 1, "context": None},
+            {"query": "b", "score": 0.5, "tags": ["x"]},
+        ]
+    )
+
+    assert schema.columns["query"].types == {"string"}
+    assert schema.columns["query"].required
+    assert schema.columns["score"].types == {"number"}
+    assert schema.columns["context"].types == frozenset()
+    assert not schema.columns["context"].required
+    assert not schema.columns["tags"].required
+
+
+def test_valid_rows_pass():
+    report = validate_rows([{"query": f"q{i}", "score": i} for i in range(10)])
+
+    assert report.ok
+    assert report.rows_checked == 10
+    assert str(report) == "10 rows checked, no problems found"
+    report.raise_for_issues()
+
+
+def test_rows_after_the_sample_are_checked_against_it():
+    rows = [{"query": "a", "score": 1}] * 3 + [
+        {"score": "high", "extra": True},
+        [1, 2],
+        {"query": "b", "score": 2, "__id": "1"},
+    ]
+
+    report = validate_rows(rows, sample_size=3)
+
+    assert report.rows_checked == 6
+    assert report.counts == {
+        "missing_column": 1,
+        "type_mismatch": 1,
+        "unexpected_column": 1,
+        "not_an_object": 1,
+        "forbidden_key": 1,
+    }
+    assert {(issue.row, issue.code) for issue in report.issues} == {
+        (3, "missing_column"),
+        (3, "type_mismatch"),
+        (3, "unexpected_column"),
+        (4, "not_an_object"),
+        (5, "forbidden_key"),
+    }
+
+
+def test_values_that_are_not_json():
+    report = validate_rows(
+        [{"score": float("nan")}, {"score": object()}],
+        schema=DatasetSchema(columns={}),
+    )
+
+    assert report.counts["not_serializable"] == 2
+    assert report.counts["unexpected_column"] == 2
+
+
+def test_size_limits_match_the_serialized_row():
+    row = {"query": "é" * 10, "tags": ["a", "b"]}
+    size = len(json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode())
+
+    assert validate_rows([row], max_row_bytes=size).ok
+    assert validate_rows([row], max_row_bytes=size - 1).counts == {"row_too_large": 1}
+    assert validate_rows([row], max_cell_bytes=21).counts == {"cell_too_large": 1}
+    assert validate_rows([row], max_cell_bytes=None, max_row_bytes=None).ok
+
+
+def test_only_max_issues_are_kept():
+    rows = [{"query": "a"}] + [{"query": 1}] * 10
+
+    report = validate_rows(rows, sample_size=1, max_issues=3)
+
+    assert report.issue_count == 10
+    assert len(report.issues) == 3
+    assert str(report).endswith("... and 7 more")
+    with pytest.raises(DatasetValidationException) as error:
+        report.raise_for_issues()
+    assert error.value.report is report
+
+
+def test_add_rows_validates_before_sending(api, mock_server):
+    with pytest.raises(DatasetValidationException):
+        Dataset.add_rows("dataset-1", [{"score": float("nan")}], validate=True)
+
+    assert mock_server.received_rows == 0